@@ -8,10 +8,7 @@
 from typing import Any
 
 from Algorithms_Construction_and_Analysis.Chapter_10_elementary_data_structures.base_queue import Queue
-from Algorithms_Construction_and_Analysis.Chapter_10_elementary_data_structures.errors import (
-    EmptyQueueError,
-    QueueOverflowedError
-)
+from Algorithms_Construction_and_Analysis.Chapter_10_elementary_data_structures.errors import EmptyQueueError
 
 
 class Deque(Queue):
@@ -45,11 +42,12 @@ class Deque(Queue):
         else:
             self._put_index -= 1
 
+        self._length -= 1
         return self._items[self._put_index]
 
     def head_put(self, element: Any) -> None:
         if self.is_full():
-            raise QueueOverflowedError
+            self._grow()
 
         """
         Поскольку мы вставляем элемент в начало, а не конец, то отталкиваемся от текущего индекса для 
@@ -62,6 +60,7 @@ class Deque(Queue):
             self._get_index -= 1
 
         self._items[self._get_index] = element
+        self._length += 1
 
 
 if __name__ == '__main__':
@@ -73,3 +72,11 @@ if __name__ == '__main__':
     print(deque.head_get())
     print(deque.tail_get())
     print(deque.head_get())
+    print(deque.is_empty())
+
+    resizable_deque: Deque = Deque(resizable=True)
+    for number in range(6):
+        resizable_deque.tail_put(number)
+        resizable_deque.head_put(-number)
+
+    print([resizable_deque.head_get() for _ in range(len(resizable_deque))])
@@ -1,6 +1,12 @@
 """
-Базовая реализация очереди.
+Базовая реализация очереди на циклическом массиве.
 Асимптоматическая скорость всех операций O(1).
+
+По умолчанию размер очереди ограничен max_size элементами, и вставка в заполненную очередь является ошибкой
+(задача 10.1.4). Расширяемая очередь (resizable=True) при заполнении вдвое увеличивает массив и переписывает
+в него элементы по порядку, начиная с головы. Каждый элемент переписывается в среднем не более одного раза,
+поэтому учетная (амортизированная) стоимость вставки остается O(1), и очередь подходит, например,
+в качестве фронта поиска в ширину по графу произвольного размера.
 """
 
 from typing import List, Any
@@ -13,8 +19,17 @@ from Algorithms_Construction_and_Analysis.Chapter_10_elementary_data_structures.
 
 class Queue:
 
-    def __init__(self) -> None:
-        self._max_size: int = 5
+    def __init__(self, max_size: int = 5, resizable: bool = False) -> None:
+        """
+        :param max_size: Начальный размер массива очереди.
+        :param resizable: Увеличивать ли массив при заполнении вместо ошибки QueueOverflowedError.
+        """
+
+        if max_size < 1:
+            raise ValueError(f'Max size={max_size} must be positive.')
+
+        self._max_size: int = max_size
+        self._resizable: bool = resizable
         self._items: List[Any] = [0 for _ in range(self._max_size)]
         self._get_index: int = 0
         self._put_index: int = 0
@@ -34,7 +49,7 @@ class Queue:
     def put(self, element: Any) -> None:
         # Реализация задачи 10.1.4
         if self.is_full():
-            raise QueueOverflowedError
+            self._grow()
 
         self._items[self._put_index] = element
         self._length += 1
@@ -57,6 +72,22 @@ class Queue:
 
         return value
 
+    def _grow(self) -> None:
+        """
+        Вызывается для заполненной очереди: удваивает массив расширяемой очереди или сообщает о переполнении.
+        После расширения голова очереди находится в начале массива, а свободное место - в конце.
+        """
+
+        if not self._resizable:
+            raise QueueOverflowedError
+
+        self._items = (
+            self._items[self._get_index:] + self._items[:self._get_index] + [0 for _ in range(self._max_size)]
+        )
+        self._get_index = 0
+        self._put_index = self._max_size
+        self._max_size *= 2
+
     def __len__(self) -> int:
         return self._length
 
@@ -78,3 +109,11 @@ if __name__ == '__main__':
     print(queue.get())
     queue.put(7)
     # queue.put(8)
+
+    resizable_queue: Queue = Queue(resizable=True)
+    for number in range(12):
+        resizable_queue.put(number)
+        if number % 3 == 0:
+            print(resizable_queue.get())
+
+    print([resizable_queue.get() for _ in range(len(resizable_queue))])
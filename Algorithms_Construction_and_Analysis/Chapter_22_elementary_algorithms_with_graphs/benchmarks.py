@@ -0,0 +1,154 @@
+"""
+Замеры скорости элементарных алгоритмов на графах.
+
+Каждый замер оформлен отдельной функцией, которая строит тестовый граф, запускает сравниваемые варианты
+алгоритма и выводит время их работы в консоль. Запуск всех замеров:
+
+python -m Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.benchmarks
+"""
+
+
+import random
+import time
+from typing import Callable, List, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.breadth_first_search import (
+    BreadthFirstSearch,
+    GraphNode
+)
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.direction_optimizing_bfs import (
+    DirectionOptimizingBFS
+)
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.modes import (
+    BFSDirection,
+    BFSFrontierMode
+)
+
+
+def _measure(action: Callable[[], object]) -> float:
+    start: float = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def build_random_graph(vertices_count: int, degree: int, seed: int = 0) -> CSRGraph:
+    """
+    Неориентированный граф с маленьким диаметром: каждая вершина связана с degree случайными вершинами,
+    а каждое ребро хранится в обе стороны.
+    """
+
+    generator: random.Random = random.Random(seed)
+    edges: List[Tuple[int, int, int]] = []
+    for vertex in range(vertices_count):
+        for _ in range(degree):
+            neighbor: int = generator.randrange(vertices_count)
+            edges += [(vertex, neighbor, 1), (neighbor, vertex, 1)]
+
+    return CSRGraph.from_edge_list(vertices_count=vertices_count, edges=edges)
+
+
+def build_grid_graph(width: int, height: int) -> CSRGraph:
+    """
+    Неориентированная решетка - граф с большим диаметром, на котором шаг снизу вверх не выгоден.
+    """
+
+    edges: List[Tuple[int, int, int]] = []
+    for row in range(height):
+        for column in range(width):
+            vertex: int = row * width + column
+            if column + 1 < width:
+                edges += [(vertex, vertex + 1, 1), (vertex + 1, vertex, 1)]
+            if row + 1 < height:
+                edges += [(vertex, vertex + width, 1), (vertex + width, vertex, 1)]
+
+    return CSRGraph.from_edge_list(vertices_count=width * height, edges=edges)
+
+
+def benchmark_direction_optimizing_bfs(
+        vertices_count: int = 100000,
+        degree: int = 8,
+        grid_width: int = 300,
+        roots_count: int = 3
+) -> None:
+    """
+    Сравнивает поиск в ширину с выбором направления с обычным поиском сверху вниз на графе с маленьким диаметром
+    и на решетке. Для обоих графов ребра хранятся в обе стороны, поэтому обращенным графом служит сам граф.
+    """
+
+    generator: random.Random = random.Random(0)
+    for name, graph in (
+            (f'Random graph, degree {2 * degree}', build_random_graph(vertices_count=vertices_count, degree=degree)),
+            (f'Grid {grid_width}x{grid_width}', build_grid_graph(width=grid_width, height=grid_width)),
+    ):
+        roots: List[int] = [generator.randrange(graph.vertices_count) for _ in range(roots_count)]
+        print(f'{name}, {graph.vertices_count} vertices, {graph.edges_count} edges:')
+
+        top_down_time: float = _measure(
+            lambda: [BreadthFirstSearch.breadth_first_search_csr(graph=graph, root=root) for root in roots]
+        )
+        print(f'\tTop-down BFS: {1000 * top_down_time / roots_count:.3f} ms per search, '
+              f'{graph.edges_count} edges checked')
+
+        bfs: DirectionOptimizingBFS = DirectionOptimizingBFS()
+        direction_optimizing_time: float = _measure(
+            lambda: [bfs.breadth_first_search_csr(graph=graph, root=root, reversed_graph=graph) for root in roots]
+        )
+        print(f'\tDirection-optimizing BFS: {1000 * direction_optimizing_time / roots_count:.3f} ms per search')
+
+        # Статистика собирается отдельным прогоном, чтобы ее сбор не попадал в замер:
+        bfs = DirectionOptimizingBFS(collect_statistics=True)
+        checked_edges: int = 0
+        bottom_up_levels: int = 0
+        for root in roots:
+            bfs.breadth_first_search_csr(graph=graph, root=root, reversed_graph=graph)
+            checked_edges += sum(statistics.checked_edges for statistics in bfs.level_statistics)
+            bottom_up_levels += sum(
+                statistics.direction == BFSDirection.BOTTOM_UP for statistics in bfs.level_statistics
+            )
+
+        print(f'\t\t{checked_edges // roots_count} edges checked, '
+              f'{bottom_up_levels / roots_count:.1f} bottom-up levels')
+
+
+def benchmark_bfs_frontiers(vertices_count: int = 50000, degree: int = 8, repeats: int = 3) -> None:
+    """
+    Стоимость просмотра одного ребра поиском в ширину по узлам графа для каждой реализации фронта,
+    а также стоимость одной пары операций добавления и извлечения самого фронта без поиска.
+    Для сравнения приведен поиск в ширину по CSR-представлению того же графа.
+    """
+
+    graph: CSRGraph = build_random_graph(vertices_count=vertices_count, degree=degree)
+    nodes: List[GraphNode] = [GraphNode(vertex) for vertex in range(graph.vertices_count)]
+    for vertex, node in enumerate(nodes):
+        node.neighbors = [nodes[neighbor] for neighbor in graph.neighbors(vertex)]
+
+    print(f'BFS over graph nodes, {graph.vertices_count} vertices, {graph.edges_count} edges '
+          f'(best of {repeats} runs):')
+    for frontier_mode in BFSFrontierMode:
+        bfs: BreadthFirstSearch = BreadthFirstSearch(frontier_mode=frontier_mode)
+        search_time: float = min(_measure(lambda: bfs.search(root=nodes[0])) for _ in range(repeats))
+
+        frontier_time: float = 0
+        if frontier_mode != BFSFrontierMode.LEVELS:
+            def put_and_get() -> None:
+                put, get, _ = bfs._create_queue()
+                for vertex in range(graph.vertices_count):
+                    put(vertex)
+                for _ in range(graph.vertices_count):
+                    get()
+
+            frontier_time = min(_measure(put_and_get) for _ in range(repeats))
+
+        print(f'\t{frontier_mode.value}: {1e9 * search_time / graph.edges_count:.1f} ns per edge'
+              + (f', {1e9 * frontier_time / graph.vertices_count:.1f} ns per put and get' if frontier_time else ''))
+
+    csr_time: float = min(
+        _measure(lambda: BreadthFirstSearch.breadth_first_search_csr(graph=graph, root=0)) for _ in range(repeats)
+    )
+    print(f'\tCSR graph, order array as queue: {1e9 * csr_time / graph.edges_count:.1f} ns per edge')
+
+
+if __name__ == '__main__':
+    benchmark_direction_optimizing_bfs()
+    benchmark_bfs_frontiers()
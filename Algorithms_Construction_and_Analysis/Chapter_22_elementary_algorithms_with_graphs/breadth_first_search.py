@@ -4,6 +4,11 @@
 пометки каждого узла, если тот был обработан. Таким образом каждый узел обрабатывается единожды и путь до него от
 вершины будет всегда вычислен корректно.
 
+Открытые, но еще не исследованные узлы (фронт поиска) хранятся в очереди. Поиск однопоточный, поэтому
+по умолчанию используется collections.deque, а не потокобезопасная queue.Queue, которая захватывает мьютекс
+на каждую операцию. Другие реализации фронта (см. BFSFrontierMode) - два списка уровней и расширяемая очередь
+на циклическом массиве из главы 10.
+
 Граф для теста будет следующим, где символ "*" является частью ребра от вершины к вершине:
 
 4 * * * 2 * * * 5 * * * 3
@@ -16,98 +21,253 @@
 
 
 from __future__ import annotations
-from copy import deepcopy
-from typing import List, Optional, Any
-from queue import Queue
+from array import array
+from dataclasses import dataclass, field
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Any, Tuple
+from queue import Queue as ThreadSafeQueue
 
+from Algorithms_Construction_and_Analysis.Chapter_10_elementary_data_structures.base_queue import Queue
 from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.colors import GraphNodeColors
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.modes import BFSFrontierMode
 
 
 class GraphNode:
 
     def __init__(self, value: Any) -> None:
         self.value: Any = value
-        self.distance_from_root: int = 0
-        self.parent: Optional[GraphNode] = None
         self.neighbors: List[GraphNode] = []
-        self.color: GraphNodeColors = GraphNodeColors.WHITE
-
-    def clone(self) -> GraphNode:
-        return deepcopy(self)
 
     def __eq__(self, other: GraphNode) -> bool:
         return self.value == other.value
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     def __str__(self) -> str:
-        return f'Node with value={self.value} and distance from root={self.distance_from_root}'
+        return f'Node with value={self.value}'
+
+
+@dataclass
+class BreadthFirstSearchResult:
+    """
+    Состояние поиска в ширину. Узлы графа не изменяются: каждый открытый узел получает плотный идентификатор
+    в порядке открытия, а цвета, расстояния и родители хранятся в массивах, индексируемых этим идентификатором.
+    Поэтому несколько поисков по одному графу, в том числе в разных потоках, не мешают друг другу.
+    """
+
+    nodes: List[GraphNode] = field(default_factory=list)  # Открытые узлы по идентификаторам
+    # Узлы переопределяют __eq__ и __hash__ через значение, поэтому идентифицируем их по id объекта,
+    # как и CSRGraph.from_neighbors. Заодно проверка открытости узла не вызывает __hash__ интерпретатора:
+    vertex_ids: Dict[int, int] = field(default_factory=dict)
+    colors: List[GraphNodeColors] = field(default_factory=list)
+    distances: array = field(default_factory=lambda: array('l'))
+    parents: array = field(default_factory=lambda: array('l'))  # -1 для корня
+    # Искомый узел сравнивается по значению, поэтому найденный узел может быть другим объектом с тем же значением:
+    found_vertex: int = -1  # Идентификатор найденного искомого узла, -1 если он не найден
+
+    def open_node(self, node: GraphNode, parent: int) -> int:
+        """
+        Открывает узел и возвращает его идентификатор.
+        """
+
+        vertex: int = len(self.nodes)
+        self.nodes.append(node)
+        self.vertex_ids[id(node)] = vertex
+        self.colors.append(GraphNodeColors.GREY)
+        self.distances.append(0 if parent == -1 else self.distances[parent] + 1)
+        self.parents.append(parent)
+        return vertex
+
+    def distance_to(self, node: GraphNode) -> Optional[int]:
+        """
+        :return: Расстояние от корня до узла или None, если узел не был открыт.
+        """
+
+        vertex: Optional[int] = self.vertex_ids.get(id(node))
+        return None if vertex is None else self.distances[vertex]
+
+    def path_to(self, node: GraphNode) -> List[GraphNode]:
+        """
+        Путь от корня до узла по дереву поиска. Пустой список, если узел не был открыт.
+        """
+
+        return self.path_to_vertex(vertex=self.vertex_ids.get(id(node), -1))
+
+    def path_to_vertex(self, vertex: int) -> List[GraphNode]:
+        """
+        Аналог path_to по идентификатору узла. Пустой список для идентификатора -1.
+        """
+
+        path: List[GraphNode] = []
+        while vertex != -1:
+            path.append(self.nodes[vertex])
+            vertex = self.parents[vertex]
+
+        path.reverse()
+        return path
 
 
 class BreadthFirstSearch:
 
-    def __init__(self) -> None:
-        self._root: Optional[GraphNode] = None
-        self._node_to: Optional[GraphNode] = None
-        self._queue: Queue = Queue()
+    def __init__(self, frontier_mode: BFSFrontierMode = BFSFrontierMode.DEQUE) -> None:
+        """
+        :param frontier_mode: Реализация фронта поиска по узлам графа (см. BFSFrontierMode).
+        Поиск однопоточный, поэтому потокобезопасная queue.Queue оставлена только для сравнения скорости.
+        """
+
+        self._frontier_mode: BFSFrontierMode = frontier_mode
+
+    def breadth_first_search(self, graph: GraphNode, node_to: GraphNode) -> BreadthFirstSearchResult:
+        result: BreadthFirstSearchResult = self.search(root=graph, node_to=node_to)
+        self._print_path(result=result, root=graph, node_to=node_to)
+        return result
+
+    def search(self, root: GraphNode, node_to: Optional[GraphNode] = None) -> BreadthFirstSearchResult:
+        """
+        Поиск в ширину без вывода пути в консоль.
+
+        :param node_to: Искомый узел, после открытия которого поиск останавливается. None - обойти весь граф.
+        """
+
+        if self._frontier_mode == BFSFrontierMode.LEVELS:
+            return self._build_bfs_tree_by_levels(root=root, node_to=node_to)
 
-    def breadth_first_search(self, graph: GraphNode, node_to: GraphNode) -> None:
-        self._root = graph.clone()
-        self._node_to = node_to.clone()
-        self._build_bfs_tree()
-        self._print_path()
+        return self._build_bfs_tree(root=root, node_to=node_to)
 
-    def _build_bfs_tree(self) -> None:
-        # Обозначаем корень графа как открытый, но не исследованный узел:
-        self._root.color = GraphNodeColors.GREY
-        self._queue.put(self._root)
+    def _build_bfs_tree(self, root: GraphNode, node_to: Optional[GraphNode]) -> BreadthFirstSearchResult:
+        # Обозначаем корень графа как открытый, но не исследованный узел.
+        # Очередь хранит идентификаторы узлов и создается для каждого поиска:
+        result: BreadthFirstSearchResult = BreadthFirstSearchResult()
+        put, get, size = self._create_queue()
+        put(result.open_node(node=root, parent=-1))
 
         # Пока очередь не пуста - есть узлы для изучения, а если найден искомый узел, значит известен и путь до него,
         # а дальнейшее построение дерева не имеет смысла:
-        node_to_found: bool = False
-        while not self._queue.empty() and not node_to_found:
-            node: GraphNode = self._queue.get()
-            for neighbor in node.neighbors:
-                # Если узел еще не открыт, то открываем его и добавляем в очередь на исследование.
-                # Под исследованием понимается открытие его соседей, если они еще не были открыты,
+        if node_to is not None and root == node_to:
+            result.found_vertex = 0
+
+        while size() and result.found_vertex == -1:
+            vertex: int = get()
+            for neighbor in result.nodes[vertex].neighbors:
+                # Если узел еще не открыт (у него нет идентификатора), то открываем его и добавляем в очередь
+                # на исследование. Под исследованием понимается открытие его соседей, если они еще не были открыты,
                 # а также обновление дистанции от корня до узла
-                if neighbor.color == GraphNodeColors.WHITE:
-                    neighbor.color = GraphNodeColors.GREY
-                    neighbor.distance_from_root = node.distance_from_root + 1
-                    neighbor.parent = node
+                if id(neighbor) not in result.vertex_ids:
+                    neighbor_vertex: int = result.open_node(node=neighbor, parent=vertex)
 
                     # Если найден искомый узел:
-                    if neighbor == self._node_to:
-                        self._node_to = neighbor
-                        node_to_found = True
+                    if node_to is not None and neighbor == node_to:
+                        result.found_vertex = neighbor_vertex
                         break  # Прерываем цикл for
 
-                    self._queue.put(neighbor)
+                    put(neighbor_vertex)
+
+            result.colors[vertex] = GraphNodeColors.BLACK  # Помечаем узел как изученный
 
-            node.color = GraphNodeColors.BLACK  # Помечаем узел как изученный
+        return result
 
-    def _print_path(self, node_to: Optional[GraphNode] = None) -> None:
+    def _create_queue(self) -> Tuple[Callable[[int], None], Callable[[], int], Callable[[], int]]:
         """
-        Метод рекурсивно отрисовывает в консоль путь до искомого узла, если такой путь существует.
+        :return: Методы добавления, извлечения и размера очереди выбранной реализации.
+        """
+
+        if self._frontier_mode == BFSFrontierMode.DEQUE:
+            deque_queue: Deque[int] = deque()
+            return deque_queue.append, deque_queue.popleft, deque_queue.__len__
 
-        :param node_to: Узел, к которому мы хотим найти путь.
+        if self._frontier_mode == BFSFrontierMode.ARRAY_QUEUE:
+            array_queue: Queue = Queue(resizable=True)
+            return array_queue.put, array_queue.get, array_queue.__len__
+
+        if self._frontier_mode == BFSFrontierMode.THREAD_SAFE_QUEUE:
+            thread_safe_queue: ThreadSafeQueue = ThreadSafeQueue()
+            return thread_safe_queue.put, thread_safe_queue.get, thread_safe_queue.qsize
+
+        raise ValueError(f'Frontier mode {self._frontier_mode} is not a queue.')
+
+    @staticmethod
+    def _build_bfs_tree_by_levels(root: GraphNode, node_to: Optional[GraphNode]) -> BreadthFirstSearchResult:
+        """
+        Аналог _build_bfs_tree, в котором очередь заменена двумя списками: узлы текущего уровня просматриваются
+        по порядку, а открытые ими узлы дописываются в список следующего уровня. Порядок открытия узлов
+        тот же, что и с очередью.
         """
 
-        # По дефолту - начинаем с искомого узла:
-        if not node_to:
-            print(f'Way from node with value={self._root.value} to node with value={self._node_to.value}:\n')
-            node_to = self._node_to
+        result: BreadthFirstSearchResult = BreadthFirstSearchResult()
+        frontier: List[int] = [result.open_node(node=root, parent=-1)]
+        if node_to is not None and root == node_to:
+            result.found_vertex = 0
 
-        if self._root == node_to:  # Искомый узел и есть корневой
-            print(self._root)
+        while frontier and result.found_vertex == -1:
+            next_frontier: List[int] = []
+            for vertex in frontier:
+                for neighbor in result.nodes[vertex].neighbors:
+                    if id(neighbor) not in result.vertex_ids:
+                        neighbor_vertex: int = result.open_node(node=neighbor, parent=vertex)
+                        if node_to is not None and neighbor == node_to:
+                            result.found_vertex = neighbor_vertex
+                            break
 
-        # Если у искомого узла нет родителя и он не корневой, значит он не был исследован в ходе метода
+                        next_frontier.append(neighbor_vertex)
+
+                result.colors[vertex] = GraphNodeColors.BLACK
+                if result.found_vertex != -1:
+                    break
+
+            frontier = next_frontier
+
+        return result
+
+    @staticmethod
+    def breadth_first_search_csr(graph: CSRGraph, root: int) -> Tuple[array, array]:
+        """
+        Поиск в ширину непосредственно по графу в CSR-представлении.
+        Узлы графа не используются и не изменяются.
+
+        Массив order одновременно является очередью: вершины добавляются в его конец,
+        а извлекаются по индексу head, что избавляет от накладных расходов на синхронизацию queue.Queue.
+
+        :return: Массив расстояний от корня до каждой вершины (-1, если вершина недостижима)
+        и массив родителей в дереве поиска в ширину (-1 для корня и недостижимых вершин).
+        """
+
+        offsets, targets = graph.offsets, graph.targets
+        distances: array = array('l', [-1]) * graph.vertices_count
+        parents: array = array('l', [-1]) * graph.vertices_count
+        distances[root] = 0
+
+        order: array = array('l', [root])
+        head: int = 0
+        while head < len(order):
+            node: int = order[head]
+            head += 1
+            for index in range(offsets[node], offsets[node + 1]):
+                neighbor: int = targets[index]
+                if distances[neighbor] == -1:
+                    distances[neighbor] = distances[node] + 1
+                    parents[neighbor] = node
+                    order.append(neighbor)
+
+        return distances, parents
+
+    @staticmethod
+    def _print_path(result: BreadthFirstSearchResult, root: GraphNode, node_to: GraphNode) -> None:
+        """
+        Метод отрисовывает в консоль путь до искомого узла по дереву поиска, если такой путь существует.
+        """
+
+        print(f'Way from node with value={root.value} to node with value={node_to.value}:\n')
+
+        # Если искомый узел не найден, значит он не был открыт в ходе метода
         # self._build_bfs_tree, а значит не имеет отношения к данному графу
-        elif not node_to.parent:
+        path: List[GraphNode] = result.path_to_vertex(vertex=result.found_vertex)
+        if not path:
             print(f'There is no way from root to provided node')
-        else:
-            # Рекурсивно ищем путь от родителя искомого узла (он ближе к коню) к корню, чтобы соблюсти порядок шагов
-            # от корня к искомому узлу
-            self._print_path(node_to=node_to.parent)
-            print(node_to)
+
+        for node in path:
+            print(f'{node} and distance from root={result.distance_to(node=node)}')
 
 
 if __name__ == '__main__':
@@ -134,3 +294,34 @@ if __name__ == '__main__':
 
     print('\n\n')
     bfs.breadth_first_search(graph=one, node_to=six)
+
+    print('\n\n')
+    csr_graph: CSRGraph = CSRGraph.from_neighbors(roots=[one, two, three, four, five, six, seven])
+    csr_distances, csr_parents = bfs.breadth_first_search_csr(graph=csr_graph, root=csr_graph.vertex_id(four))
+    for vertex in range(csr_graph.vertices_count):
+        print(f'Node with value={csr_graph.label(vertex).value} and distance from root={csr_distances[vertex]}')
+
+    # Все реализации фронта открывают узлы в одном и том же порядке, поэтому деревья поиска совпадают:
+    for frontier_mode in BFSFrontierMode:
+        mode_result: BreadthFirstSearchResult = BreadthFirstSearch(frontier_mode=frontier_mode).search(root=four)
+        assert [node.value for node in mode_result.nodes] == [4, 1, 2, 7, 5, 6, 3]
+        for node in mode_result.nodes:
+            node_vertex: int = csr_graph.vertex_id(node)
+            parent_vertex: int = csr_parents[node_vertex]
+            assert mode_result.distance_to(node=node) == csr_distances[node_vertex]
+            assert mode_result.path_to(node=node)[:-1] == (
+                [] if parent_vertex == -1 else mode_result.path_to(node=csr_graph.label(parent_vertex))
+            )
+
+    print(f'\nAll {len(BFSFrontierMode)} frontier implementations build the same tree.')
+
+    # Искомый узел сравнивается по значению: путь находится и до равного, но другого объекта.
+    for frontier_mode in BFSFrontierMode:
+        equal_result: BreadthFirstSearchResult = BreadthFirstSearch(frontier_mode=frontier_mode).search(
+            root=four,
+            node_to=GraphNode(3)
+        )
+        assert [node.value for node in equal_result.path_to_vertex(vertex=equal_result.found_vertex)] == [4, 2, 5, 3]
+
+    print('\n')
+    bfs.breadth_first_search(graph=four, node_to=GraphNode(3))
@@ -0,0 +1,297 @@
+"""
+Сжатое строчное представление графа (Compressed Sparse Row, CSR).
+
+Вершины графа пронумерованы плотными целочисленными идентификаторами от 0 до V - 1.
+Все ребра графа хранятся в трех плоских массивах:
+1) offsets - массив длины V + 1. Ребра, исходящие из вершины v, занимают в массивах targets и weights
+   диапазон индексов [offsets[v], offsets[v + 1]);
+2) targets - массив длины E с идентификаторами вершин, в которые входят ребра;
+3) weights - массив длины E со стоимостями ребер.
+
+В отличие от представления графа объектами узлов и ребер, где каждое ребро - отдельный Python-объект
+размером в сотни байт, здесь ребро занимает 16 байт (8 байт на вершину и 8 байт на вес), а ребра одной вершины
+лежат в памяти подряд, что делает обход графа дружественным к кэшу процессора.
+
+Граф неизменяем: после построения массивы не модифицируются. В качестве массивов может использоваться любой
+объект, поддерживающий индексацию и срезы (array.array, memoryview), что позволяет строить граф поверх
+отображенных в память файлов без копирования данных.
+
+Граф для теста будет следующим (ориентированный взвешенный),
+где символ "*" является частью ребра от вершины к вершине, "←" - направление графа,
+а цифры - стоимость перемещения по ребру между узлами:
+
+0 * * 4 * * → 1 * * 1 * * → 2
+*                           ↑
+* * * 1 * * → 3 * * 2 * * * *
+
+Асимптоматическая скорость построения графа составляет O(V + E), где V - количество вершин графа,
+а E - количество ребер.
+"""
+
+
+from __future__ import annotations
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+
+class CSRGraph:
+
+    __slots__ = ('_offsets', '_targets', '_weights', '_labels', '_labels_by_identity', '_ids')
+
+    def __init__(
+            self,
+            offsets: Sequence[int],
+            targets: Sequence[int],
+            weights: Sequence[Union[int, float]],
+            labels: Optional[List[Any]] = None,
+            labels_by_identity: bool = False
+    ) -> None:
+        """
+        :param labels_by_identity: Идентифицировать ли метки в vertex_id по id объекта, а не по значению.
+        Включается для графов, построенных по объектам узлов: узлы могут переопределять __eq__ и __hash__
+        через значение, и тогда разные узлы с равными значениями - разные вершины графа.
+        """
+
+        if len(offsets) == 0 or offsets[0] != 0 or offsets[-1] != len(targets):
+            raise ValueError('Offsets must start with 0 and end with the number of edges.')
+
+        if len(targets) != len(weights):
+            raise ValueError('Targets and weights must have the same length.')
+
+        if labels is not None and len(labels) != len(offsets) - 1:
+            raise ValueError('There must be exactly one label per vertex.')
+
+        self._offsets: Sequence[int] = offsets
+        self._targets: Sequence[int] = targets
+        self._weights: Sequence[Union[int, float]] = weights
+        self._labels: Optional[List[Any]] = labels
+        self._labels_by_identity: bool = labels_by_identity
+        self._ids: Optional[Dict[Any, int]] = None  # Строится лениво при первом обращении к vertex_id
+
+    @classmethod
+    def from_edge_list(
+            cls,
+            vertices_count: int,
+            edges: Iterable[Tuple[int, int, Union[int, float]]],
+            labels: Optional[List[Any]] = None
+    ) -> CSRGraph:
+        """
+        Строит граф по списку ребер (вершина-источник, вершина-приемник, стоимость) сортировкой подсчетом
+        по вершине-источнику. Порядок ребер одной вершины сохраняется.
+        """
+
+        sources: array = array('l')
+        targets: array = array('l')
+        weights: array = array('d')
+        for node_from, node_to, cost in edges:
+            sources.append(node_from)
+            targets.append(node_to)
+            weights.append(cost)
+
+        return cls.from_edge_arrays(
+            vertices_count=vertices_count,
+            sources=sources,
+            targets=targets,
+            weights=weights,
+            labels=labels
+        )
+
+    @classmethod
+    def from_edge_arrays(
+            cls,
+            vertices_count: int,
+            sources: Sequence[int],
+            targets: Sequence[int],
+            weights: Sequence[Union[int, float]],
+            labels: Optional[List[Any]] = None
+    ) -> CSRGraph:
+        # Подсчитываем количество ребер, исходящих из каждой вершины:
+        offsets: array = array('l', bytes(8 * (vertices_count + 1)))
+        for node_from in sources:
+            if not 0 <= node_from < vertices_count:
+                raise IndexError(f'There is no vertex with id={node_from} in graph.')
+
+            offsets[node_from + 1] += 1
+
+        for node_to in targets:
+            if not 0 <= node_to < vertices_count:
+                raise IndexError(f'There is no vertex with id={node_to} in graph.')
+
+        # Префиксные суммы дают начало диапазона ребер каждой вершины:
+        for vertex in range(vertices_count):
+            offsets[vertex + 1] += offsets[vertex]
+
+        edges_count: int = len(sources)
+        sorted_targets: array = array('l', bytes(8 * edges_count))
+        sorted_weights: array = array('d', bytes(8 * edges_count))
+        positions: array = array('l', offsets[:-1])
+        for index in range(edges_count):
+            node_from: int = sources[index]
+            position: int = positions[node_from]
+            sorted_targets[position] = targets[index]
+            sorted_weights[position] = weights[index]
+            positions[node_from] = position + 1
+
+        return cls(offsets=offsets, targets=sorted_targets, weights=sorted_weights, labels=labels)
+
+    @classmethod
+    def from_nodes(cls, roots: Iterable[Any]) -> CSRGraph:
+        """
+        Строит граф по узлам, у которых ребра хранятся в атрибуте edges (узлы из главы 24).
+        Узлы, достижимые из переданных, но не переданные явно, также попадают в граф.
+        Меткой вершины является сам узел.
+        """
+
+        return cls._from_objects(
+            roots=roots,
+            get_adjacent=lambda node: [(edge.node_to, edge.cost) for edge in node.edges]
+        )
+
+    @classmethod
+    def from_neighbors(cls, roots: Iterable[Any]) -> CSRGraph:
+        """
+        Строит граф по узлам, у которых соседи хранятся в атрибуте neighbors (узлы из главы 22).
+        Стоимость каждого ребра равна 1. Меткой вершины является сам узел.
+        """
+
+        return cls._from_objects(
+            roots=roots,
+            get_adjacent=lambda node: [(neighbor, 1) for neighbor in node.neighbors]
+        )
+
+    @classmethod
+    def _from_objects(cls, roots: Iterable[Any], get_adjacent: Any) -> CSRGraph:
+        # Узлы могут переопределять __eq__, поэтому идентифицируем их по id объекта:
+        ids: Dict[int, int] = {}
+        labels: List[Any] = []
+
+        def intern(node: Any) -> int:
+            node_id: Optional[int] = ids.get(id(node))
+            if node_id is None:
+                node_id = len(labels)
+                ids[id(node)] = node_id
+                labels.append(node)
+
+            return node_id
+
+        for root in roots:
+            intern(root)
+
+        offsets: array = array('l', [0])
+        targets: array = array('l')
+        weights: array = array('d')
+
+        # Список labels растет по мере обнаружения новых достижимых узлов:
+        vertex: int = 0
+        while vertex < len(labels):
+            for node_to, cost in get_adjacent(labels[vertex]):
+                targets.append(intern(node_to))
+                weights.append(cost)
+
+            offsets.append(len(targets))
+            vertex += 1
+
+        return cls(offsets=offsets, targets=targets, weights=weights, labels=labels, labels_by_identity=True)
+
+    def reversed(self) -> CSRGraph:
+        """
+        Возвращает граф с обращенными ребрами. Необходим алгоритмам, которые обходят граф против направления ребер.
+        """
+
+        sources: array = array('l', bytes(8 * self.edges_count))
+        for vertex in range(self.vertices_count):
+            for index in range(self._offsets[vertex], self._offsets[vertex + 1]):
+                sources[index] = vertex
+
+        reversed_graph: CSRGraph = CSRGraph.from_edge_arrays(
+            vertices_count=self.vertices_count,
+            sources=self._targets,
+            targets=sources,
+            weights=self._weights,
+            labels=self._labels
+        )
+        reversed_graph._labels_by_identity = self._labels_by_identity
+        return reversed_graph
+
+    def neighbors(self, vertex: int) -> Sequence[int]:
+        return self._targets[self._offsets[vertex]:self._offsets[vertex + 1]]
+
+    def edges(self, vertex: int) -> Iterable[Tuple[int, Union[int, float]]]:
+        for index in range(self._offsets[vertex], self._offsets[vertex + 1]):
+            yield self._targets[index], self._weights[index]
+
+    def label(self, vertex: int) -> Any:
+        if self._labels is None:
+            return vertex
+
+        return self._labels[vertex]
+
+    def vertex_id(self, label: Any) -> int:
+        if self._labels is None:
+            return label
+
+        if self._ids is None:
+            if self._labels_by_identity:
+                self._ids = {id(vertex_label): vertex for vertex, vertex_label in enumerate(self._labels)}
+            else:
+                self._ids = {vertex_label: vertex for vertex, vertex_label in enumerate(self._labels)}
+
+        return self._ids[id(label) if self._labels_by_identity else label]
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        return self._offsets
+
+    @property
+    def targets(self) -> Sequence[int]:
+        return self._targets
+
+    @property
+    def weights(self) -> Sequence[Union[int, float]]:
+        return self._weights
+
+    @property
+    def labels(self) -> Optional[List[Any]]:
+        return self._labels
+
+    @property
+    def vertices_count(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def edges_count(self) -> int:
+        return len(self._targets)
+
+    def __str__(self) -> str:
+        return f'CSR graph with {self.vertices_count} vertices and {self.edges_count} edges'
+
+
+if __name__ == '__main__':
+    graph: CSRGraph = CSRGraph.from_edge_list(
+        vertices_count=4,
+        edges=[
+            (0, 1, 4),
+            (1, 2, 1),
+            (0, 3, 1),
+            (3, 2, 2),
+        ]
+    )
+
+    print(graph)
+    for graph_vertex in range(graph.vertices_count):
+        print(f'{graph_vertex}: {list(graph.edges(graph_vertex))}')
+
+    print(f'Reversed: {[list(graph.reversed().neighbors(graph_vertex)) for graph_vertex in range(4)]}')
+
+    # Узлы с равными значениями - разные вершины, и vertex_id различает их по объекту, а не по значению:
+    from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.depth_first_search import (
+        GraphNode
+    )
+
+    first_a, b, second_a = GraphNode('a'), GraphNode('b'), GraphNode('a')
+    first_a.neighbors = [b]
+    b.neighbors = [second_a]
+    nodes_graph: CSRGraph = CSRGraph.from_neighbors(roots=[first_a])
+    assert [nodes_graph.vertex_id(node) for node in (first_a, b, second_a)] == [0, 1, 2]
+    assert nodes_graph.reversed().vertex_id(second_a) == 2
+    print(f'Nodes with equal values: {[nodes_graph.vertex_id(node) for node in (first_a, b, second_a)]}')
@@ -23,27 +23,23 @@
 
 
 from __future__ import annotations
-from copy import deepcopy
-from typing import List, Optional, Set, Any
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 
 from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.colors import GraphNodeColors
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.iterative_depth_first_search import (
+    DepthFirstSearchForest,
+    IterativeDepthFirstSearch
+)
 
 
 class GraphNode:
 
     def __init__(self, value: Any) -> None:
         self.value: Any = value
-        self.distance_from_root: int = 0
-        self.parent: Optional[GraphNode] = None
         self.neighbors: List[GraphNode] = []
-        self.color: GraphNodeColors = GraphNodeColors.WHITE
-
-        # Временные метки, которые могут быть полезны при использовании алгоритма поиска в глубину:
-        self.opening_time: int = 0
-        self.explored_time: int = 0
-
-    def clone(self) -> GraphNode:
-        return deepcopy(self)
 
     def __eq__(self, other: GraphNode) -> bool:
         return self.value == other.value
@@ -52,85 +48,132 @@ class GraphNode:
         return hash(self.value)
 
     def __str__(self) -> str:
-        return (f'Node with value={self.value} and distance from root={self.distance_from_root}, '
-                f'which was opened at {self.opening_time} time and explored at {self.explored_time} time')
+        return f'Node with value={self.value}'
+
+
+@dataclass
+class DepthFirstSearchResult:
+    """
+    Результат поиска в глубину по узлам графа. Узлы графа не изменяются: поиск выполняется итеративным ядром
+    (см. IterativeDepthFirstSearch) по CSR-представлению графа, а родители и временные метки хранятся в массивах,
+    индексируемых идентификатором вершины этого представления. Поэтому несколько поисков по одному графу,
+    в том числе в разных потоках, не мешают друг другу.
+    """
+
+    graph: CSRGraph  # Метками вершин являются узлы
+    forest: DepthFirstSearchForest
+    distances: array  # Глубина узла в дереве поиска, -1 для неоткрытых узлов
+
+    # Узлы переопределяют __eq__ и __hash__ через значение, поэтому идентифицируем их по id объекта:
+    vertex_ids: Dict[int, int] = field(default_factory=dict)
+    # Искомый узел сравнивается по значению, поэтому найденный узел может быть другим объектом с тем же значением:
+    found_vertex: int = -1  # Идентификатор найденного искомого узла, -1 если он не найден
+
+    def get_vertex(self, node: GraphNode) -> int:
+        """
+        :return: Идентификатор открытого узла или -1, если узел не был открыт.
+        """
+
+        vertex: int = self.vertex_ids.get(id(node), -1)
+        return vertex if vertex != -1 and self.forest.opening_times[vertex] else -1
+
+    def get_color(self, node: GraphNode) -> GraphNodeColors:
+        vertex: int = self.get_vertex(node=node)
+        if vertex == -1:
+            return GraphNodeColors.WHITE
+
+        return GraphNodeColors.BLACK if self.forest.explored_times[vertex] else GraphNodeColors.GREY
+
+    def path_to(self, node: GraphNode) -> List[GraphNode]:
+        """
+        Путь от корня дерева поиска до узла. Пустой список, если узел не был открыт.
+        """
+
+        return self.path_to_vertex(vertex=self.get_vertex(node=node))
+
+    def path_to_vertex(self, vertex: int) -> List[GraphNode]:
+        """
+        Аналог path_to по идентификатору узла. Пустой список для идентификатора -1.
+        """
+
+        return [] if vertex == -1 else [self.graph.label(path_vertex) for path_vertex in self.forest.path_to(vertex)]
+
+    def node_to_str(self, node: GraphNode) -> str:
+        vertex: int = self.vertex_ids[id(node)]
+        return (f'{node} and distance from root={self.distances[vertex]}, '
+                f'which was opened at {self.forest.opening_times[vertex]} time '
+                f'and explored at {self.forest.explored_times[vertex]} time')
 
 
 class DepthFirstSearch:
 
-    def __init__(self) -> None:
-        self._roots: List[GraphNode] = []
-        self._node_to: Optional[GraphNode] = None
-        self._time: int = 0
-        self._node_found: bool = False
-
-    def depth_first_search(self, roots: List[GraphNode], node_to: GraphNode) -> None:
-        self._time = 0  # Сбрасываем временные метки для каждого нового поиска
-        self._roots = [root.clone() for root in roots]
-        self._node_to = node_to.clone()
-
-        # Строим деревья поиска в глубину для всех вершин графа:
-        for root in self._roots:
-            if root.color == GraphNodeColors.WHITE:
-                self._build_dfs_tree(node=root)
-
-            # Если найден искомый узел, то продолжать строить деревья поиска в глубину и
-            # дальше открывать граф нет смысла, иначе некоторые узлы могут быть обработаны повторно:
-            if self._node_found:
-                break
-
-        self._print_path()
-
-    def _build_dfs_tree(self, node: GraphNode) -> None:
-        # Отмечаем узел как открытый:
-        self._time += 1
-        node.opening_time = self._time
-        node.color = GraphNodeColors.GREY
-
-        # Рекурсивно углубляемся по ветку дерева для каждого ребра с соседним узлом для текущего,
-        # если он еще не был открыт:
-        for neighbor in node.neighbors:
-            if neighbor.color == GraphNodeColors.WHITE:
-                neighbor.distance_from_root = node.distance_from_root + 1
-                neighbor.parent = node
-                self._build_dfs_tree(node=neighbor)
-
-                # Если найден искомый узел, то продолжать строить деревья поиска в глубину и
-                # дальше открывать граф нет смысла, иначе некоторые узлы могут быть обработаны повторно:
-                if neighbor == self._node_to:
-                    self._node_to = neighbor
-                    self._node_found = True
-                    break
-
-        # Помечаем узел как изученный:
-        self._time += 1
-        node.explored_time = self._time
-        node.color = GraphNodeColors.BLACK
-
-    def _print_path(self, node_to: Optional[GraphNode] = None) -> None:
+    def depth_first_search(self, roots: List[GraphNode], node_to: GraphNode) -> DepthFirstSearchResult:
+        result: DepthFirstSearchResult = self.search(roots=roots, node_to=node_to)
+        self._print_path(result=result, node_to=node_to)
+        return result
+
+    @staticmethod
+    def search(roots: List[GraphNode], node_to: Optional[GraphNode] = None) -> DepthFirstSearchResult:
+        """
+        Поиск в глубину без вывода пути в консоль.
+
+        :param node_to: Искомый узел. Если он найден, то продолжать строить деревья поиска в глубину и
+        дальше открывать граф нет смысла: поиск останавливается сразу после исследования узла.
+        None - обойти весь граф.
+        """
+
+        graph: CSRGraph = CSRGraph.from_neighbors(roots=roots)
+        vertex_ids: Dict[int, int] = {id(node): vertex for vertex, node in enumerate(graph.labels)}
+        found_vertices: List[int] = []
+
+        def stop_at_node_to(vertex: int) -> bool:
+            if graph.label(vertex) == node_to:
+                found_vertices.append(vertex)
+                return True
+
+            return False
+
+        forest: DepthFirstSearchForest = IterativeDepthFirstSearch(
+            post_visit=None if node_to is None else stop_at_node_to
+        ).search(graph=graph, roots=[vertex_ids[id(root)] for root in roots])
+
+        return DepthFirstSearchResult(
+            graph=graph,
+            forest=forest,
+            distances=forest.get_depths(),
+            vertex_ids=vertex_ids,
+            found_vertex=found_vertices[0] if found_vertices else -1
+        )
+
+    @staticmethod
+    def depth_first_search_csr(graph: CSRGraph, roots: Optional[Sequence[int]] = None) -> Tuple[array, array, array]:
         """
-        Метод рекурсивно отрисовывает в консоль путь до искомого узла, если такой путь существует.
+        Поиск в глубину непосредственно по графу в CSR-представлении итеративным ядром
+        (см. IterativeDepthFirstSearch), поэтому глубина графа не ограничена глубиной рекурсии интерпретатора.
 
-        :param node_to: Узел, к которому мы хотим найти путь.
+        :param roots: Вершины, из которых строятся деревья поиска. По умолчанию - все вершины графа по порядку.
+        :return: Массивы временных меток открытия и исследования вершин, а также массив родителей
+        в лесу поиска в глубину (-1 для корней деревьев).
         """
 
-        # По дефолту - начинаем с искомого узла:
-        if not node_to:
-            print(f'Way to node with value={self._node_to.value}:\n')
-            node_to = self._node_to
+        forest: DepthFirstSearchForest = IterativeDepthFirstSearch().search(graph=graph, roots=roots)
+        return forest.opening_times, forest.explored_times, forest.parents
 
-        if node_to in self._roots:  # Искомый узел и есть корневой
-            print(node_to)
+    @staticmethod
+    def _print_path(result: DepthFirstSearchResult, node_to: GraphNode) -> None:
+        """
+        Метод отрисовывает в консоль путь до искомого узла по лесу поиска, если такой путь существует.
+        """
 
-        # Если у искомого узла нет родителя и он не корневой, значит он не был исследован в ходе метода
-        # self._build_dfs_tree, а значит не имеет отношения к данному графу
-        elif not node_to.parent:
+        print(f'Way to node with value={node_to.value}:\n')
+
+        # Если искомый узел не был открыт в ходе поиска, значит он не имеет отношения к данному графу
+        path: List[GraphNode] = result.path_to_vertex(vertex=result.found_vertex)
+        if not path:
             print(f'There is no way from root to provided node')
-        else:
-            # Рекурсивно ищем путь от родителя искомого узла (он ближе к коню) к корню, чтобы соблюсти порядок шагов
-            # от корня к искомому узлу
-            self._print_path(node_to=node_to.parent)
-            print(node_to)
+
+        for node in path:
+            print(result.node_to_str(node=node))
 
 
 if __name__ == '__main__':
@@ -155,3 +198,25 @@ if __name__ == '__main__':
 
     print('\n\n')
     dfs.depth_first_search(roots=[five, four], node_to=three)
+
+    print('\n\n')
+    csr_graph: CSRGraph = CSRGraph.from_neighbors(roots=[four, five, one, two, three, six])
+    csr_opening_times, csr_explored_times, _ = dfs.depth_first_search_csr(graph=csr_graph)
+    for vertex in range(csr_graph.vertices_count):
+        print(f'Node with value={csr_graph.label(vertex).value} was opened at {csr_opening_times[vertex]} time '
+              f'and explored at {csr_explored_times[vertex]} time')
+
+    # Цепочка узлов глубже предела рекурсии интерпретатора:
+    chain: List[GraphNode] = [GraphNode(value) for value in range(100000)]
+    for chain_node, next_chain_node in zip(chain, chain[1:]):
+        chain_node.neighbors = [next_chain_node]
+
+    chain_result: DepthFirstSearchResult = dfs.search(roots=[chain[0]], node_to=chain[-1])
+    print(f'\nChain of {len(chain)} nodes: path of {len(chain_result.path_to(node=chain[-1]))} nodes found.')
+
+    # Искомый узел сравнивается по значению: путь находится и до равного, но другого объекта.
+    equal_result: DepthFirstSearchResult = dfs.search(roots=[four, five], node_to=GraphNode(3))
+    assert [node.value for node in equal_result.path_to_vertex(vertex=equal_result.found_vertex)] == [4, 1, 2, 3]
+
+    print('\n')
+    dfs.depth_first_search(roots=[four, five], node_to=GraphNode(3))
@@ -0,0 +1,297 @@
+"""
+Поиск в ширину с выбором направления (direction-optimizing BFS, Beamer) для графов с маленьким диаметром
+(социальные графы, графы зависимостей), где почти все вершины открываются за несколько уровней.
+
+Обычный поиск в ширину (шаг "сверху вниз") просматривает все исходящие ребра вершин фронта. На средних уровнях
+такого графа фронт содержит большую часть вершин, и почти все просмотренные ребра ведут в уже открытые вершины.
+Шаг "снизу вверх" переворачивает проверку: каждая еще не открытая вершина просматривает свои входящие ребра
+и останавливается на первом соседе из текущего фронта - он и становится ее родителем. Когда фронт огромен,
+родитель находится после одного-двух ребер, и большая часть ребер графа не просматривается вовсе.
+
+Направление выбирается перед каждым уровнем по эвристике Бимера:
+1) Сверху вниз -> снизу вверх, если фронт растет, а количество ребер, исходящих из фронта (m_f), превышает
+   количество ребер, входящих в неоткрытые вершины (m_u), деленное на alpha. Шаг сверху вниз просмотрит m_f ребер,
+   а шаг снизу вверх - не более m_u, а на практике намного меньше. Без условия роста фронта поиск переключался бы
+   на последних уровнях графов с большим диаметром (решеток), где m_u мало, но и фронт почти пуст.
+2) Снизу вверх -> сверху вниз, если фронт сократился и в нем меньше V / beta вершин: на последних уровнях
+   проще просмотреть ребра маленького фронта, чем перебирать все неоткрытые вершины.
+
+Фронт шага сверху вниз хранится массивом вершин, а фронт шага снизу вверх - массивом байтов bytearray длины V,
+в котором проверка принадлежности вершины фронту занимает O(1). Неоткрытые вершины хранятся сжимающимся
+массивом, поэтому каждый шаг снизу вверх перебирает только еще не открытые вершины.
+
+По запросу (collect_statistics=True) для каждого уровня собирается статистика (см. BFSLevelStatistics):
+направление шага, размер фронта, m_f, m_u, количество действительно просмотренных ребер и время шага.
+По умолчанию статистика не собирается, и на графах с сотнями уровней (решетках), где поиск не переключается
+снизу вверх, каждый уровень обходится без замера времени и объекта статистики.
+
+Граф для теста - случайные ориентированные графы, расстояния в которых сверяются с обычным поиском в ширину
+(см. breadth_first_search.py), а также случайный граф с маленьким диаметром, для которого выводится статистика.
+
+Асимптоматическая скорость алгоритма в худшем случае составляет O(D * V + E), где D - количество уровней
+шагов снизу вверх, однако на графах с маленьким диаметром количество просмотренных ребер в разы меньше E.
+"""
+
+
+from __future__ import annotations
+import operator
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.modes import BFSDirection
+
+
+@dataclass
+class BFSLevelStatistics:
+    """
+    Статистика одного уровня поиска в ширину с выбором направления.
+    """
+
+    level: int  # Расстояние от корня до вершин фронта
+    direction: BFSDirection
+    frontier_size: int
+    frontier_edges: int  # m_f - количество ребер, исходящих из вершин фронта
+    unvisited_edges: int  # m_u - количество ребер, входящих в неоткрытые вершины
+    checked_edges: int  # Количество ребер, действительно просмотренных шагом
+    discovered_count: int  # Количество вершин, открытых шагом
+    seconds: float
+
+
+class DirectionOptimizingBFS:
+
+    def __init__(self, alpha: float = 14, beta: float = 24, collect_statistics: bool = False) -> None:
+        """
+        :param alpha: Шаг снизу вверх выбирается, если фронт растет и m_f > m_u / alpha.
+        Чем больше alpha, тем раньше переключение.
+        :param beta: Шаг сверху вниз возвращается, если фронт сократился и в нем меньше V / beta вершин.
+        Значения по умолчанию подобраны Бимером для графов с маленьким диаметром.
+        :param collect_statistics: Собирать ли статистику уровней (см. level_statistics).
+        """
+
+        if alpha <= 0 or beta <= 0:
+            raise ValueError(f'Alpha={alpha} and beta={beta} must be positive.')
+
+        self._alpha: float = alpha
+        self._beta: float = beta
+        self._collect_statistics: bool = collect_statistics
+
+        # Обращенный граф нужен шагу снизу вверх. Он и степени вершин запоминаются для последнего графа,
+        # поэтому повторные поиски по тому же графу их не перестраивают:
+        self._graph: Optional[CSRGraph] = None
+        self._reversed_graph: Optional[CSRGraph] = None
+        self._out_degrees: array = array('l')
+        self._in_degrees: array = array('l')
+        self._level_statistics: List[BFSLevelStatistics] = []
+
+    def breadth_first_search_csr(
+            self,
+            graph: CSRGraph,
+            root: int,
+            reversed_graph: Optional[CSRGraph] = None
+    ) -> Tuple[array, array]:
+        """
+        :param reversed_graph: Граф с обращенными ребрами. Для неориентированного графа, где каждое ребро хранится
+        в обе стороны, можно передать сам граф. По умолчанию строится при первом поиске по графу и запоминается.
+        :return: Массив расстояний от корня до каждой вершины (-1, если вершина недостижима)
+        и массив родителей в дереве поиска в ширину (-1 для корня и недостижимых вершин),
+        как у BreadthFirstSearch.breadth_first_search_csr.
+        """
+
+        if self._graph is not graph or (reversed_graph is not None and self._reversed_graph is not reversed_graph):
+            self._graph = graph
+            self._reversed_graph = graph.reversed() if reversed_graph is None else reversed_graph
+            self._out_degrees = self._get_degrees(graph=graph)
+            self._in_degrees = (
+                self._out_degrees if self._reversed_graph is graph else self._get_degrees(graph=self._reversed_graph)
+            )
+
+        reversed_graph = self._reversed_graph
+        out_degrees: array = self._out_degrees
+        in_degrees: array = self._in_degrees
+
+        vertices_count: int = graph.vertices_count
+        distances: array = array('l', [-1]) * vertices_count
+        parents: array = array('l', [-1]) * vertices_count
+        distances[root] = 0
+
+        frontier: array = array('l', [root])
+        frontier_edges: int = out_degrees[root]
+        unvisited_edges: int = graph.edges_count - in_degrees[root]
+        unvisited: Optional[array] = None  # Строится при первом шаге снизу вверх
+        direction: BFSDirection = BFSDirection.TOP_DOWN
+        previous_frontier_size: int = 0
+        self._level_statistics = []
+
+        level: int = 0
+        while frontier:
+            if (direction == BFSDirection.TOP_DOWN and len(frontier) > previous_frontier_size
+                    and frontier_edges > unvisited_edges / self._alpha):
+                direction = BFSDirection.BOTTOM_UP
+            elif (direction == BFSDirection.BOTTOM_UP and len(frontier) < previous_frontier_size
+                  and len(frontier) < vertices_count / self._beta):
+                direction = BFSDirection.TOP_DOWN
+
+            start: float = time.perf_counter() if self._collect_statistics else 0.0
+            if direction == BFSDirection.TOP_DOWN:
+                next_frontier = self._top_down_step(graph=graph, frontier=frontier, distances=distances, parents=parents)
+                checked_edges: int = frontier_edges
+            else:
+                if unvisited is None:
+                    unvisited = array('l', (vertex for vertex in range(vertices_count) if distances[vertex] == -1))
+
+                next_frontier, unvisited, checked_edges = self._bottom_up_step(
+                    reversed_graph=reversed_graph,
+                    frontier=frontier,
+                    unvisited=unvisited,
+                    distances=distances,
+                    parents=parents
+                )
+
+            if self._collect_statistics:
+                self._level_statistics.append(BFSLevelStatistics(
+                    level=level,
+                    direction=direction,
+                    frontier_size=len(frontier),
+                    frontier_edges=frontier_edges,
+                    unvisited_edges=unvisited_edges,
+                    checked_edges=checked_edges,
+                    discovered_count=len(next_frontier),
+                    seconds=time.perf_counter() - start
+                ))
+
+            # Ребра нового фронта выходят из m_u и становятся m_f следующего уровня.
+            # Суммы через map считаются без цикла интерпретатора, что заметно на графах с сотнями уровней:
+            frontier_edges = sum(map(out_degrees.__getitem__, next_frontier))
+            unvisited_edges -= sum(map(in_degrees.__getitem__, next_frontier))
+
+            previous_frontier_size = len(frontier)
+            frontier = next_frontier
+            level += 1
+
+        return distances, parents
+
+    @staticmethod
+    def _get_degrees(graph: CSRGraph) -> array:
+        return array('l', map(operator.sub, graph.offsets[1:], graph.offsets[:-1]))
+
+    @staticmethod
+    def _top_down_step(graph: CSRGraph, frontier: array, distances: array, parents: array) -> array:
+        """
+        :return: Следующий фронт. Шаг просматривает все m_f ребер фронта.
+        """
+
+        offsets, targets = graph.offsets, graph.targets
+        next_frontier: array = array('l')
+        # Все вершины фронта находятся на одном расстоянии от корня, поэтому во внутреннем цикле
+        # остаются только проверка и открытие соседа:
+        distance: int = distances[frontier[0]] + 1
+        append: Callable[[int], None] = next_frontier.append
+        for node in frontier:
+            for neighbor in targets[offsets[node]:offsets[node + 1]]:
+                if distances[neighbor] == -1:
+                    distances[neighbor] = distance
+                    parents[neighbor] = node
+                    append(neighbor)
+
+        return next_frontier
+
+    @staticmethod
+    def _bottom_up_step(
+            reversed_graph: CSRGraph,
+            frontier: array,
+            unvisited: array,
+            distances: array,
+            parents: array
+    ) -> Tuple[array, array, int]:
+        """
+        :return: Следующий фронт, оставшиеся неоткрытые вершины и количество просмотренных ребер.
+        """
+
+        offsets, sources = reversed_graph.offsets, reversed_graph.targets
+        in_frontier: bytearray = bytearray(reversed_graph.vertices_count)
+        for node in frontier:
+            in_frontier[node] = 1
+
+        distance: int = distances[frontier[0]] + 1
+        next_frontier: array = array('l')
+        still_unvisited: array = array('l')
+        checked_edges: int = 0
+        for vertex in unvisited:
+            if distances[vertex] != -1:  # Вершина открыта шагом сверху вниз после построения массива
+                continue
+
+            start, end = offsets[vertex], offsets[vertex + 1]
+            for index in range(start, end):
+                if in_frontier[sources[index]]:
+                    distances[vertex] = distance
+                    parents[vertex] = sources[index]
+                    next_frontier.append(vertex)
+                    checked_edges += index - start + 1
+                    break
+            else:
+                still_unvisited.append(vertex)
+                checked_edges += end - start
+
+        return next_frontier, still_unvisited, checked_edges
+
+    @property
+    def level_statistics(self) -> List[BFSLevelStatistics]:
+        """
+        Статистика уровней последнего поиска. Пуста, если экземпляр создан без collect_statistics.
+        """
+
+        return self._level_statistics
+
+
+if __name__ == '__main__':
+    import random
+
+    from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.breadth_first_search import (
+        BreadthFirstSearch
+    )
+
+    # Рандомизированная перекрестная проверка с обычным поиском в ширину. Маленькие alpha и beta заставляют
+    # поиск переключаться в обе стороны даже на маленьких графах:
+    generator: random.Random = random.Random(22)
+    for _ in range(300):
+        vertices: int = generator.randint(1, 40)
+        random_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=vertices,
+            edges=[(generator.randrange(vertices), generator.randrange(vertices), 1)
+                   for _ in range(generator.randint(0, 5 * vertices))]
+        )
+        bfs: DirectionOptimizingBFS = DirectionOptimizingBFS(
+            alpha=generator.choice([0.5, 2, 14]),
+            beta=generator.choice([1, 4, 24])
+        )
+        random_root: int = generator.randrange(vertices)
+        expected_distances, _ = BreadthFirstSearch.breadth_first_search_csr(graph=random_graph, root=random_root)
+        actual_distances, actual_parents = bfs.breadth_first_search_csr(graph=random_graph, root=random_root)
+        assert actual_distances == expected_distances
+        for random_vertex in range(vertices):
+            random_parent: int = actual_parents[random_vertex]
+            if random_parent != -1:
+                assert random_vertex in random_graph.neighbors(random_parent)
+                assert actual_distances[random_parent] + 1 == actual_distances[random_vertex]
+
+    print('Random graphs check passed.')
+
+    # Граф с маленьким диаметром: каждая вершина связана в обе стороны с восемью случайными вершинами.
+    social_vertices: int = 20000
+    social_edges: List[Tuple[int, int, int]] = []
+    for social_vertex in range(social_vertices):
+        for _ in range(8):
+            social_neighbor: int = generator.randrange(social_vertices)
+            social_edges += [(social_vertex, social_neighbor, 1), (social_neighbor, social_vertex, 1)]
+
+    social_graph: CSRGraph = CSRGraph.from_edge_list(vertices_count=social_vertices, edges=social_edges)
+    bfs = DirectionOptimizingBFS(collect_statistics=True)
+    bfs.breadth_first_search_csr(graph=social_graph, root=0, reversed_graph=social_graph)
+    print(f'Graph with {social_graph.vertices_count} vertices and {social_graph.edges_count} edges:')
+    for statistics in bfs.level_statistics:
+        print(f'\tLevel {statistics.level}, {statistics.direction.value}: frontier {statistics.frontier_size}, '
+              f'm_f={statistics.frontier_edges}, m_u={statistics.unvisited_edges}, '
+              f'{statistics.checked_edges} edges checked, {statistics.discovered_count} discovered')
@@ -0,0 +1,272 @@
+"""
+Итеративный поиск в глубину - общее ядро для поиска в глубину, топологической сортировки и поиска циклов.
+
+Рекурсивный поиск в глубину падает с RecursionError на графах глубже примерно 1000 вершин, поскольку каждая вершина
+ветки дерева поиска занимает кадр стека интерпретатора. Здесь рекурсия заменена явным стеком кадров
+(вершина, индекс следующего ребра) по графу в CSR-представлении: кадр - это два числа в двух списках,
+поэтому глубина поиска ограничена только памятью, и поиск проходит граф из миллиона вершин, вытянутых в цепочку.
+
+Для каждой вершины запоминаются временные метки открытия и исследования и родитель в лесу поиска, а каждое
+просмотренное ребро (u, v) классифицируется по состоянию вершины v в момент просмотра:
+1) v не открыта - ребро дерева;
+2) v открыта, но не исследована (v - предок u на стеке или сама u) - обратное ребро. Граф содержит цикл
+   тогда и только тогда, когда поиск находит хотя бы одно обратное ребро;
+3) v исследована и открыта позже u - прямое ребро в потомка;
+4) v исследована и открыта раньше u - перекрестное ребро.
+
+Алгоритмы поверх ядра подключаются обработчиками: pre_visit(v) вызывается при открытии вершины,
+post_visit(v) - при ее исследовании, edge_visit(u, v, тип ребра) - при просмотре ребра. Если обработчик
+возвращает True, поиск останавливается: вершины, оставшиеся на стеке, получают метки исследования в порядке
+снятия со стека, но post_visit для них не вызывается, поскольку их ребра просмотрены не до конца.
+
+Граф для теста - случайные ориентированные графы, типы ребер в которых сверяются с определением через вложенность
+интервалов временных меток, а также цепочка из миллиона вершин.
+
+Асимптоматическая скорость алгоритма составляет O(V + E), где V - количество вершин графа, а E - количество ребер.
+"""
+
+
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.modes import DFSEdgeType
+
+
+VertexHook = Callable[[int], Optional[bool]]
+EdgeHook = Callable[[int, int, DFSEdgeType], Optional[bool]]
+
+
+@dataclass
+class DepthFirstSearchForest:
+    """
+    Результат поиска в глубину. Все массивы индексируются идентификатором вершины.
+    """
+
+    opening_times: array  # 0, если вершина не открыта
+    explored_times: array  # 0, если вершина не исследована
+    parents: array  # -1 для корней деревьев и неоткрытых вершин
+    edge_type_counts: Dict[DFSEdgeType, int]  # Пустой словарь, если ребра не классифицировались
+    stopped: bool = False  # Был ли поиск остановлен обработчиком
+    time: int = 0  # Последняя выданная временная метка
+
+    def edge_type(self, node_from: int, node_to: int) -> DFSEdgeType:
+        """
+        Тип ребра между вершинами, открытыми поиском, по вложенности интервалов временных меток.
+        Для параллельных ребер дерева все они считаются ребрами дерева.
+        """
+
+        if self.parents[node_to] == node_from:
+            return DFSEdgeType.TREE
+
+        if self.opening_times[node_to] <= self.opening_times[node_from] <= self.explored_times[node_to]:
+            return DFSEdgeType.BACK
+
+        if self.opening_times[node_from] < self.opening_times[node_to]:
+            return DFSEdgeType.FORWARD
+
+        return DFSEdgeType.CROSS
+
+    def get_depths(self) -> array:
+        """
+        Глубина каждой вершины в дереве поиска (-1 для неоткрытых вершин). Вершины обходятся по возрастанию
+        временной метки открытия, поэтому родитель всегда обработан раньше потомка.
+        """
+
+        vertex_by_time: array = array('l', [-1]) * (self.time + 1)
+        for vertex, opening_time in enumerate(self.opening_times):
+            vertex_by_time[opening_time] = vertex
+
+        depths: array = array('l', [-1]) * len(self.opening_times)
+        for vertex in vertex_by_time[1:]:
+            if vertex != -1:
+                depths[vertex] = 0 if self.parents[vertex] == -1 else depths[self.parents[vertex]] + 1
+
+        return depths
+
+    def path_to(self, vertex: int) -> List[int]:
+        """
+        Путь от корня дерева поиска до вершины. Пустой список, если вершина не была открыта.
+        """
+
+        if not self.opening_times[vertex]:
+            return []
+
+        path: List[int] = []
+        while vertex != -1:
+            path.append(vertex)
+            vertex = self.parents[vertex]
+
+        path.reverse()
+        return path
+
+
+class IterativeDepthFirstSearch:
+
+    def __init__(
+            self,
+            pre_visit: Optional[VertexHook] = None,
+            post_visit: Optional[VertexHook] = None,
+            edge_visit: Optional[EdgeHook] = None,
+            classify_edges: bool = False
+    ) -> None:
+        """
+        :param pre_visit: Обработчик открытия вершины. Родитель вершины к этому моменту уже записан.
+        :param post_visit: Обработчик исследования вершины.
+        :param edge_visit: Обработчик просмотра ребра. Для ребра дерева вызывается до открытия вершины-приемника.
+        :param classify_edges: Подсчитывать ли ребра каждого типа. Включается автоматически, если задан edge_visit.
+        Без классификации просмотр ребра в уже открытую вершину не выполняет лишних проверок.
+        """
+
+        self._pre_visit: Optional[VertexHook] = pre_visit
+        self._post_visit: Optional[VertexHook] = post_visit
+        self._edge_visit: Optional[EdgeHook] = edge_visit
+        self._classify_edges: bool = classify_edges or edge_visit is not None
+
+    def search(self, graph: CSRGraph, roots: Optional[Sequence[int]] = None) -> DepthFirstSearchForest:
+        """
+        :param roots: Вершины, из которых строятся деревья поиска. По умолчанию - все вершины графа по порядку.
+        """
+
+        offsets, targets = graph.offsets, graph.targets
+        opening_times: array = array('l', [0]) * graph.vertices_count
+        explored_times: array = array('l', [0]) * graph.vertices_count
+        parents: array = array('l', [-1]) * graph.vertices_count
+        pre_visit, post_visit, edge_visit = self._pre_visit, self._post_visit, self._edge_visit
+        classify_edges: bool = self._classify_edges
+        tree_count, back_count, forward_count, cross_count = 0, 0, 0, 0
+        time: int = 0
+        stopped: bool = False
+
+        # Кадры стека хранятся в двух параллельных списках: вершина и индекс ее следующего ребра.
+        stack_vertices: List[int] = []
+        stack_indexes: List[int] = []
+        for root in (range(graph.vertices_count) if roots is None else roots):
+            if opening_times[root]:
+                continue
+
+            time += 1
+            opening_times[root] = time
+            stack_vertices.append(root)
+            stack_indexes.append(offsets[root])
+            stopped = pre_visit is not None and bool(pre_visit(root))
+            while stack_vertices and not stopped:
+                node: int = stack_vertices[-1]
+                index: int = stack_indexes[-1]
+                if index < offsets[node + 1]:
+                    stack_indexes[-1] = index + 1
+                    neighbor: int = targets[index]
+                    if not opening_times[neighbor]:
+                        if classify_edges:
+                            tree_count += 1
+                            if edge_visit is not None and edge_visit(node, neighbor, DFSEdgeType.TREE):
+                                stopped = True
+                                break
+
+                        time += 1
+                        opening_times[neighbor] = time
+                        parents[neighbor] = node
+                        stack_vertices.append(neighbor)
+                        stack_indexes.append(offsets[neighbor])
+                        if pre_visit is not None and pre_visit(neighbor):
+                            stopped = True
+                    elif classify_edges:
+                        if not explored_times[neighbor]:
+                            edge_type: DFSEdgeType = DFSEdgeType.BACK
+                            back_count += 1
+                        elif opening_times[node] < opening_times[neighbor]:
+                            edge_type = DFSEdgeType.FORWARD
+                            forward_count += 1
+                        else:
+                            edge_type = DFSEdgeType.CROSS
+                            cross_count += 1
+
+                        if edge_visit is not None and edge_visit(node, neighbor, edge_type):
+                            stopped = True
+                else:
+                    # Все ребра вершины просмотрены - помечаем вершину как изученную:
+                    time += 1
+                    explored_times[node] = time
+                    stack_vertices.pop()
+                    stack_indexes.pop()
+                    if post_visit is not None and post_visit(node):
+                        stopped = True
+
+            if stopped:
+                # Закрываем вершины, оставшиеся на стеке, в порядке снятия со стека:
+                while stack_vertices:
+                    time += 1
+                    explored_times[stack_vertices.pop()] = time
+
+                stack_indexes.clear()
+                break
+
+        edge_type_counts: Dict[DFSEdgeType, int] = {}
+        if classify_edges:
+            edge_type_counts = {
+                DFSEdgeType.TREE: tree_count,
+                DFSEdgeType.BACK: back_count,
+                DFSEdgeType.FORWARD: forward_count,
+                DFSEdgeType.CROSS: cross_count,
+            }
+
+        return DepthFirstSearchForest(
+            opening_times=opening_times,
+            explored_times=explored_times,
+            parents=parents,
+            edge_type_counts=edge_type_counts,
+            stopped=stopped,
+            time=time
+        )
+
+
+if __name__ == '__main__':
+    import random
+    import time as timer
+
+    # Рандомизированная проверка: тип каждого ребра, выданный при просмотре, совпадает с определением
+    # через временные метки, а интервалы меток вложены или не пересекаются.
+    generator: random.Random = random.Random(24)
+    for _ in range(300):
+        vertices: int = generator.randint(1, 30)
+        random_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=vertices,
+            edges=[(generator.randrange(vertices), generator.randrange(vertices), 1)
+                   for _ in range(generator.randint(0, 3 * vertices))]
+        )
+        visited_edges: List[Tuple[int, int, DFSEdgeType]] = []
+        forest: DepthFirstSearchForest = IterativeDepthFirstSearch(
+            edge_visit=lambda node_from, node_to, edge_type: visited_edges.append((node_from, node_to, edge_type))
+        ).search(graph=random_graph)
+
+        assert len(visited_edges) == random_graph.edges_count
+        assert sorted(forest.opening_times + forest.explored_times) == list(range(1, 2 * vertices + 1))
+        for graph_from, graph_to, visited_type in visited_edges:
+            assert visited_type == forest.edge_type(node_from=graph_from, node_to=graph_to) or (
+                visited_type == DFSEdgeType.FORWARD and forest.parents[graph_to] == graph_from  # Параллельное ребро
+            )
+
+        for first in range(vertices):
+            for second in range(vertices):
+                first_interval: Tuple[int, int] = (forest.opening_times[first], forest.explored_times[first])
+                second_interval: Tuple[int, int] = (forest.opening_times[second], forest.explored_times[second])
+                assert (first_interval[1] < second_interval[0] or second_interval[1] < first_interval[0]
+                        or first_interval[0] <= second_interval[0] <= second_interval[1] <= first_interval[1]
+                        or second_interval[0] <= first_interval[0] <= first_interval[1] <= second_interval[1])
+
+    print('Random graphs check passed.')
+
+    # Цепочка из миллиона вершин: рекурсивный поиск упал бы с RecursionError.
+    chain_length: int = 1000000
+    chain_graph: CSRGraph = CSRGraph(
+        offsets=array('l', range(chain_length)) + array('l', [chain_length - 1]),
+        targets=array('l', range(1, chain_length)),
+        weights=array('d', [1]) * (chain_length - 1)
+    )
+    start: float = timer.perf_counter()
+    chain_forest: DepthFirstSearchForest = IterativeDepthFirstSearch(classify_edges=True).search(graph=chain_graph)
+    print(f'Chain of {chain_length} vertices searched in {timer.perf_counter() - start:.3f} s, '
+          f'depth {len(chain_forest.path_to(vertex=chain_length - 1))}, '
+          f'edge types: {({edge_type.value: count for edge_type, count in chain_forest.edge_type_counts.items()})}')
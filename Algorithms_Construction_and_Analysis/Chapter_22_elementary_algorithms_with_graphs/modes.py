@@ -0,0 +1,32 @@
+from enum import Enum
+
+
+class BFSDirection(str, Enum):
+    """
+    Направления шага поиска в ширину.
+    """
+
+    TOP_DOWN = 'top_down'  # Вершины фронта просматривают исходящие ребра в поисках неоткрытых соседей
+    BOTTOM_UP = 'bottom_up'  # Неоткрытые вершины просматривают входящие ребра в поисках родителя во фронте
+
+
+class BFSFrontierMode(str, Enum):
+    """
+    Реализации фронта поиска в ширину по узлам графа.
+    """
+
+    DEQUE = 'deque'  # collections.deque: добавление и извлечение за O(1) без блокировок
+    LEVELS = 'levels'  # Два списка: текущий уровень и следующий, без очереди вовсе
+    ARRAY_QUEUE = 'array_queue'  # Расширяемая очередь на циклическом массиве из главы 10
+    THREAD_SAFE_QUEUE = 'thread_safe_queue'  # queue.Queue: мьютекс и условная переменная на каждую операцию
+
+
+class DFSEdgeType(str, Enum):
+    """
+    Типы ребер относительно леса поиска в глубину.
+    """
+
+    TREE = 'tree'  # Ребро, по которому открыта вершина
+    BACK = 'back'  # Ребро в предка (в том числе петля): вершина-приемник открыта, но не исследована
+    FORWARD = 'forward'  # Ребро в уже исследованного потомка, не являющееся ребром дерева
+    CROSS = 'cross'  # Ребро в исследованную вершину другого поддерева или другого дерева
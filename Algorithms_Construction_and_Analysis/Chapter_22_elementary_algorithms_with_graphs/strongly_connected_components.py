@@ -0,0 +1,340 @@
+"""
+Поиск компонент сильной связности алгоритмом Тарьяна и построение графа компонент (конденсации).
+
+Компонента сильной связности ориентированного графа G = (V, E) - это максимальное множество вершин, в котором
+из каждой вершины достижима любая другая. Граф компонент, в котором каждая компонента стянута в одну вершину,
+а ребра между вершинами одной компоненты отброшены, всегда ациклический. Поэтому алгоритмы для ациклических
+графов (например, поиск кратчайших путей DAGShortestPaths из главы 24) применимы к графам с циклами после
+конденсации.
+
+Алгоритм Тарьяна выполняет один поиск в глубину. Каждая вершина получает индекс - порядковый номер открытия,
+и помещается на стек компонент. Для каждой вершины вычисляется low - наименьший индекс вершины на стеке компонент,
+достижимой из поддерева вершины по ребрам дерева и не более чем одному ребру не из дерева.
+Когда вершина исследована и ее low совпадает с ее индексом, она является корнем компоненты:
+все вершины стека компонент выше нее, вместе с ней, снимаются со стека и образуют компоненту.
+
+Поиск в глубину выполняется общим итеративным ядром (см. IterativeDepthFirstSearch), к которому алгоритм Тарьяна
+подключается обработчиками открытия вершины, просмотра ребра и исследования вершины, поэтому глубина графа
+ограничена только памятью. Индексы, low и номера компонент хранятся в массивах. Граф, заданный узлами
+(атрибут neighbors), предварительно переводится в CSR-представление.
+
+Алгоритм Тарьяна находит компоненты в порядке, обратном топологическому порядку графа компонент: компонента
+завершается только после всех компонент, достижимых из нее. Номера компонент переворачиваются, поэтому
+ребра графа компонент всегда ведут от меньшего номера к большему, и номера образуют его топологический порядок.
+
+Граф для теста будет следующим (ориентированный), где символ "*" является частью ребра от вершины к вершине,
+а "←", "→", "↑", "↓" - направление ребра:
+
+
+A * * * → B * * * → C ← * * * → D
+↑       * |         |           |
+|     *   |         |           |
+|   *     |         |           |
+| ↙       ↓         ↓           ↓
+E * * * → F ← * * → G * * * * → H ↺
+
+Компоненты: {A, B, E}, {C, D}, {F, G}, {H}.
+
+Асимптоматическая скорость алгоритма составляет O(V + E), где V - количество вершин графа, а E - количество ребер.
+Граф компонент строится за то же время O(V + E).
+"""
+
+
+from array import array
+from typing import Callable, Dict, List, Set, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.depth_first_search import (
+    GraphNode
+)
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.iterative_depth_first_search import (
+    IterativeDepthFirstSearch
+)
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.modes import DFSEdgeType
+
+
+class StronglyConnectedComponents:
+
+    @staticmethod
+    def components(roots: List[GraphNode]) -> List[List[GraphNode]]:
+        """
+        Компоненты сильной связности графа, заданного узлами с атрибутом neighbors. Узлы, достижимые из переданных,
+        но не переданные явно, также распределяются по компонентам. Узлы не изменяются: граф переводится
+        в CSR-представление, как и в DepthFirstSearch.search.
+
+        :return: Компоненты в топологическом порядке графа компонент.
+        """
+
+        graph: CSRGraph = CSRGraph.from_neighbors(roots=roots)
+        components_count, component_ids = StronglyConnectedComponents.components_csr(graph=graph)
+        member_offsets, members = StronglyConnectedComponents.get_members(
+            components_count=components_count,
+            component_ids=component_ids
+        )
+
+        return [
+            [graph.label(vertex) for vertex in members[member_offsets[component]:member_offsets[component + 1]]]
+            for component in range(components_count)
+        ]
+
+    @staticmethod
+    def components_csr(graph: CSRGraph) -> Tuple[int, array]:
+        """
+        Компоненты сильной связности графа в CSR-представлении. Алгоритм Тарьяна подключается к итеративному
+        поиску в глубину обработчиками:
+        1) pre_visit - вершина получает индекс и помещается на стек компонент;
+        2) edge_visit - по ребру дерева запоминается родитель, а ребро в вершину, которая еще лежит на стеке
+           компонент, уменьшает low своего начала;
+        3) post_visit - если low вершины совпадает с ее индексом, компонента снимается со стека,
+           а low передается родителю.
+
+        :return: Количество компонент и массив номеров компонент вершин. Номера плотные (от 0 до количества
+        компонент) и образуют топологический порядок графа компонент.
+        """
+
+        indexes: array = array('l', [-1]) * graph.vertices_count
+        lows: array = array('l', bytes(8 * graph.vertices_count))
+        parents: array = array('l', [-1]) * graph.vertices_count
+        component_ids: array = array('l', [-1]) * graph.vertices_count
+        component_stack: List[int] = []
+        components_count: int = 0
+        index: int = 0
+
+        def pre_visit(vertex: int) -> None:
+            nonlocal index
+            indexes[vertex] = lows[vertex] = index
+            index += 1
+            component_stack.append(vertex)
+
+        def edge_visit(node_from: int, node_to: int, edge_type: DFSEdgeType) -> None:
+            if edge_type == DFSEdgeType.TREE:
+                parents[node_to] = node_from
+            # Вершина лежит на стеке компонент, пока открыта, но не отнесена к компоненте:
+            elif component_ids[node_to] == -1 and indexes[node_to] < lows[node_from]:
+                lows[node_from] = indexes[node_to]
+
+        def post_visit(vertex: int) -> None:
+            nonlocal components_count
+            if lows[vertex] == indexes[vertex]:
+                while True:
+                    member: int = component_stack.pop()
+                    component_ids[member] = components_count
+                    if member == vertex:
+                        break
+
+                components_count += 1
+
+            parent: int = parents[vertex]
+            if parent != -1 and lows[vertex] < lows[parent]:
+                lows[parent] = lows[vertex]
+
+        IterativeDepthFirstSearch(pre_visit=pre_visit, post_visit=post_visit, edge_visit=edge_visit).search(graph=graph)
+
+        # Тарьян завершает компоненты в обратном топологическом порядке - переворачиваем номера:
+        last_component: int = components_count - 1
+        return components_count, array('l', [last_component - component for component in component_ids])
+
+    @staticmethod
+    def get_members(components_count: int, component_ids: array) -> Tuple[array, array]:
+        """
+        Группирует вершины по компонентам сортировкой подсчетом за время O(V).
+
+        :return: Массивы offsets и vertices: вершины компоненты c лежат в vertices[offsets[c]:offsets[c + 1]]
+        по возрастанию.
+        """
+
+        offsets: array = array('l', bytes(8 * (components_count + 1)))
+        for component in component_ids:
+            offsets[component + 1] += 1
+
+        for component in range(components_count):
+            offsets[component + 1] += offsets[component]
+
+        positions: array = offsets[:-1]
+        vertices: array = array('l', bytes(8 * len(component_ids)))
+        for vertex, component in enumerate(component_ids):
+            vertices[positions[component]] = vertex
+            positions[component] += 1
+
+        return offsets, vertices
+
+    @staticmethod
+    def condensation_csr(
+            graph: CSRGraph,
+            components_count: int,
+            component_ids: array,
+            combine: Callable[[float, float], float] = min
+    ) -> CSRGraph:
+        """
+        Граф компонент за время O(V + E). Ребра внутри компонент отбрасываются, а параллельные ребра между
+        двумя компонентами сливаются в одно, вес которого - результат combine над весами слитых ребер
+        (по умолчанию минимальный вес, что сохраняет кратчайшие пути между компонентами).
+
+        Вершины перебираются сгруппированными по компонентам, поэтому исходящие ребра каждой компоненты
+        записываются подряд и сразу образуют CSR-представление. Для поиска повторного ребра в компоненту-приемник
+        хранится последняя компонента-источник, записавшая ребро в нее, и позиция этого ребра - без словарей
+        и сортировки ребер.
+
+        :param component_ids: Номера компонент в топологическом порядке (см. components_csr).
+        """
+
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        member_offsets, members = StronglyConnectedComponents.get_members(
+            components_count=components_count,
+            component_ids=component_ids
+        )
+
+        last_sources: array = array('l', [-1]) * components_count
+        positions: array = array('l', bytes(8 * components_count))
+        condensed_offsets: array = array('l', [0])
+        condensed_targets: array = array('l')
+        condensed_weights: array = array('d')
+        for component in range(components_count):
+            for vertex in members[member_offsets[component]:member_offsets[component + 1]]:
+                for index in range(offsets[vertex], offsets[vertex + 1]):
+                    target_component: int = component_ids[targets[index]]
+                    if target_component == component:
+                        continue
+
+                    if last_sources[target_component] != component:
+                        last_sources[target_component] = component
+                        positions[target_component] = len(condensed_targets)
+                        condensed_targets.append(target_component)
+                        condensed_weights.append(weights[index])
+                    else:
+                        position: int = positions[target_component]
+                        condensed_weights[position] = combine(condensed_weights[position], weights[index])
+
+            condensed_offsets.append(len(condensed_targets))
+
+        return CSRGraph(offsets=condensed_offsets, targets=condensed_targets, weights=condensed_weights)
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.topological_sort import (
+        TopologicalSort
+    )
+
+    # Create nodes:
+    a: GraphNode = GraphNode('a')
+    b: GraphNode = GraphNode('b')
+    c: GraphNode = GraphNode('c')
+    d: GraphNode = GraphNode('d')
+    e: GraphNode = GraphNode('e')
+    f: GraphNode = GraphNode('f')
+    g: GraphNode = GraphNode('g')
+    h: GraphNode = GraphNode('h')
+
+    # Create edges:
+    a.neighbors = [b]
+    b.neighbors = [c, e, f]
+    c.neighbors = [d, g]
+    d.neighbors = [c, h]
+    e.neighbors = [a, f]
+    f.neighbors = [g]
+    g.neighbors = [f, h]
+    h.neighbors = [h]
+
+    for component_nodes in StronglyConnectedComponents.components(roots=[a, b, c, d, e, f, g, h]):
+        print(f'Component: {sorted(node.value for node in component_nodes)}')
+
+    csr_graph: CSRGraph = CSRGraph.from_neighbors(roots=[a, b, c, d, e, f, g, h])
+    count, ids = StronglyConnectedComponents.components_csr(graph=csr_graph)
+    condensation: CSRGraph = StronglyConnectedComponents.condensation_csr(
+        graph=csr_graph,
+        components_count=count,
+        component_ids=ids
+    )
+    print(f'Component ids: {dict((node.value, ids[vertex]) for vertex, node in enumerate(csr_graph.labels))}')
+    print(f'Condensation edges: '
+          f'{[(component, target) for component in range(count) for target in condensation.neighbors(component)]}')
+
+    # Рандомизированная проверка: вершины лежат в одной компоненте тогда и только тогда, когда взаимно достижимы,
+    # граф компонент ациклический, его ребра ведут от меньшего номера к большему, а вес каждого ребра -
+    # минимальный вес ребер между компонентами.
+    generator: random.Random = random.Random(25)
+    for _ in range(300):
+        vertices_count: int = generator.randint(1, 25)
+        random_edges: List[Tuple[int, int, int]] = [
+            (generator.randrange(vertices_count), generator.randrange(vertices_count), generator.randint(1, 9))
+            for _ in range(generator.randint(0, 2 * vertices_count))
+        ]
+        random_graph: CSRGraph = CSRGraph.from_edge_list(vertices_count=vertices_count, edges=random_edges)
+        count, ids = StronglyConnectedComponents.components_csr(graph=random_graph)
+        assert sorted(set(ids)) == list(range(count))
+
+        reachable: List[Set[int]] = []
+        for source_vertex in range(vertices_count):
+            visited: Set[int] = {source_vertex}
+            frontier: List[int] = [source_vertex]
+            while frontier:
+                for target_vertex in random_graph.neighbors(frontier.pop()):
+                    if target_vertex not in visited:
+                        visited.add(target_vertex)
+                        frontier.append(target_vertex)
+
+            reachable.append(visited)
+
+        for first in range(vertices_count):
+            for second in range(vertices_count):
+                assert (ids[first] == ids[second]) == (second in reachable[first] and first in reachable[second])
+
+        nodes: List[GraphNode] = [GraphNode(vertex) for vertex in range(vertices_count)]
+        for vertex, node in enumerate(nodes):
+            node.neighbors = [nodes[neighbor] for neighbor in random_graph.neighbors(vertex)]
+
+        node_components: List[List[GraphNode]] = StronglyConnectedComponents.components(roots=nodes)
+        assert len(node_components) == count
+        assert sorted(sorted(node.value for node in component_nodes) for component_nodes in node_components) == \
+            sorted(sorted(vertex for vertex in range(vertices_count) if ids[vertex] == component)
+                   for component in range(count))
+
+        condensation = StronglyConnectedComponents.condensation_csr(
+            graph=random_graph,
+            components_count=count,
+            component_ids=ids
+        )
+        assert len(TopologicalSort.kahn_sort_csr(graph=condensation)) == count
+        expected_edges: Dict[Tuple[int, int], float] = {}
+        for node_from, node_to, cost in random_edges:
+            if ids[node_from] != ids[node_to]:
+                key: Tuple[int, int] = (ids[node_from], ids[node_to])
+                expected_edges[key] = min(cost, expected_edges.get(key, cost))
+
+        condensed_edges: Dict[Tuple[int, int], float] = {
+            (component, target): weight
+            for component in range(count)
+            for target, weight in condensation.edges(component)
+        }
+        assert len(condensed_edges) == condensation.edges_count
+        assert condensed_edges == expected_edges
+        assert all(component < target for component, target in condensed_edges)
+
+    print('Random graphs check passed.')
+
+    # Миллион вершин: цепочка циклов из двух вершин, соединенных ребром вперед. Рекурсивный поиск упал бы
+    # с RecursionError, поскольку дерево поиска вытягивается в одну ветку.
+    pairs_count: int = 500000
+    pairs_edges: List[Tuple[int, int, int]] = []
+    for pair in range(pairs_count):
+        pairs_edges += [(2 * pair, 2 * pair + 1, 1), (2 * pair + 1, 2 * pair, 1)]
+        if pair + 1 < pairs_count:
+            pairs_edges.append((2 * pair + 1, 2 * pair + 2, 1))
+
+    pairs_graph: CSRGraph = CSRGraph.from_edge_list(vertices_count=2 * pairs_count, edges=pairs_edges)
+    start: float = time.perf_counter()
+    count, ids = StronglyConnectedComponents.components_csr(graph=pairs_graph)
+    components_time: float = time.perf_counter() - start
+    start = time.perf_counter()
+    condensation = StronglyConnectedComponents.condensation_csr(
+        graph=pairs_graph,
+        components_count=count,
+        component_ids=ids
+    )
+    condensation_time: float = time.perf_counter() - start
+    assert count == pairs_count and condensation.edges_count == pairs_count - 1
+    print(f'{pairs_graph.vertices_count} vertices, {pairs_graph.edges_count} edges: {count} components found '
+          f'in {components_time:.3f} s, condensation built in {condensation_time:.3f} s.')
@@ -22,18 +22,26 @@ trousers * * * * * * * → shoes
            ↘   ↓
             blazer
 
+Поиск в глубину выполняется итеративным ядром (см. iterative_depth_first_search.py), поэтому сортировка не ограничена
+глубиной рекурсии интерпретатора. Ядро классифицирует ребра, и цикл в графе обнаруживается по обратному ребру:
+sort_csr в этом случае сообщает об ошибке, а find_cycle_csr возвращает вершины найденного цикла.
+
 Асимптоматическая скорость алгоритма составляет O(V + E), где V - количество вершин графа, а E - количество ребер,
-поскольку именно такая сложность у поиска в глубину, а вставка узла в начало массива имеет асимптоматическую скорость
-O(1).
+поскольку именно такая сложность у поиска в глубину, а узлы дописываются в конец списка при исследовании
+и переворачиваются один раз за O(V).
 """
 
 
-from typing import List, Any
+from array import array
+from typing import Dict, List, Optional, Any, Tuple
 
-from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.colors import GraphNodeColors
-from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.depth_first_search import (
-    GraphNode
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.depth_first_search import GraphNode
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.iterative_depth_first_search import (
+    DepthFirstSearchForest,
+    IterativeDepthFirstSearch
 )
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.modes import DFSEdgeType
 
 
 class TopologicalGraphNode(GraphNode):
@@ -42,58 +50,127 @@ class TopologicalGraphNode(GraphNode):
         super().__init__(value=value)
         self.neighbors: List[TopologicalGraphNode] = []
 
-    def __str__(self) -> str:
-        return f'{self.value} opened at {self.opening_time} and explored at {self.explored_time}'
-
 
 class TopologicalSort:
 
     def __init__(self) -> None:
         self._sorted_nodes: List[TopologicalGraphNode] = []
-        self._roots: List[TopologicalGraphNode] = []
-        self._time: int = 0
+        self._graph: Optional[CSRGraph] = None
+        self._forest: Optional[DepthFirstSearchForest] = None
+        self._vertex_ids: Dict[int, int] = {}  # id(узла) -> идентификатор вершины, как в CSRGraph.from_neighbors
 
     def sort(self, roots: List[TopologicalGraphNode]) -> None:
-        self._time = 0  # Сбрасываем временные метки для каждого нового поиска
-        self._roots = roots  # Не клонируем узлы, иначе один узел будет обработан несколько раз
-
-        self._depth_first_search()
-
-    def _depth_first_search(self) -> None:
-        # Строим деревья поиска в глубину для всех вершин графа:
-        for root in self._roots:
-            if root.color == GraphNodeColors.WHITE:
-                self._build_dfs_tree(node=root)
-
-    def _build_dfs_tree(self, node: TopologicalGraphNode) -> None:
-        # Отмечаем узел как открытый:
-        self._time += 1
-        node.opening_time = self._time
-        node.color = GraphNodeColors.GREY
-
-        # Рекурсивно углубляемся по ветку дерева для каждого ребра с соседним узлом для текущего,
-        # если он еще не был открыт:
-        for neighbor in node.neighbors:
-            if neighbor.color == GraphNodeColors.WHITE:
-                neighbor.distance_from_root = node.distance_from_root + 1
-                neighbor.parent = node
-                self._build_dfs_tree(node=neighbor)
-
-        # Помечаем узел как изученный:
-        self._time += 1
-        node.explored_time = self._time
-        node.color = GraphNodeColors.BLACK
-        self._sorted_nodes.insert(0, node)
+        """
+        Сортирует узлы, достижимые из переданных. Узлы не изменяются: поиск в глубину выполняется итеративным ядром
+        по CSR-представлению графа, поэтому сортировка не ограничена глубиной рекурсии и может повторяться.
+        """
 
-    def print_path(self) -> None:
+        self._graph = CSRGraph.from_neighbors(roots=roots)
+        self._vertex_ids = {id(node): vertex for vertex, node in enumerate(self._graph.labels)}
+
+        # Узел добавляется в порядок, когда он исследован, поэтому обращенный порядок исследования
+        # упорядочивает узлы по убыванию временной метки исследования:
+        explored_vertices: List[int] = []
+        self._forest = IterativeDepthFirstSearch(post_visit=explored_vertices.append).search(
+            graph=self._graph,
+            roots=[self._vertex_ids[id(root)] for root in roots]
+        )
+        self._sorted_nodes = [self._graph.label(vertex) for vertex in reversed(explored_vertices)]
+
+    @staticmethod
+    def sort_csr(graph: CSRGraph) -> array:
+        """
+        Топологическая сортировка графа в CSR-представлении.
+        Вершины упорядочиваются по убыванию временной метки исследования, полученной поиском в глубину:
+        это обращенный порядок, в котором итеративное ядро исследует вершины.
+
+        :raises ValueError: Если поиск нашел обратное ребро, то есть граф содержит цикл.
+        """
+
+        explored_vertices: array = array('l')
+        forest: DepthFirstSearchForest = IterativeDepthFirstSearch(
+            post_visit=explored_vertices.append,
+            classify_edges=True
+        ).search(graph=graph)
+
+        if forest.edge_type_counts[DFSEdgeType.BACK]:
+            raise ValueError('Graph contains a cycle, so it can not be sorted topologically.')
+
+        explored_vertices.reverse()
+        return explored_vertices
+
+    @staticmethod
+    def find_cycle_csr(graph: CSRGraph) -> List[int]:
+        """
+        Поиск цикла первым обратным ребром (u, v), найденным поиском в глубину: v - предок u в дереве поиска,
+        поэтому путь по дереву от v до u вместе с ребром (u, v) образует цикл.
+
+        :return: Вершины цикла по порядку (последняя соединена ребром с первой) или пустой список,
+        если граф ациклический.
         """
-        Метод рекурсивно отрисовывает в консоль путь до искомого узла, если такой путь существует.
 
-        :param node_to: Узел, к которому мы хотим найти путь.
+        back_edges: List[Tuple[int, int]] = []
+
+        def stop_on_back_edge(node_from: int, node_to: int, edge_type: DFSEdgeType) -> bool:
+            if edge_type == DFSEdgeType.BACK:
+                back_edges.append((node_from, node_to))
+                return True
+
+            return False
+
+        forest: DepthFirstSearchForest = IterativeDepthFirstSearch(edge_visit=stop_on_back_edge).search(graph=graph)
+        if not back_edges:
+            return []
+
+        node_from, node_to = back_edges[0]
+        cycle: List[int] = [node_from]
+        while cycle[-1] != node_to:
+            cycle.append(forest.parents[cycle[-1]])
+
+        cycle.reverse()
+        return cycle
+
+    @staticmethod
+    def kahn_sort_csr(graph: CSRGraph) -> array:
+        """
+        Топологическая сортировка графа в CSR-представлении алгоритмом Кана без поиска в глубину и рекурсии.
+        1) Подсчитывается количество входящих ребер каждой вершины.
+        2) Вершины без входящих ребер помещаются в очередь.
+        3) Вершина извлекается из очереди и добавляется в порядок, а ее исходящие ребра "удаляются" уменьшением
+           счетчиков входящих ребер соседей. Соседи, у которых не осталось входящих ребер, помещаются в очередь.
+        Роль очереди выполняет сам массив порядка: вершины дописываются в его конец и читаются по индексу.
+        Если в порядок попали не все вершины, оставшиеся вершины лежат на циклах, и граф не ациклический.
+        """
+
+        offsets, targets = graph.offsets, graph.targets
+        in_degrees: array = array('l', bytes(8 * graph.vertices_count))
+        for node_to in targets:
+            in_degrees[node_to] += 1
+
+        sorted_vertices: array = array('l', (vertex for vertex in range(graph.vertices_count) if not in_degrees[vertex]))
+        head: int = 0
+        while head < len(sorted_vertices):
+            node_from: int = sorted_vertices[head]
+            head += 1
+            for index in range(offsets[node_from], offsets[node_from + 1]):
+                in_degrees[targets[index]] -= 1
+                if not in_degrees[targets[index]]:
+                    sorted_vertices.append(targets[index])
+
+        if len(sorted_vertices) != graph.vertices_count:
+            raise ValueError('Graph contains a cycle, so it can not be sorted topologically.')
+
+        return sorted_vertices
+
+    def print_path(self) -> None:
+        """
+        Метод отрисовывает в консоль отсортированные узлы вместе с временными метками поиска в глубину.
         """
 
         for node in self._sorted_nodes:
-            print(node)
+            vertex: int = self._vertex_ids[id(node)]
+            print(f'{node.value} opened at {self._forest.opening_times[vertex]} '
+                  f'and explored at {self._forest.explored_times[vertex]}')
 
     @property
     def sorted_nodes(self) -> List[TopologicalGraphNode]:
@@ -124,3 +201,29 @@ if __name__ == '__main__':
     # topological_sort.sort(roots=[shirt, watch, underpants, socks])
     topological_sort.sort(roots=[watch, socks, underpants, shirt])
     topological_sort.print_path()
+
+    print('\n')
+    csr_graph: CSRGraph = CSRGraph.from_neighbors(roots=[watch, socks, underpants, shirt])
+    print([csr_graph.label(vertex).value for vertex in topological_sort.sort_csr(graph=csr_graph)])
+    print([csr_graph.label(vertex).value for vertex in topological_sort.kahn_sort_csr(graph=csr_graph)])
+    print(topological_sort.find_cycle_csr(graph=csr_graph))
+
+    # Пиджак поверх рубашки создает цикл рубашка -> галстук -> пиджак -> рубашка:
+    blazer.neighbors = [shirt]
+    cyclic_graph: CSRGraph = CSRGraph.from_neighbors(roots=[watch, socks, underpants, shirt])
+    print([cyclic_graph.label(vertex).value for vertex in topological_sort.find_cycle_csr(graph=cyclic_graph)])
+    try:
+        topological_sort.sort_csr(graph=cyclic_graph)
+    except ValueError as error:
+        print(error)
+
+    # Цепочка из миллиона вершин, перечисленных в обратном порядке, глубже предела рекурсии интерпретатора:
+    chain_length: int = 1000000
+    chain_graph: CSRGraph = CSRGraph(
+        offsets=array('l', [0]) + array('l', range(chain_length)),
+        targets=array('l', range(chain_length - 1)),
+        weights=array('d', [1]) * (chain_length - 1)
+    )
+    chain_order: array = topological_sort.sort_csr(graph=chain_graph)
+    assert list(chain_order) == list(range(chain_length - 1, -1, -1))
+    print(f'Chain of {chain_length} vertices sorted.')
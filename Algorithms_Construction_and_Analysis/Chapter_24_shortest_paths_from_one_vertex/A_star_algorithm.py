@@ -0,0 +1,193 @@
+"""
+Алгоритм A* решает задачу поиска кратчайшего пути между двумя вершинами во взвешенном ориентированном графе
+с неотрицательными весами ребер.
+
+Алгоритм повторяет алгоритм Дейкстры, но приоритетом вершины в очереди является не оценка кратчайшего пути
+до нее g(v), а сумма g(v) + h(v, t), где h - эвристика, оценивающая оставшуюся стоимость пути до целевой вершины t
+(см. heuristics.py). Благодаря эвристике в первую очередь обрабатываются вершины, лежащие "в направлении" целевой
+вершины, а поиск останавливается, как только целевая вершина извлечена из очереди.
+С нулевой эвристикой A* обрабатывает те же вершины, что и алгоритм Дейкстры. Чем точнее допустимая эвристика,
+тем меньше вершин обрабатывается: для дорожных графов с координатами вершин или ориентирами (ALT)
+количество обработанных вершин сокращается на порядки.
+
+Граф для теста будет следующим (ориентированный взвешенный, с координатами вершин),
+где символ "*" является частью ребра от вершины к вершине, "←" - направление графа,
+а цифры - стоимость перемещения по ребру между узлами:
+
+(0, 1) T * * * 2 * * * → X (1, 1)
+       ↑               ↗  ↑
+       1            3     1
+       *        *         *
+(0, 0) S * * * 1 * * * → Y (1, 0)
+
+Метод process_csr_graph выполняет тот же поиск по графу в CSR-представлении, вызывая эвристику для меток вершин.
+Без целевой вершины эвристика не применяется, и поиск находит кратчайшие пути до всех вершин, как алгоритм Дейкстры,
+поэтому A* можно передать туда, где ожидается алгоритм поиска из одной вершины (ShortestPathsCache,
+BatchShortestPaths).
+
+Асимптоматическая скорость алгоритма в худшем случае совпадает со скоростью алгоритма Дейкстры
+и составляет O((V + E) log(V)), где V - количество вершин графа, а E - количество ребер.
+"""
+
+
+from typing import Any, List, Optional, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsFromOneVertexBaseAlgorithm,
+    ShortestPathsResult
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.heuristics import (
+    Heuristic,
+    LandmarksHeuristic,
+    euclidean_heuristic,
+    manhattan_heuristic,
+    zero_heuristic
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.indexed_min_heap import IndexedMinHeap
+
+
+class AStarGraphNode(GraphNode):
+
+    def __init__(self, value: Any, x: float = 0, y: float = 0) -> None:
+        super().__init__(value=value)
+
+        # Координаты вершины, используемые геометрическими эвристиками:
+        self.x: float = x
+        self.y: float = y
+
+
+class AStarAlgorithm(ShortestPathsFromOneVertexBaseAlgorithm):
+
+    def __init__(self, heuristic: Heuristic = zero_heuristic, track_parents: bool = True) -> None:
+        super().__init__(track_parents=track_parents)
+        self._heuristic: Heuristic = heuristic
+        self._target_node: Optional[GraphNode] = None
+        self._settled_count: int = 0
+
+    def process_graph(self, roots: List[GraphNode], source_node: GraphNode, target_node: GraphNode) -> None:
+        """
+        Ищет кратчайший путь от исходной вершины до целевой. После завершения оценка кратчайшего пути
+        целевой вершины окончательна, а путь до нее можно получить через path_to или print_shortest_path.
+        """
+
+        self._roots = roots
+        self._source_node = source_node
+        self._target_node = target_node
+        self._settled_count = 0
+        self._init_single_source()
+
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        priority_queue.push(
+            key=self._source_node,
+            priority=self._heuristic(self._source_node, self._target_node)
+        )
+
+        while not priority_queue.is_empty():
+            node: GraphNode
+            node, _ = priority_queue.pop_min()
+            self._settled_count += 1
+            if node is self._target_node:
+                break
+
+            for edge in node.edges:
+                if self._relax(edge=edge):
+                    # Если эвристика допустима, но не согласована, вершина может быть извлечена повторно:
+                    priority_queue.push_or_decrease_key(
+                        key=edge.node_to,
+                        priority=edge.node_to.shortest_path_estimate + self._heuristic(edge.node_to, self._target_node)
+                    )
+
+    def process_csr_graph(self, graph: CSRGraph, source: int, target: Optional[int] = None) -> ShortestPathsResult:
+        """
+        A* по графу в CSR-представлении. Эвристика вызывается для меток вершин: для графа, построенного по узлам,
+        это сами узлы. Если целевая вершина указана, поиск останавливается при ее извлечении из очереди,
+        и окончательны только оценки извлеченных вершин.
+        """
+
+        distances, parents = self._init_csr_single_source(graph=graph, source=source)
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        heuristic: Heuristic = self._heuristic
+        target_label: Any = graph.label(target) if target is not None else None
+        self._settled_count = 0
+
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        priority_queue.push(key=source, priority=0 if target is None else heuristic(graph.label(source), target_label))
+        while not priority_queue.is_empty():
+            node, _ = priority_queue.pop_min()
+            self._settled_count += 1
+            if node == target:
+                break
+
+            distance: float = distances[node]
+            for index in range(offsets[node], offsets[node + 1]):
+                node_to: int = targets[index]
+                new_distance: float = distance + weights[index]
+                if new_distance < distances[node_to]:
+                    distances[node_to] = new_distance
+                    parents[node_to] = node
+                    priority_queue.push_or_decrease_key(
+                        key=node_to,
+                        priority=new_distance if target is None else (
+                            new_distance + heuristic(graph.label(node_to), target_label)
+                        )
+                    )
+
+        return ShortestPathsResult(source=source, distances=distances, parents=parents)
+
+    @property
+    def settled_count(self) -> int:
+        """
+        Количество вершин, извлеченных из очереди во время последнего поиска.
+        """
+
+        return self._settled_count
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    s: AStarGraphNode = AStarGraphNode('s', x=0, y=0)
+    t: AStarGraphNode = AStarGraphNode('t', x=0, y=1)
+    x: AStarGraphNode = AStarGraphNode('x', x=1, y=1)
+    y: AStarGraphNode = AStarGraphNode('y', x=1, y=0)
+
+    # Create edges:
+    s.edges = [
+        GraphEdge(node_from=s, node_to=t, cost=1),
+        GraphEdge(node_from=s, node_to=y, cost=1),
+        GraphEdge(node_from=s, node_to=x, cost=3),
+    ]
+
+    t.edges = [
+        GraphEdge(node_from=t, node_to=x, cost=2),
+    ]
+
+    y.edges = [
+        GraphEdge(node_from=y, node_to=x, cost=1),
+    ]
+
+    graph_roots: List[AStarGraphNode] = [s, t, x, y]
+    heuristics: List[Union[Heuristic, LandmarksHeuristic]] = [
+        zero_heuristic,
+        euclidean_heuristic,
+        manhattan_heuristic,
+        LandmarksHeuristic(roots=graph_roots, landmarks=[s, x]),
+    ]
+
+    for graph_heuristic in heuristics:
+        a_star_algorithm: AStarAlgorithm = AStarAlgorithm(heuristic=graph_heuristic)
+        a_star_algorithm.process_graph(roots=graph_roots, source_node=s, target_node=x)
+        a_star_algorithm.print_shortest_path(node_to=x)
+        print(f'{a_star_algorithm.settled_count} vertices settled.')
+
+    csr_graph: CSRGraph = CSRGraph.from_nodes(roots=graph_roots)
+    a_star_algorithm = AStarAlgorithm(heuristic=euclidean_heuristic)
+    csr_result: ShortestPathsResult = a_star_algorithm.process_csr_graph(
+        graph=csr_graph,
+        source=csr_graph.vertex_id(s),
+        target=csr_graph.vertex_id(x)
+    )
+    print(f'\nCSR graph: shortest path from {s} to {x} costs {csr_result.distances[csr_graph.vertex_id(x)]} '
+          f'via {[csr_graph.label(vertex).value for vertex in csr_result.path_to(vertex=csr_graph.vertex_id(x))]}, '
+          f'{a_star_algorithm.settled_count} vertices settled.')
@@ -25,19 +25,119 @@ S        8      -3        7   *
        * * * 2 * * *
 
 Асимптоматическая скорость алгоритма составляет O(VE), где V - количество вершин графа, а E - количество ребер.
+
+Помимо классического варианта реализованы два оптимизированных режима (см. BellmanFordMode):
+1) EARLY_TERMINATION - если за очередной проход по ребрам не было произведено ни одного ослабления,
+   то оценки кратчайших путей уже окончательные и дальнейшие проходы ничего не изменят. Алгоритм завершается,
+   а цикла с отрицательным весом, достижимого из истока, в графе нет.
+2) QUEUE (Shortest Path Faster Algorithm) - повторно ослабляются только ребра, исходящие из вершин,
+   чья оценка изменилась. Такие вершины хранятся в очереди FIFO, а признак нахождения в очереди не позволяет
+   добавить вершину в очередь дважды. Если вершина попала в очередь V раз, значит кратчайший путь до нее
+   содержит не менее V ребер, что возможно только при наличии цикла с отрицательным весом.
+В худшем случае оба режима работают за то же время O(VE), но на графах с преимущественно положительными весами
+обрабатывают лишь небольшую часть ребер.
+
+Режим HOP_LIMITED решает другую задачу: ищет кратчайшие пути, состоящие не более чем из k = max_hops ребер
+(например, маршрут не более чем с k пересадками). Классический алгоритм для этого не подходит: внутри одного
+прохода оценка, улучшенная на этом проходе, сразу используется для следующих ребер, и путь может удлиниться
+на несколько ребер за проход. Поэтому используются два массива оценок: на проходе r кандидаты считаются
+только по массиву предыдущего прохода (лучшие пути не более чем из r - 1 ребер), а записываются в текущий.
+После прохода изменившиеся оценки переносятся в предыдущий массив, и массивы снова совпадают.
+Ослабляются лишь ребра вершин, оценки которых изменились на предыдущем проходе.
+Циклы с отрицательным весом в этом режиме не мешают: количество ребер пути ограничено.
+
+Кратчайшие пути с ограничением на количество ребер в общем случае не образуют дерево: начало оптимального пути
+до вершины v из k ребер - оптимальный путь до предыдущей вершины лишь из k - 1 ребер. Поэтому для восстановления
+путей для каждой вершины сохраняется история улучшений (номер прохода, родитель, ребро),
+см. HopLimitedPathsResult. Асимптоматическая скорость режима составляет O(kE).
 """
 
 
-from typing import List
+import math
+from array import array
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
 
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
 from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
-    ShortestPathsFromOneVertexBaseAlgorithm
+    ShortestPathsFromOneVertexBaseAlgorithm,
+    ShortestPathsResult
 )
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.modes import BellmanFordMode
 from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
 
 
+@dataclass
+class HopLimitedPathsResult(ShortestPathsResult):
+    """
+    Результат поиска кратчайших путей не более чем из max_hops ребер.
+    Массив parents хранит родителей последних улучшений оценок, но цепочка таких родителей в общем случае
+    не является путем из не более чем max_hops ребер, поэтому пути восстанавливаются по истории улучшений.
+    """
+
+    max_hops: int = 0
+
+    # Для каждой улучшавшейся вершины - номера проходов, на которых улучшалась ее оценка (по возрастанию),
+    # а также родители и номера ребер в массиве targets, давшие итоговую оценку каждого из этих проходов:
+    history: Dict[int, Tuple[array, array, array]] = field(default_factory=dict)
+
+    def path_edges(self, vertex: int) -> List[Tuple[int, int]]:
+        """
+        Ребра пути от исходной вершины до указанной в виде пар (вершина-источник, номер ребра в массиве targets).
+        Возвращает пустой список, если пути нет или вершина является исходной.
+        """
+
+        if math.isinf(self.distances[vertex]):
+            return []
+
+        path: List[Tuple[int, int]] = []
+        hops_limit: int = self.max_hops
+        while True:
+            if vertex not in self.history:
+                break
+
+            rounds, parents, edge_indexes = self.history[vertex]
+            position: int = bisect_right(rounds, hops_limit) - 1
+            if position < 0:
+                # Оценка вершины до прохода hops_limit не улучшалась - это исходная вершина с нулевой оценкой:
+                break
+
+            path.append((parents[position], edge_indexes[position]))
+            vertex, hops_limit = parents[position], rounds[position] - 1
+
+        path.reverse()
+        return path
+
+    def path_to(self, vertex: int) -> List[int]:
+        if math.isinf(self.distances[vertex]):
+            return []
+
+        return [node_from for node_from, _ in self.path_edges(vertex)] + [vertex]
+
+
 class BellmanFordAlgorithm(ShortestPathsFromOneVertexBaseAlgorithm):
 
+    def __init__(
+            self,
+            mode: BellmanFordMode = BellmanFordMode.CLASSIC,
+            track_parents: bool = True,
+            max_hops: Optional[int] = None
+    ) -> None:
+        """
+        :param max_hops: Наибольшее количество ребер пути. Обязателен для режима HOP_LIMITED.
+        """
+
+        if mode == BellmanFordMode.HOP_LIMITED and (max_hops is None or max_hops < 0):
+            raise ValueError(f'Mode={mode.value} requires non-negative max hops, got {max_hops}.')
+
+        super().__init__(track_parents=track_parents)
+        self._mode: BellmanFordMode = mode
+        self._max_hops: Optional[int] = max_hops
+        self._hop_limited_graph: Optional[CSRGraph] = None
+        self._hop_limited_result: Optional[HopLimitedPathsResult] = None
+
     def process_graph(self, roots: List[GraphNode], source_node: GraphNode) -> bool:
         """
         Обрабатывает граф для поиска кратчайших путей ко всем узлам от исходного узла.
@@ -49,11 +149,23 @@ class BellmanFordAlgorithm(ShortestPathsFromOneVertexBaseAlgorithm):
         self._source_node = source_node
 
         self._init_single_source()
+        if self._mode == BellmanFordMode.QUEUE:
+            return self._process_roots_via_queue()
+
+        if self._mode == BellmanFordMode.HOP_LIMITED:
+            self._process_roots_hop_limited()
+            return False
+
         self._get_all_edges()
 
         for _ in range(len(self._roots)):
+            relaxed: bool = False
             for edge in self._edges:
-                self._relax(edge=edge)
+                if self._relax(edge=edge):
+                    relaxed = True
+
+            if not relaxed and self._mode == BellmanFordMode.EARLY_TERMINATION:
+                return False
 
         for edge in self._edges:
             if edge.node_to.shortest_path_estimate > edge.node_from.shortest_path_estimate + edge.cost:
@@ -61,6 +173,195 @@ class BellmanFordAlgorithm(ShortestPathsFromOneVertexBaseAlgorithm):
 
         return False
 
+    def _process_roots_via_queue(self) -> bool:
+        """
+        Режим QUEUE: ослабляет ребра только тех вершин, чья оценка кратчайшего пути изменилась.
+        Возвращает True, если найден цикл с отрицательным весом, достижимый из истока.
+        """
+
+        queue: Deque[GraphNode] = deque([self._source_node])
+        in_queue: Set[GraphNode] = {self._source_node}
+        enqueue_counts: Dict[GraphNode, int] = {self._source_node: 1}
+
+        while queue:
+            node: GraphNode = queue.popleft()
+            in_queue.discard(node)
+            for edge in node.edges:
+                if self._relax(edge=edge) and edge.node_to not in in_queue:
+                    enqueue_counts[edge.node_to] = enqueue_counts.get(edge.node_to, 0) + 1
+                    if enqueue_counts[edge.node_to] >= len(self._roots):
+                        return True
+
+                    in_queue.add(edge.node_to)
+                    queue.append(edge.node_to)
+
+        return False
+
+    def _process_roots_hop_limited(self) -> None:
+        """
+        Режим HOP_LIMITED по узлам: поиск выполняется по CSR-представлению графа, после чего оценки путей
+        и последние родительские ребра записываются в узлы. Сами пути восстанавливаются методом path_to.
+        """
+
+        graph: CSRGraph = CSRGraph.from_nodes(roots=self._roots)
+        result: HopLimitedPathsResult = self._process_csr_graph_hop_limited(
+            graph=graph,
+            source=graph.vertex_id(self._source_node)
+        )
+        self._hop_limited_graph, self._hop_limited_result = graph, result
+
+        for vertex, node in enumerate(graph.labels):
+            estimate: float = result.distances[vertex]
+            node.shortest_path_estimate = int(estimate) if estimate.is_integer() else estimate
+            if vertex in result.history:
+                node.parent_edge = self._get_csr_edge(graph=graph, vertex=vertex, hops_limit=result.max_hops)
+                node.parent = node.parent_edge.node_from
+
+    def _get_csr_edge(self, graph: CSRGraph, vertex: int, hops_limit: int) -> GraphEdge:
+        """
+        Объект ребра, которым заканчивается кратчайший путь до вершины не более чем из hops_limit ребер.
+        """
+
+        rounds, parents, edge_indexes = self._hop_limited_result.history[vertex]
+        position: int = bisect_right(rounds, hops_limit) - 1
+        return graph.label(parents[position]).edges[edge_indexes[position] - graph.offsets[parents[position]]]
+
+    def path_to(self, node_to: GraphNode) -> Iterator[GraphEdge]:
+        if self._mode != BellmanFordMode.HOP_LIMITED:
+            return super().path_to(node_to=node_to)
+
+        if not self._track_parents:
+            raise ValueError('Parents are not tracked, so paths can not be restored.')
+
+        # Ребра узла попадают в CSR-представление в исходном порядке, поэтому номер ребра в массиве targets
+        # однозначно определяет объект ребра:
+        graph: CSRGraph = self._hop_limited_graph
+        return iter([
+            graph.label(node_from).edges[edge_index - graph.offsets[node_from]]
+            for node_from, edge_index in self._hop_limited_result.path_edges(vertex=graph.vertex_id(node_to))
+        ])
+
+    def process_csr_graph(self, graph: CSRGraph, source: int) -> ShortestPathsResult:
+        """
+        Алгоритм Беллмана-Форда непосредственно по графу в CSR-представлении.
+        Наличие цикла с отрицательным весом, достижимого из истока, отражается в поле negative_cycle результата.
+        В режиме HOP_LIMITED возвращается HopLimitedPathsResult, а циклы с отрицательным весом не ищутся.
+        """
+
+        if self._mode == BellmanFordMode.HOP_LIMITED:
+            return self._process_csr_graph_hop_limited(graph=graph, source=source)
+
+        distances, parents = self._init_csr_single_source(graph=graph, source=source)
+        if self._mode == BellmanFordMode.QUEUE:
+            negative_cycle: bool = self._process_csr_graph_via_queue(
+                graph=graph,
+                source=source,
+                distances=distances,
+                parents=parents
+            )
+        else:
+            negative_cycle = self._process_csr_graph_via_passes(graph=graph, distances=distances, parents=parents)
+
+        return ShortestPathsResult(
+            source=source,
+            distances=distances,
+            parents=parents,
+            negative_cycle=negative_cycle
+        )
+
+    def _process_csr_graph_via_passes(self, graph: CSRGraph, distances: array, parents: array) -> bool:
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+        for _ in range(graph.vertices_count):
+            relaxed: bool = False
+            for node_from in range(graph.vertices_count):
+                for index in range(offsets[node_from], offsets[node_from + 1]):
+                    new_distance: float = distances[node_from] + weights[index]
+                    if new_distance < distances[targets[index]]:
+                        distances[targets[index]] = new_distance
+                        parents[targets[index]] = node_from
+                        relaxed = True
+
+            if not relaxed and self._mode == BellmanFordMode.EARLY_TERMINATION:
+                return False
+
+        return any(
+            distances[node_from] + weights[index] < distances[targets[index]]
+            for node_from in range(graph.vertices_count)
+            for index in range(offsets[node_from], offsets[node_from + 1])
+        )
+
+    def _process_csr_graph_hop_limited(self, graph: CSRGraph, source: int) -> HopLimitedPathsResult:
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        previous_distances, parents = self._init_csr_single_source(graph=graph, source=source)
+        distances: array = array('d', previous_distances)
+        history: Dict[int, Tuple[array, array, array]] = {}
+
+        active_vertices: List[int] = [source]
+        for hops in range(1, self._max_hops + 1):
+            # Последнее улучшившее оценку ребро каждой вершины на текущем проходе:
+            round_edges: Dict[int, int] = {}
+            for node_from in active_vertices:
+                distance_from: float = previous_distances[node_from]
+                for index in range(offsets[node_from], offsets[node_from + 1]):
+                    new_distance: float = distance_from + weights[index]
+                    if new_distance < distances[targets[index]]:
+                        distances[targets[index]] = new_distance
+                        parents[targets[index]] = node_from
+                        round_edges[targets[index]] = index
+
+            if not round_edges:
+                break
+
+            for node_to, index in round_edges.items():
+                previous_distances[node_to] = distances[node_to]
+                if self._track_parents:
+                    node_history: Optional[Tuple[array, array, array]] = history.get(node_to)
+                    if node_history is None:
+                        node_history = history[node_to] = (array('l'), array('l'), array('l'))
+
+                    node_history[0].append(hops)
+                    node_history[1].append(parents[node_to])
+                    node_history[2].append(index)
+
+            active_vertices = list(round_edges)
+
+        return HopLimitedPathsResult(
+            source=source,
+            distances=distances,
+            parents=parents,
+            max_hops=self._max_hops,
+            history=history
+        )
+
+    @staticmethod
+    def _process_csr_graph_via_queue(graph: CSRGraph, source: int, distances: array, parents: array) -> bool:
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        in_queue: bytearray = bytearray(graph.vertices_count)
+        enqueue_counts: array = array('l', [0]) * graph.vertices_count
+
+        queue: Deque[int] = deque([source])
+        in_queue[source] = 1
+        enqueue_counts[source] = 1
+        while queue:
+            node_from: int = queue.popleft()
+            in_queue[node_from] = 0
+            for index in range(offsets[node_from], offsets[node_from + 1]):
+                node_to: int = targets[index]
+                new_distance: float = distances[node_from] + weights[index]
+                if new_distance < distances[node_to]:
+                    distances[node_to] = new_distance
+                    parents[node_to] = node_from
+                    if not in_queue[node_to]:
+                        enqueue_counts[node_to] += 1
+                        if enqueue_counts[node_to] >= graph.vertices_count:
+                            return True
+
+                        in_queue[node_to] = 1
+                        queue.append(node_to)
+
+        return False
+
 
 if __name__ == '__main__':
     # Create nodes:
@@ -96,7 +397,7 @@ if __name__ == '__main__':
         GraphEdge(node_from=z, node_to=s, cost=2),
     ]
 
-    bellman_ford_algorithm: BellmanFordAlgorithm = BellmanFordAlgorithm()
+    bellman_ford_algorithm: BellmanFordAlgorithm = BellmanFordAlgorithm(mode=BellmanFordMode.QUEUE)
     circle: bool = bellman_ford_algorithm.process_graph(
         source_node=s,
         roots=[s, t, y, x, z]
@@ -108,3 +409,56 @@ if __name__ == '__main__':
         bellman_ford_algorithm.print_shortest_path(node_to=z)
     else:
         print(f'There is no shortest path source node to any other node due to negative weighted cycle')
+
+    csr_graph: CSRGraph = CSRGraph.from_nodes(roots=[s, t, y, x, z])
+    csr_result: ShortestPathsResult = bellman_ford_algorithm.process_csr_graph(
+        graph=csr_graph,
+        source=csr_graph.vertex_id(s)
+    )
+
+    print(f'\nCSR graph has negative weighted cycle: {csr_result.negative_cycle}')
+    for vertex in range(csr_graph.vertices_count):
+        print(f'Shortest path from {s} to {csr_graph.label(vertex)} costs {csr_result.distances[vertex]}.')
+
+    # Кратчайший путь от s до z содержит 4 ребра (s -> y -> x -> t -> z), а при ограничении в 2 ребра
+    # остается только путь s -> t -> z:
+    hop_limited_algorithm: BellmanFordAlgorithm = BellmanFordAlgorithm(mode=BellmanFordMode.HOP_LIMITED, max_hops=2)
+    hop_limited_algorithm.process_graph(roots=[s, t, y, x, z], source_node=s)
+    hop_limited_algorithm.print_shortest_path(node_to=z)
+
+    import itertools
+    import random
+
+    # Сверяем режим HOP_LIMITED с полным перебором путей не более чем из k ребер на случайных графах,
+    # в том числе с циклами отрицательного веса:
+    generator: random.Random = random.Random(19)
+    for _ in range(200):
+        vertices_count: int = generator.randint(1, 6)
+        random_edges: List[Tuple[int, int, int]] = [
+            (generator.randrange(vertices_count), generator.randrange(vertices_count), generator.randint(-3, 10))
+            for _ in range(generator.randint(0, 3 * vertices_count))
+        ]
+        random_graph: CSRGraph = CSRGraph.from_edge_list(vertices_count=vertices_count, edges=random_edges)
+        max_hops: int = generator.randint(0, 4)
+        result: HopLimitedPathsResult = BellmanFordAlgorithm(
+            mode=BellmanFordMode.HOP_LIMITED,
+            max_hops=max_hops
+        ).process_csr_graph(graph=random_graph, source=0)
+
+        expected: List[float] = [0] + [math.inf] * (vertices_count - 1)
+        for hops_count in range(1, max_hops + 1):
+            for path_edges in itertools.product(random_edges, repeat=hops_count):
+                if path_edges[0][0] == 0 and all(
+                        path_edges[position][1] == path_edges[position + 1][0] for position in range(hops_count - 1)
+                ):
+                    expected[path_edges[-1][1]] = min(expected[path_edges[-1][1]], sum(edge[2] for edge in path_edges))
+
+        assert list(result.distances) == expected
+        for vertex in range(vertices_count):
+            path: List[Tuple[int, int]] = result.path_edges(vertex=vertex)
+            assert len(path) <= max_hops
+            if path:
+                assert path[0][0] == 0 and random_graph.targets[path[-1][1]] == vertex
+                assert sum(random_graph.weights[edge_index] for _, edge_index in path) == result.distances[vertex]
+
+    print('\nRandom graphs check passed.')
@@ -3,8 +3,10 @@
 графе G = (V, E) в случае, когда веса ребер неотрицательны.
 При хорошей реализации время работы алгоритма Дейкстры меньше времени работы алгоритма Беллмана-Форда.
 В ходе обработки этой вершин проводится ослабление всех исходящих из вершины ребер.
-В приведенной ниже реализации используется неубывающая очередь с приоритетами на основе бинарной пирамиды.
-В очередь кладутся ребра графа, а приоритетом является стоимость перехода по ребру.
+В приведенной ниже реализации используется адресуемая неубывающая пирамида (IndexedMinHeap).
+В очередь кладутся вершины графа, а приоритетом является текущая оценка кратчайшего пути до вершины.
+Пирамида хранит позицию каждой вершины, поэтому после успешного ослабления ребра приоритет вершины
+уменьшается за время O(log(V)) без поиска вершины в очереди. Итоговое время работы - O((V + E) log(V)).
 
 Граф для теста будет следующим (цикличный ориентированный взвешенный),
 где символ "*" является частью ребра от вершины к вершине, "←" - направление графа,
@@ -44,67 +46,247 @@ EXTRACT-MIN равна O(log(V)), а каждый вызов процедуры
 Любой метод, уменьшающий амортизированное время каждой операции DECREASE-KEY до величины o(log(V)),
 не увеличивая при этом амортизированного времени операции EXTRACT-MIN, позволяет получить реализацию,
 которая в асимптотическом пределе работает быстрее, чем реализация с помощью бинарных пирамид.
+
+Для поиска пути между двумя заданными вершинами реализован двунаправленный алгоритм Дейкстры (shortest_path).
+Одновременно выполняются прямой поиск из исходной вершины и обратный поиск из конечной вершины по обращенным
+ребрам. Каждый раз, когда ребро одного поиска приводит в вершину, уже достигнутую другим поиском, обновляется
+лучшая найденная стоимость пути mu. Поиск останавливается, как только сумма минимальных приоритетов обеих очередей
+становится не меньше mu: ни один еще не найденный путь не может оказаться дешевле. Вместо одного "круга" радиуса d
+вокруг исходной вершины обрабатываются два "круга" радиуса около d/2, что на больших графах в разы
+сокращает количество обработанных вершин.
+
+Если веса ребер - небольшие целые числа, сравнения в бинарной пирамиде избыточны. Реализация очереди выбирается
+параметром queue_mode (см. DijkstraQueueMode): очередь Дайала (bucket_queue.py) дает время O(E + V * C),
+а поразрядная пирамида (radix_heap.py) - O(E + V * log(C)), где C - наибольший вес ребра. Обе очереди работают
+только с целыми приоритетами, поэтому перед поиском веса ребер проверяются: дробный вес приводит к ValueError,
+а не к отбрасыванию дробной части, которое дало бы неверные оценки путей.
 """
 
 
-from typing import List, Union
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
 from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
-    ShortestPathsFromOneVertexBaseAlgorithm
+    ShortestPathsFromOneVertexBaseAlgorithm,
+    ShortestPathsResult
 )
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.modes import DijkstraQueueMode
 from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
-from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.heap_priority_queue import HeapPriorityQueue, QueueTask
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.bucket_queue import BucketQueue
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.indexed_min_heap import IndexedMinHeap
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.radix_heap import RadixHeap
+
+
+PriorityQueue = Union[IndexedMinHeap, BucketQueue, RadixHeap]
 
 
 class DijkstraAlgorithm(ShortestPathsFromOneVertexBaseAlgorithm):
 
+    def __init__(
+            self,
+            track_parents: bool = True,
+            queue_mode: DijkstraQueueMode = DijkstraQueueMode.BINARY_HEAP,
+            max_cost: Optional[int] = None
+    ) -> None:
+        """
+        :param queue_mode: Реализация очереди с приоритетами.
+        :param max_cost: Наибольший вес ребра для очереди Дайала. Если не указан, вычисляется по графу перед поиском.
+        """
+
+        super().__init__(track_parents=track_parents)
+        self._queue_mode: DijkstraQueueMode = queue_mode
+        self._max_cost: Optional[int] = max_cost
+        self._reverse_edges: Dict[GraphNode, List[GraphEdge]] = {}
+        self._settled_count: int = 0
+
+    def _create_priority_queue(self, get_costs: Callable[[], Iterable[Union[int, float]]]) -> PriorityQueue:
+        """
+        :param get_costs: Веса всех ребер графа. Перебираются только для очереди Дайала и поразрядной пирамиды,
+        которые требуют целых весов.
+        """
+
+        if self._queue_mode == DijkstraQueueMode.BINARY_HEAP:
+            return IndexedMinHeap()
+
+        max_cost: Union[int, float] = 0
+        for cost in get_costs():
+            if cost % 1:
+                raise ValueError(f'Dial/radix queue modes require integer edge costs, got cost={cost}.')
+
+            max_cost = max(max_cost, cost)
+
+        if self._queue_mode == DijkstraQueueMode.DIAL:
+            # После проверки наибольший вес - целое число, поэтому int() его не округляет:
+            return BucketQueue(max_cost=int(self._max_cost if self._max_cost is not None else max_cost))
+
+        return RadixHeap()
+
     def process_graph(self, roots: List[GraphNode], source_node: GraphNode) -> None:
         """
-        Подготавливает вершины и ребра для дальнейшей обработки через очередь с приоритетами.
+        Подготавливает вершины для дальнейшей обработки через очередь с приоритетами.
+        Изначально в очереди находится только исходная вершина, остальные вершины попадают в очередь
+        при первом успешном ослаблении входящего в них ребра.
         """
 
         self._roots = roots
         self._source_node = source_node
         self._init_single_source()
-        self._get_all_edges()
 
-        priority_queue: HeapPriorityQueue = HeapPriorityQueue()
-        for edge in self._edges:
-            priority_queue.add(
-                task=QueueTask(
-                    priority=edge.cost,
-                    task=edge
-                )
-            )
+        priority_queue: PriorityQueue = self._create_priority_queue(
+            get_costs=lambda: (edge.cost for root in self._roots for edge in root.edges)
+        )
+        priority_queue.push(key=self._source_node, priority=self._source_node.shortest_path_estimate)
 
         self._process_roots_via_priority_queue(priority_queue=priority_queue)
 
-    def _process_roots_via_priority_queue(self, priority_queue: HeapPriorityQueue) -> None:
+    def _process_roots_via_priority_queue(self, priority_queue: PriorityQueue) -> None:
         """
-        Обрабатывает каждое ребро в очереди, пытаясь провести ослабление. Если ослабление произведено, то вершина,
-        в которую входит ребро, должна изменить приоритет в очереди на актуальный.
+        Извлекает из очереди вершину с наименьшей оценкой кратчайшего пути и ослабляет все исходящие из нее ребра.
+        Если ослабление произведено, то вершина, в которую входит ребро, добавляется в очередь
+        или уменьшает в ней свой приоритет до актуальной оценки кратчайшего пути.
         """
 
         while not priority_queue.is_empty():
-            edge: GraphEdge = priority_queue.get().task
-            old_shortest_path_estimate: Union[int, float] = edge.node_to.shortest_path_estimate
-            self._relax(edge=edge)
+            node: GraphNode
+            node, _ = priority_queue.pop_min()
+            for edge in node.edges:
+                if self._relax(edge=edge):
+                    priority_queue.push_or_decrease_key(
+                        key=edge.node_to,
+                        priority=edge.node_to.shortest_path_estimate
+                    )
+
+    def build_reverse_index(self, roots: List[GraphNode]) -> None:
+        """
+        Строит индекс входящих ребер каждой вершины, необходимый для обратного поиска в shortest_path.
+        Индекс строится один раз за время O(V + E) и переиспользуется всеми последующими запросами,
+        пока граф не изменится.
+        """
+
+        self._reverse_edges = {root: [] for root in roots}
+        for root in roots:
+            for edge in root.edges:
+                self._reverse_edges.setdefault(edge.node_to, []).append(edge)
+
+    def shortest_path(
+            self,
+            source_node: GraphNode,
+            target_node: GraphNode
+    ) -> Tuple[Union[int, float], List[GraphEdge]]:
+        """
+        Двунаправленный поиск кратчайшего пути между двумя вершинами.
+        Оценки кратчайших путей хранятся в словарях, а не в атрибутах узлов, поэтому запрос затрагивает только
+        обработанные вершины и не требует инициализации всего графа.
+
+        :return: Стоимость кратчайшего пути и ребра пути по порядку. Если пути нет - math.inf и пустой список.
+        """
+
+        if not self._reverse_edges:
+            raise ValueError('Reverse index is not built. Call build_reverse_index first.')
+
+        self._source_node = source_node
+        self._settled_count = 0
+        if source_node is target_node:
+            return 0, []
+
+        distances: Tuple[Dict[GraphNode, Union[int, float]], ...] = ({source_node: 0}, {target_node: 0})
+        parent_edges: Tuple[Dict[GraphNode, Optional[GraphEdge]], ...] = ({source_node: None}, {target_node: None})
+        priority_queues: Tuple[IndexedMinHeap, ...] = (IndexedMinHeap(), IndexedMinHeap())
+        priority_queues[0].push(key=source_node, priority=0)
+        priority_queues[1].push(key=target_node, priority=0)
 
-            if old_shortest_path_estimate > edge.node_to.shortest_path_estimate:
-                self._update_edge_priority(
-                    priority_queue=priority_queue,
-                    edge=edge
-                )
+        best_cost: Union[int, float] = math.inf
+        meeting_node: Optional[GraphNode] = None
+
+        while not priority_queues[0].is_empty() and not priority_queues[1].is_empty():
+            forward_min: Union[int, float] = priority_queues[0].peek_min()[1]
+            backward_min: Union[int, float] = priority_queues[1].peek_min()[1]
+            if forward_min + backward_min >= best_cost:
+                break
+
+            # Продвигаем тот поиск, чья очередь ближе к своему началу, чтобы оба "круга" росли равномерно:
+            direction: int = 0 if forward_min <= backward_min else 1
+            node, distance = priority_queues[direction].pop_min()
+            self._settled_count += 1
+
+            edges: List[GraphEdge] = node.edges if direction == 0 else self._reverse_edges.get(node, [])
+            for edge in edges:
+                neighbor: GraphNode = edge.node_to if direction == 0 else edge.node_from
+                new_distance: Union[int, float] = distance + edge.cost
+                if new_distance < distances[direction].get(neighbor, math.inf):
+                    distances[direction][neighbor] = new_distance
+                    parent_edges[direction][neighbor] = edge
+                    priority_queues[direction].push_or_decrease_key(key=neighbor, priority=new_distance)
+
+                # Соседняя вершина уже достигнута встречным поиском - найден кандидат на кратчайший путь:
+                if neighbor in distances[1 - direction]:
+                    candidate_cost: Union[int, float] = (
+                            distances[direction][neighbor] + distances[1 - direction][neighbor]
+                    )
+                    if candidate_cost < best_cost:
+                        best_cost = candidate_cost
+                        meeting_node = neighbor
+
+        if meeting_node is None:
+            return math.inf, []
+
+        return best_cost, self._join_paths(meeting_node=meeting_node, parent_edges=parent_edges)
 
     @staticmethod
-    def _update_edge_priority(priority_queue: HeapPriorityQueue, edge: GraphEdge) -> None:
+    def _join_paths(
+            meeting_node: GraphNode,
+            parent_edges: Tuple[Dict[GraphNode, Optional[GraphEdge]], ...]
+    ) -> List[GraphEdge]:
         """
-        Обновляет приоритет ребра в очереди.
+        Склеивает путь от исходной вершины до вершины встречи с путем от вершины встречи до конечной вершины.
         """
 
-        for index, task in enumerate(priority_queue.tasks):
-            if task.task == edge.node_to:
-                priority_queue.change_priority(index=index, priority=task.task.priority)
+        path: List[GraphEdge] = []
+        edge: Optional[GraphEdge] = parent_edges[0][meeting_node]
+        while edge is not None:
+            path.append(edge)
+            edge = parent_edges[0][edge.node_from]
+
+        path.reverse()
+
+        edge = parent_edges[1][meeting_node]
+        while edge is not None:
+            path.append(edge)
+            edge = parent_edges[1][edge.node_to]
+
+        return path
+
+    @property
+    def settled_count(self) -> int:
+        """
+        Количество вершин, извлеченных из очередей во время последнего запроса shortest_path.
+        """
+
+        return self._settled_count
+
+    def process_csr_graph(self, graph: CSRGraph, source: int) -> ShortestPathsResult:
+        """
+        Алгоритм Дейкстры непосредственно по графу в CSR-представлении.
+        Ключами пирамиды являются идентификаторы вершин, а вершина, извлеченная из пирамиды, считается обработанной.
+        """
+
+        distances, parents = self._init_csr_single_source(graph=graph, source=source)
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+        priority_queue: PriorityQueue = self._create_priority_queue(get_costs=lambda: weights)
+        priority_queue.push(key=source, priority=0)
+        while not priority_queue.is_empty():
+            node, distance = priority_queue.pop_min()
+            for index in range(offsets[node], offsets[node + 1]):
+                node_to: int = targets[index]
+                new_distance: float = distance + weights[index]
+                if new_distance < distances[node_to]:
+                    distances[node_to] = new_distance
+                    parents[node_to] = node
+                    priority_queue.push_or_decrease_key(key=node_to, priority=new_distance)
+
+        return ShortestPathsResult(source=source, distances=distances, parents=parents)
 
 
 if __name__ == '__main__':
@@ -152,3 +334,36 @@ if __name__ == '__main__':
     dijkstra_algorithm.print_shortest_path(node_to=x)
     dijkstra_algorithm.print_shortest_path(node_to=t)
     dijkstra_algorithm.print_shortest_path(node_to=z)
+
+    csr_graph: CSRGraph = CSRGraph.from_nodes(roots=[s, t, y, x, z])
+    csr_result: ShortestPathsResult = dijkstra_algorithm.process_csr_graph(
+        graph=csr_graph,
+        source=csr_graph.vertex_id(s)
+    )
+
+    print('\nCSR graph:')
+    for vertex in range(csr_graph.vertices_count):
+        print(f'Shortest path from {s} to {csr_graph.label(vertex)} costs {csr_result.distances[vertex]} '
+              f'via {[str(csr_graph.label(path_vertex).value) for path_vertex in csr_result.path_to(vertex)]}.')
+
+    print('\nBidirectional search:')
+    dijkstra_algorithm.build_reverse_index(roots=[s, t, y, x, z])
+    path_cost, path_edges = dijkstra_algorithm.shortest_path(source_node=s, target_node=x)
+    for path_edge in path_edges:
+        print(f'\t{path_edge}')
+
+    print(f'Shortest path from {s} to {x} costs {path_cost}, {dijkstra_algorithm.settled_count} vertices settled.')
+
+    # Очереди с целыми приоритетами отвергают дробные веса, а не отбрасывают их дробную часть:
+    fractional_graph: CSRGraph = CSRGraph.from_edge_list(
+        vertices_count=3,
+        edges=[(0, 1, 0.6), (0, 2, 1.0), (1, 2, 0.6)]
+    )
+    assert list(DijkstraAlgorithm().process_csr_graph(graph=fractional_graph, source=0).distances) == [0, 0.6, 1.0]
+    for integer_queue_mode in (DijkstraQueueMode.DIAL, DijkstraQueueMode.RADIX_HEAP):
+        try:
+            DijkstraAlgorithm(queue_mode=integer_queue_mode).process_csr_graph(graph=fractional_graph, source=0)
+        except ValueError as error:
+            print(f'\n{integer_queue_mode.value}: {error}')
+        else:
+            raise AssertionError('Fractional edge costs must be rejected.')
@@ -0,0 +1,283 @@
+"""
+Алгоритм Йена находит k кратчайших простых (без повторяющихся вершин) путей между двумя вершинами
+взвешенного ориентированного графа с неотрицательными весами ребер в порядке неубывания их стоимости.
+
+1) Первый путь - кратчайший путь, найденный алгоритмом Дейкстры.
+2) Каждый следующий путь отклоняется от одного из уже найденных путей P в некоторой вершине пути (spur-вершине):
+   начало P до spur-вершины (корневой путь) сохраняется, а продолжение (spur-путь) ищется алгоритмом Дейкстры
+   в графе, из которого удалены вершины корневого пути и ребра, которыми из spur-вершины выходят уже найденные
+   пути с тем же корневым путем. Полученные пути-кандидаты хранятся в неубывающей очереди с приоритетами,
+   а следующим путем становится самый дешевый кандидат.
+
+Оптимизации относительно классической реализации:
+1) Модификация Лоулера: путь, отклонившийся от родительского пути в вершине с индексом d, совпадает с родителем
+   до этой вершины, а кандидаты для более ранних spur-вершин уже были построены из родительского пути.
+   Поэтому spur-вершины перебираются только начиная с индекса d, а стоимости корневых путей берутся
+   из префиксных сумм стоимостей ребер.
+2) Кратчайшие расстояния от всех вершин до конечной вершины вычисляются один раз обратным поиском и используются
+   всеми spur-поисками: если путь из spur-вершины по дереву кратчайших путей не проходит через удаленные
+   вершины и ребра, он и является spur-путем, и поиск не нужен. Иначе spur-путь ищется алгоритмом A*, для которого
+   расстояния до конечной вершины в исходном графе - согласованная эвристика (удаление вершин и ребер
+   может только увеличить расстояния).
+3) Пути возвращаются генератором: каждый следующий путь вычисляется только тогда, когда он запрошен.
+
+Граф для теста совпадает с графом алгоритма Дейкстры (см. Dijkstra_algorithm.py).
+
+Асимптоматическая скорость поиска k путей в худшем случае составляет O(k * V * (V + E) log(V)),
+где V - количество вершин графа, а E - количество ребер: для каждого из k путей выполняется до V spur-поисков.
+"""
+
+
+import heapq
+import itertools
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.indexed_min_heap import IndexedMinHeap
+
+
+class YenAlgorithm(DijkstraAlgorithm):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._distances_to_target: Dict[GraphNode, Union[int, float]] = {}
+        self._next_edges: Dict[GraphNode, Optional[GraphEdge]] = {}
+        self._spur_searches_count: int = 0
+
+    def k_shortest_paths(
+            self,
+            roots: List[GraphNode],
+            source_node: GraphNode,
+            target_node: GraphNode
+    ) -> Iterator[Tuple[Union[int, float], List[GraphEdge]]]:
+        """
+        Генератор простых путей от исходной вершины до конечной в порядке неубывания стоимости.
+        Узлы графа не изменяются.
+
+        :return: Пары (стоимость пути, ребра пути по порядку).
+        """
+
+        self._source_node = source_node
+        self._spur_searches_count = 0
+        self.build_reverse_index(roots=roots)
+        self._search_to_target(target_node=target_node)
+        if source_node not in self._distances_to_target:
+            return
+
+        # Кандидаты: (стоимость, порядковый номер для равных стоимостей, ребра пути, индекс spur-вершины):
+        candidates: List[Tuple[Union[int, float], int, List[GraphEdge], int]] = []
+        counter: Iterator[int] = itertools.count()
+        first_path: List[GraphEdge] = self._get_tree_path(node=source_node)
+        heapq.heappush(candidates, (self._distances_to_target[source_node], next(counter), first_path, 0))
+
+        seen_paths: Set[Tuple[int, ...]] = {self._get_path_key(path=first_path)}
+        accepted_paths: List[Tuple[int, ...]] = []
+        while candidates:
+            cost, _, path, deviation_index = heapq.heappop(candidates)
+            yield cost, path
+
+            path_key: Tuple[int, ...] = self._get_path_key(path=path)
+            accepted_paths.append(path_key)
+
+            path_nodes: List[GraphNode] = [source_node] + [edge.node_to for edge in path]
+            root_costs: List[Union[int, float]] = [0]
+            for edge in path:
+                root_costs.append(root_costs[-1] + edge.cost)
+
+            for spur_index in range(deviation_index, len(path)):
+                root_key: Tuple[int, ...] = path_key[:spur_index]
+                banned_edges: Set[int] = {
+                    accepted_key[spur_index] for accepted_key in accepted_paths
+                    if len(accepted_key) > spur_index and accepted_key[:spur_index] == root_key
+                }
+
+                spur_path: Optional[List[GraphEdge]] = self._search_spur_path(
+                    spur_node=path_nodes[spur_index],
+                    target_node=target_node,
+                    banned_nodes=set(path_nodes[:spur_index]),
+                    banned_edges=banned_edges
+                )
+                if spur_path is None:
+                    continue
+
+                candidate_path: List[GraphEdge] = path[:spur_index] + spur_path
+                candidate_key: Tuple[int, ...] = self._get_path_key(path=candidate_path)
+                if candidate_key in seen_paths:
+                    continue
+
+                seen_paths.add(candidate_key)
+                candidate_cost: Union[int, float] = root_costs[spur_index] + sum(edge.cost for edge in spur_path)
+                heapq.heappush(candidates, (candidate_cost, next(counter), candidate_path, spur_index))
+
+    def _search_to_target(self, target_node: GraphNode) -> None:
+        """
+        Обратный алгоритм Дейкстры от конечной вершины по входящим ребрам. Для каждой вершины, из которой
+        достижима конечная, запоминаются расстояние до конечной вершины и первое ребро кратчайшего пути до нее.
+        """
+
+        self._distances_to_target = {target_node: 0}
+        self._next_edges = {target_node: None}
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        priority_queue.push(key=target_node, priority=0)
+        while not priority_queue.is_empty():
+            node, distance = priority_queue.pop_min()
+            for edge in self._reverse_edges.get(node, []):
+                new_distance: Union[int, float] = distance + edge.cost
+                if new_distance < self._distances_to_target.get(edge.node_from, math.inf):
+                    self._distances_to_target[edge.node_from] = new_distance
+                    self._next_edges[edge.node_from] = edge
+                    priority_queue.push_or_decrease_key(key=edge.node_from, priority=new_distance)
+
+    def _get_tree_path(self, node: GraphNode) -> List[GraphEdge]:
+        path: List[GraphEdge] = []
+        edge: Optional[GraphEdge] = self._next_edges[node]
+        while edge is not None:
+            path.append(edge)
+            edge = self._next_edges[edge.node_to]
+
+        return path
+
+    def _search_spur_path(
+            self,
+            spur_node: GraphNode,
+            target_node: GraphNode,
+            banned_nodes: Set[GraphNode],
+            banned_edges: Set[int]
+    ) -> Optional[List[GraphEdge]]:
+        """
+        Ищет кратчайший путь от spur-вершины до конечной вершины, не проходящий через удаленные вершины и ребра.
+        Возвращает None, если такого пути нет.
+        """
+
+        tree_path: List[GraphEdge] = self._get_tree_path(node=spur_node)
+        if all(id(edge) not in banned_edges and edge.node_to not in banned_nodes for edge in tree_path):
+            return tree_path
+
+        self._spur_searches_count += 1
+        distances: Dict[GraphNode, Union[int, float]] = {spur_node: 0}
+        parent_edges: Dict[GraphNode, Optional[GraphEdge]] = {spur_node: None}
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        priority_queue.push(key=spur_node, priority=self._distances_to_target[spur_node])
+        while not priority_queue.is_empty():
+            node: GraphNode
+            node, _ = priority_queue.pop_min()
+            if node is target_node:
+                path: List[GraphEdge] = []
+                edge: Optional[GraphEdge] = parent_edges[target_node]
+                while edge is not None:
+                    path.append(edge)
+                    edge = parent_edges[edge.node_from]
+
+                path.reverse()
+                return path
+
+            for edge in node.edges:
+                # Вершины, из которых конечная вершина недостижима даже в исходном графе, пропускаются:
+                if (id(edge) in banned_edges or edge.node_to in banned_nodes or
+                        edge.node_to not in self._distances_to_target):
+                    continue
+
+                new_distance: Union[int, float] = distances[node] + edge.cost
+                if new_distance < distances.get(edge.node_to, math.inf):
+                    distances[edge.node_to] = new_distance
+                    parent_edges[edge.node_to] = edge
+                    priority_queue.push_or_decrease_key(
+                        key=edge.node_to,
+                        priority=new_distance + self._distances_to_target[edge.node_to]
+                    )
+
+        return None
+
+    @staticmethod
+    def _get_path_key(path: List[GraphEdge]) -> Tuple[int, ...]:
+        # Хеш ребра зависит от его стоимости, поэтому ребра пути сравниваются по идентичности объектов:
+        return tuple(id(edge) for edge in path)
+
+    @property
+    def spur_searches_count(self) -> int:
+        """
+        Количество spur-поисков, выполненных алгоритмом A* (а не найденных по дереву кратчайших путей)
+        во время последнего вызова k_shortest_paths.
+        """
+
+        return self._spur_searches_count
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    s: GraphNode = GraphNode('s')
+    t: GraphNode = GraphNode('t')
+    y: GraphNode = GraphNode('y')
+    x: GraphNode = GraphNode('x')
+    z: GraphNode = GraphNode('z')
+
+    # Create edges:
+    s.edges = [
+        GraphEdge(node_from=s, node_to=t, cost=10),
+        GraphEdge(node_from=s, node_to=y, cost=5),
+    ]
+
+    t.edges = [
+        GraphEdge(node_from=t, node_to=y, cost=2),
+        GraphEdge(node_from=t, node_to=x, cost=1),
+    ]
+
+    y.edges = [
+        GraphEdge(node_from=y, node_to=t, cost=3),
+        GraphEdge(node_from=y, node_to=z, cost=2),
+        GraphEdge(node_from=y, node_to=x, cost=9),
+    ]
+
+    x.edges = [
+        GraphEdge(node_from=x, node_to=z, cost=4),
+    ]
+
+    z.edges = [
+        GraphEdge(node_from=z, node_to=x, cost=6),
+        GraphEdge(node_from=z, node_to=s, cost=7),
+    ]
+
+    yen_algorithm: YenAlgorithm = YenAlgorithm()
+    for path_cost, path_edges in yen_algorithm.k_shortest_paths(roots=[s, t, y, x, z], source_node=s, target_node=x):
+        print(f'{path_cost}: {" -> ".join([str(s.value)] + [str(edge.node_to.value) for edge in path_edges])}')
+
+    import random
+
+    def get_all_simple_paths_costs(node: GraphNode, target: GraphNode, visited: Set[GraphNode]) -> List[int]:
+        if node is target:
+            return [0]
+
+        costs: List[int] = []
+        for node_edge in node.edges:
+            if node_edge.node_to not in visited:
+                costs.extend(
+                    node_edge.cost + cost
+                    for cost in get_all_simple_paths_costs(node_edge.node_to, target, visited | {node_edge.node_to})
+                )
+
+        return costs
+
+    # Сверяем стоимости путей с перебором всех простых путей на случайных графах:
+    generator: random.Random = random.Random(15)
+    for _ in range(200):
+        nodes: List[GraphNode] = [GraphNode(value) for value in range(generator.randint(2, 8))]
+        for node_from in nodes:
+            for node_to in generator.sample(nodes, generator.randint(0, len(nodes))):
+                if node_to is not node_from:
+                    node_from.edges.append(GraphEdge(node_from=node_from, node_to=node_to, cost=generator.randint(0, 9)))
+
+        expected_costs: List[int] = sorted(get_all_simple_paths_costs(nodes[0], nodes[-1], {nodes[0]}))
+        found_paths: List[Tuple[Union[int, float], List[GraphEdge]]] = list(
+            yen_algorithm.k_shortest_paths(roots=nodes, source_node=nodes[0], target_node=nodes[-1])
+        )
+        assert [path_cost for path_cost, _ in found_paths] == expected_costs
+        for path_cost, path_edges in found_paths:
+            path_nodes: List[GraphNode] = [nodes[0]] + [edge.node_to for edge in path_edges]
+            assert len(set(path_nodes)) == len(path_nodes) and path_nodes[-1] is nodes[-1]
+            assert sum(edge.cost for edge in path_edges) == path_cost
+
+    print('\nRandom graphs check passed.')
@@ -1,12 +1,53 @@
 import math
-from typing import List, Optional
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
 
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
 from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
 
 
-class ShortestPathsFromOneVertexBaseAlgorithm:
+@dataclass
+class ShortestPathsResult:
+    """
+    Результат поиска кратчайших путей по графу в CSR-представлении.
+    Оценки кратчайших путей и родители хранятся в плоских массивах, индексируемых идентификатором вершины,
+    а не в атрибутах узлов, поэтому граф не изменяется в ходе поиска.
+    """
 
-    def __init__(self) -> None:
+    source: int
+    distances: array  # math.inf (-math.inf при поиске длиннейших путей), если пути до вершины нет
+    parents: array  # -1 для исходной вершины и недостижимых вершин
+    negative_cycle: bool = False
+
+    def path_to(self, vertex: int) -> List[int]:
+        """
+        Восстанавливает путь от исходной вершины до указанной по массиву родителей.
+        Возвращает пустой список, если пути нет.
+        """
+
+        if math.isinf(self.distances[vertex]):
+            return []
+
+        path: List[int] = []
+        while vertex != -1:
+            path.append(vertex)
+            vertex = self.parents[vertex]
+
+        path.reverse()
+        return path
+
+
+class ShortestPathsFromOneVertexBaseAlgorithm(ABC):
+
+    def __init__(self, track_parents: bool = True) -> None:
+        """
+        :param track_parents: Запоминать ли родителей узлов при ослаблении. Если нужны только стоимости
+        кратчайших путей, отключение позволяет не выполнять лишние записи при каждом ослаблении.
+        """
+
+        self._track_parents: bool = track_parents
         self._roots: List[GraphNode] = []
         self._source_node: Optional[GraphNode] = None
         self._edges: List[GraphEdge] = []
@@ -19,35 +60,85 @@ class ShortestPathsFromOneVertexBaseAlgorithm:
 
         for root in self._roots:
             root.parent = None
+            root.parent_edge = None
             root.shortest_path_estimate = math.inf
-            root.path_from_source = []
 
         self._source_node.shortest_path_estimate = 0
 
+    @staticmethod
+    def _init_csr_single_source(graph: CSRGraph, source: int) -> Tuple[array, array]:
+        """
+        Аналог _init_single_source для графа в CSR-представлении: создает массивы оценок кратчайших путей и родителей.
+        """
+
+        distances: array = array('d', [math.inf]) * graph.vertices_count
+        parents: array = array('l', [-1]) * graph.vertices_count
+        distances[source] = 0
+        return distances, parents
+
+    @abstractmethod
+    def process_csr_graph(self, graph: CSRGraph, source: int) -> ShortestPathsResult:
+        """
+        Поиск кратчайших путей из вершины source до всех вершин графа в CSR-представлении.
+        Граф не изменяется, результат возвращается в плоских массивах.
+        """
+
     def _get_all_edges(self) -> None:
         self._edges.clear()
         for root in self._roots:
             self._edges += root.edges
 
-    @staticmethod
-    def _relax(edge: GraphEdge) -> None:
+    def _relax(self, edge: GraphEdge) -> bool:
         """
         Процедура ослабления, которая проверяет, может ли значение кратчайшего пути до вершины уменьшено.
         Значение может быть уменьшено, если из потенциальной новой вершины родителя до текущей вершины путь
         с учетом цены ребра будет меньше, чем текущий.
+
+        Возвращает True, если ослабление было произведено.
+
+        Путь до вершины не копируется: запоминается только ребро, по которому в вершину пришли,
+        поэтому каждое ослабление выполняется за время O(1) независимо от длины пути.
         """
 
         if edge.node_to.shortest_path_estimate > edge.node_from.shortest_path_estimate + edge.cost:
             edge.node_to.shortest_path_estimate = edge.node_from.shortest_path_estimate + edge.cost
-            edge.node_to.parent = edge.node_from
-            edge.node_to.path_from_source = edge.node_from.path_from_source + [edge]
+            if self._track_parents:
+                edge.node_to.parent = edge.node_from
+                edge.node_to.parent_edge = edge
+
+            return True
+
+        return False
+
+    def path_to(self, node_to: GraphNode) -> Iterator[GraphEdge]:
+        """
+        Восстанавливает путь от исходного узла до указанного по цепочке родительских ребер
+        и возвращает ребра пути по порядку, начиная с исходного узла. Если пути нет, итератор пуст.
+        Асимптоматическая скорость составляет O(k), где k - количество ребер в пути.
+        """
+
+        if not self._track_parents:
+            raise ValueError('Parents are not tracked, so paths can not be restored.')
+
+        path: List[GraphEdge] = []
+        edge: Optional[GraphEdge] = node_to.parent_edge
+        while edge is not None:
+            path.append(edge)
+            if len(path) > len(self._roots):
+                # Цепочка родителей замкнулась, что возможно только при цикле с отрицательным весом:
+                raise ValueError(f'Path to {node_to} goes through a negative weighted cycle.')
+
+            edge = edge.node_from.parent_edge
+
+        return reversed(path)
 
     def print_shortest_path(self, node_to: GraphNode) -> None:
         print(f'\nWay from {self._source_node} to {node_to}:')
-        for edge in node_to.path_from_source:
-            print(f'\t{edge}')
+        if self._track_parents:
+            for edge in self.path_to(node_to=node_to):
+                print(f'\t{edge}')
 
-        if not node_to.shortest_path_estimate == math.inf:
+        if not math.isinf(node_to.shortest_path_estimate):
             print(f'Shortest path from {self._source_node} to {node_to} costs {node_to.shortest_path_estimate}.')
         else:
             print(f'There is no path from {self._source_node} to {node_to}.')
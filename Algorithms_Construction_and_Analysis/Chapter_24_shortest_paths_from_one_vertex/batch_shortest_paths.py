@@ -0,0 +1,162 @@
+"""
+Пакетный поиск кратчайших путей из множества исходных вершин (например, для построения матрицы расстояний).
+
+Алгоритмы на объектах узлов хранят оценки кратчайших путей прямо в узлах, поэтому два поиска из разных вершин
+не могут выполняться одновременно. Здесь поиск выполняется по графу в CSR-представлении, а результат каждого поиска -
+отдельный массив расстояний, поэтому поиски независимы и распределяются между процессами ProcessPoolExecutor.
+
+Граф один раз записывается в блок разделяемой памяти (multiprocessing.shared_memory) в формате graph_file.py.
+Каждый рабочий процесс подключается к этому блоку при запуске и строит граф поверх него без копирования данных,
+так что все процессы читают одни и те же физические страницы памяти, а между процессами передаются только номера
+исходных вершин и итоговые массивы расстояний. Поскольку процессы не разделяют изменяемого состояния,
+скорость работы растет почти линейно с количеством ядер процессора.
+
+Асимптоматическая скорость составляет O(S (V + E) log(V) / P), где S - количество исходных вершин,
+P - количество процессов, V - количество вершин графа, а E - количество ребер.
+"""
+
+
+from __future__ import annotations
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsFromOneVertexBaseAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.graph_file import (
+    GraphBufferView,
+    get_graph_buffer_size,
+    write_graph_buffer
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode
+
+
+# Состояние рабочего процесса, заполняемое при его запуске в _init_worker:
+_worker_shared_memory: Optional[shared_memory.SharedMemory] = None
+_worker_buffer_view: Optional[GraphBufferView] = None
+_worker_algorithm: Optional[ShortestPathsFromOneVertexBaseAlgorithm] = None
+
+
+def _init_worker(shared_memory_name: str, algorithm_class: Type[ShortestPathsFromOneVertexBaseAlgorithm]) -> None:
+    global _worker_shared_memory, _worker_buffer_view, _worker_algorithm
+
+    _worker_shared_memory = shared_memory.SharedMemory(name=shared_memory_name)
+    _worker_buffer_view = GraphBufferView(buffer=_worker_shared_memory.buf)
+    _worker_algorithm = algorithm_class()
+
+
+def _process_sources_chunk(sources: Sequence[int]) -> List[Tuple[int, array]]:
+    return [
+        (source, _worker_algorithm.process_csr_graph(graph=_worker_buffer_view.graph, source=source).distances)
+        for source in sources
+    ]
+
+
+class BatchShortestPaths:
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            algorithm_class: Type[ShortestPathsFromOneVertexBaseAlgorithm] = DijkstraAlgorithm
+    ) -> None:
+        """
+        :param max_workers: Количество рабочих процессов. По умолчанию - количество ядер процессора.
+        Если равно 1, поиски выполняются в текущем процессе без разделяемой памяти.
+        :param algorithm_class: Алгоритм, реализующий process_csr_graph.
+        """
+
+        self._max_workers: int = max_workers or os.cpu_count() or 1
+        self._algorithm_class: Type[ShortestPathsFromOneVertexBaseAlgorithm] = algorithm_class
+
+    def process_csr_graph(self, graph: CSRGraph, sources: Sequence[int]) -> Dict[int, array]:
+        """
+        :return: Словарь, сопоставляющий каждой исходной вершине массив расстояний до всех вершин графа.
+        """
+
+        if self._max_workers == 1 or len(sources) <= 1:
+            algorithm: ShortestPathsFromOneVertexBaseAlgorithm = self._algorithm_class()
+            return {source: algorithm.process_csr_graph(graph=graph, source=source).distances for source in sources}
+
+        graph_memory: shared_memory.SharedMemory = shared_memory.SharedMemory(
+            create=True,
+            size=get_graph_buffer_size(graph=graph)
+        )
+
+        try:
+            write_graph_buffer(buffer=graph_memory.buf, graph=graph)
+
+            # Несколько порций на процесс сглаживают разницу во времени обработки разных исходных вершин:
+            chunk_size: int = max(1, len(sources) // (4 * self._max_workers))
+            chunks: List[Sequence[int]] = [sources[index:index + chunk_size] for index in range(0, len(sources), chunk_size)]
+
+            distances: Dict[int, array] = {}
+            with ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    initializer=_init_worker,
+                    initargs=(graph_memory.name, self._algorithm_class)
+            ) as executor:
+                for chunk_distances in executor.map(_process_sources_chunk, chunks):
+                    distances.update(chunk_distances)
+
+            return distances
+        finally:
+            graph_memory.close()
+            graph_memory.unlink()
+
+    def process_graph(
+            self,
+            roots: List[GraphNode],
+            source_nodes: Sequence[GraphNode]
+    ) -> Tuple[CSRGraph, Dict[GraphNode, array]]:
+        """
+        Аналог process_csr_graph для узлов графа. Узлы не изменяются.
+
+        :return: CSR-представление графа, по которому массивы расстояний индексируются идентификаторами вершин
+        (см. CSRGraph.vertex_id), и словарь, сопоставляющий каждому исходному узлу массив расстояний.
+        """
+
+        graph: CSRGraph = CSRGraph.from_nodes(roots=roots)
+        distances: Dict[int, array] = self.process_csr_graph(
+            graph=graph,
+            sources=[graph.vertex_id(source_node) for source_node in source_nodes]
+        )
+
+        return graph, {graph.label(source): source_distances for source, source_distances in distances.items()}
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    generator: random.Random = random.Random(9)
+    vertices_count: int = 20_000
+    random_graph: CSRGraph = CSRGraph.from_edge_list(
+        vertices_count=vertices_count,
+        edges=[
+            (generator.randrange(vertices_count), generator.randrange(vertices_count), generator.randint(1, 100))
+            for _ in range(5 * vertices_count)
+        ]
+    )
+
+    graph_sources: List[int] = list(range(32))
+    print(f'{random_graph}, {len(graph_sources)} sources:')
+
+    sequential_time: float = 0
+    for workers_count in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start: float = time.perf_counter()
+        batch_distances: Dict[int, array] = BatchShortestPaths(max_workers=workers_count).process_csr_graph(
+            graph=random_graph,
+            sources=graph_sources
+        )
+        elapsed: float = time.perf_counter() - start
+        sequential_time = sequential_time or elapsed
+        print(f'\t{workers_count} workers: {elapsed:.3f} s, speedup {sequential_time / elapsed:.2f}x')
+
+    print(f'Distance from 0 to 1 is {batch_distances[0][1]}.')
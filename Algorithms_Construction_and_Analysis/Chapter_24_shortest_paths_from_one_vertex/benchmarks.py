@@ -0,0 +1,540 @@
+"""
+Замеры скорости алгоритмов поиска кратчайших путей из одной вершины.
+
+Каждый замер оформлен отдельной функцией, которая строит тестовый граф, запускает сравниваемые варианты
+алгоритма и выводит время их работы в консоль. Запуск всех замеров:
+
+python -m Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.benchmarks
+"""
+
+
+import gzip
+import itertools
+import math
+import os
+import random
+import tempfile
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.A_star_algorithm import (
+    AStarAlgorithm,
+    AStarGraphNode
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsResult
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Bellman_Ford_algorithm import (
+    BellmanFordAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.contraction_hierarchies import (
+    ContractionHierarchies
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.customizable_route_planning import (
+    CustomizableRoutePlanning
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.delta_stepping import (
+    DeltaSteppingAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.dynamic_shortest_paths import (
+    DynamicShortestPaths
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.edge_list_loader import (
+    EdgeListLoader
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.heuristics import (
+    LandmarksHeuristic,
+    euclidean_heuristic,
+    manhattan_heuristic,
+    zero_heuristic
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.modes import (
+    BellmanFordMode,
+    DijkstraQueueMode
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.resource_constrained_shortest_paths import (
+    ResourceConstrainedPath,
+    ResourceConstrainedShortestPaths
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Yen_algorithm import YenAlgorithm
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.vectorized_Bellman_Ford_algorithm import (
+    VectorizedBellmanFordAlgorithm
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _measure(action: Callable[[], object]) -> float:
+    start: float = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def build_path_graph(vertices_count: int) -> List[GraphNode]:
+    """
+    Строит граф-цепочку 0 -> 1 -> ... -> (vertices_count - 1) с единичными стоимостями ребер.
+    """
+
+    nodes: List[GraphNode] = [GraphNode(value) for value in range(vertices_count)]
+    for node_from, node_to in zip(nodes, nodes[1:]):
+        node_from.edges = [GraphEdge(node_from=node_from, node_to=node_to, cost=1)]
+
+    return nodes
+
+
+def build_grid_graph(width: int, height: int, max_cost: int = 10, seed: int = 0) -> List[GraphNode]:
+    """
+    Строит граф-решетку width x height, где каждая вершина соединена ребрами в обе стороны с соседями
+    по горизонтали и вертикали. Стоимости ребер - случайные целые числа от 1 до max_cost.
+    Вершина (column, row) имеет индекс row * width + column и координаты x=column, y=row.
+    """
+
+    generator: random.Random = random.Random(seed)
+    nodes: List[GraphNode] = [
+        AStarGraphNode((column, row), x=column, y=row) for row in range(height) for column in range(width)
+    ]
+    for row in range(height):
+        for column in range(width):
+            node_from: GraphNode = nodes[row * width + column]
+            for neighbor_column, neighbor_row in ((column + 1, row), (column - 1, row), (column, row + 1),
+                                                  (column, row - 1)):
+                if 0 <= neighbor_column < width and 0 <= neighbor_row < height:
+                    node_from.edges.append(
+                        GraphEdge(
+                            node_from=node_from,
+                            node_to=nodes[neighbor_row * width + neighbor_column],
+                            cost=generator.randint(1, max_cost)
+                        )
+                    )
+
+    return nodes
+
+
+class _PathCopyingDijkstraAlgorithm(DijkstraAlgorithm):
+    """
+    Алгоритм Дейкстры с прежней процедурой ослабления, которая копировала путь до вершины-родителя
+    при каждом успешном ослаблении. Используется только для сравнения.
+    """
+
+    def _relax(self, edge: GraphEdge) -> bool:
+        if edge.node_to.shortest_path_estimate > edge.node_from.shortest_path_estimate + edge.cost:
+            edge.node_to.shortest_path_estimate = edge.node_from.shortest_path_estimate + edge.cost
+            edge.node_to.parent = edge.node_from
+            edge.node_to.path_from_source = getattr(edge.node_from, 'path_from_source', []) + [edge]
+            return True
+
+        return False
+
+
+def benchmark_parent_tracking(vertices_count: int = 100_000, copying_vertices_count: int = 5_000) -> None:
+    """
+    Сравнивает ленивое восстановление пути по родительским ребрам с полным отключением запоминания родителей
+    на графе-цепочке. Прежнее копирование пути при каждом ослаблении требует O(V^2) времени и памяти
+    (для 100 000 вершин - около 40 ГБ ссылок), поэтому оно замеряется на меньшей цепочке вместе с новыми вариантами.
+    """
+
+    for count in (copying_vertices_count, vertices_count):
+        nodes: List[GraphNode] = build_path_graph(vertices_count=count)
+        print(f'Path graph with {count} vertices:')
+
+        algorithms = [
+            ('parent edges', DijkstraAlgorithm()),
+            ('no parents', DijkstraAlgorithm(track_parents=False)),
+        ]
+
+        if count <= copying_vertices_count:
+            algorithms.insert(0, ('path copying', _PathCopyingDijkstraAlgorithm()))
+
+        for name, algorithm in algorithms:
+            elapsed: float = _measure(lambda: algorithm.process_graph(roots=nodes, source_node=nodes[0]))
+            print(f'\t{name}: {elapsed:.3f} s')
+
+        # Путь до последней вершины восстанавливается по запросу за время O(V):
+        path_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+        path_algorithm.process_graph(roots=nodes, source_node=nodes[0])
+        elapsed = _measure(lambda: sum(1 for _ in path_algorithm.path_to(node_to=nodes[-1])))
+        print(f'\tlazy path_to for the last vertex: {elapsed:.3f} s')
+
+
+def benchmark_bidirectional_dijkstra(width: int = 200, height: int = 200, queries_count: int = 20) -> None:
+    """
+    Сравнивает двунаправленный поиск пути между парами случайных вершин решетки с полным алгоритмом Дейкстры
+    из исходной вершины по количеству обработанных вершин и времени работы.
+    """
+
+    nodes: List[GraphNode] = build_grid_graph(width=width, height=height)
+    generator: random.Random = random.Random(1)
+    pairs = [(generator.choice(nodes), generator.choice(nodes)) for _ in range(queries_count)]
+    print(f'Grid graph {width}x{height}, {queries_count} point-to-point queries:')
+
+    full_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    elapsed: float = _measure(
+        lambda: [full_algorithm.process_graph(roots=nodes, source_node=source) for source, _ in pairs]
+    )
+    print(f'\tfull Dijkstra: {elapsed:.3f} s, {len(nodes)} vertices settled per query')
+
+    bidirectional_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    bidirectional_algorithm.build_reverse_index(roots=nodes)
+    settled_counts: List[int] = []
+
+    def run_bidirectional_queries() -> None:
+        for source, target in pairs:
+            bidirectional_algorithm.shortest_path(source_node=source, target_node=target)
+            settled_counts.append(bidirectional_algorithm.settled_count)
+
+    elapsed = _measure(run_bidirectional_queries)
+    print(f'\tbidirectional Dijkstra: {elapsed:.3f} s, '
+          f'{sum(settled_counts) // len(settled_counts)} vertices settled per query on average')
+
+
+def benchmark_a_star_heuristics(width: int = 200, height: int = 200, queries_count: int = 20) -> None:
+    """
+    Сравнивает количество обработанных вершин и время работы A* с разными эвристиками на решетке,
+    где стоимость каждого ребра не меньше 1, а значит евклидова и манхэттенская эвристики допустимы.
+    """
+
+    nodes: List[GraphNode] = build_grid_graph(width=width, height=height)
+    generator: random.Random = random.Random(1)
+    pairs = [(generator.choice(nodes), generator.choice(nodes)) for _ in range(queries_count)]
+    print(f'Grid graph {width}x{height}, {queries_count} point-to-point queries:')
+
+    preprocessing_time: float = time.perf_counter()
+    landmarks_heuristic: LandmarksHeuristic = LandmarksHeuristic.with_farthest_landmarks(roots=nodes, landmarks_count=8)
+    preprocessing_time = time.perf_counter() - preprocessing_time
+    print(f'\tALT preprocessing with 8 landmarks: {preprocessing_time:.3f} s')
+
+    for name, heuristic in (('zero (Dijkstra)', zero_heuristic), ('euclidean', euclidean_heuristic),
+                            ('manhattan', manhattan_heuristic), ('ALT', landmarks_heuristic)):
+        algorithm: AStarAlgorithm = AStarAlgorithm(heuristic=heuristic)
+        settled_counts: List[int] = []
+
+        def run_queries() -> None:
+            for source, target in pairs:
+                algorithm.process_graph(roots=nodes, source_node=source, target_node=target)
+                settled_counts.append(algorithm.settled_count)
+
+        elapsed: float = _measure(run_queries)
+        print(f'\t{name}: {elapsed:.3f} s, {sum(settled_counts) // len(settled_counts)} vertices settled on average')
+
+
+def benchmark_contraction_hierarchies(width: int = 50, height: int = 50, queries_count: int = 200) -> None:
+    """
+    Сравнивает время запроса к иерархии сжатия со временем двунаправленного алгоритма Дейкстры.
+    """
+
+    nodes: List[GraphNode] = build_grid_graph(width=width, height=height)
+    generator: random.Random = random.Random(1)
+    pairs = [(generator.choice(nodes), generator.choice(nodes)) for _ in range(queries_count)]
+    print(f'Grid graph {width}x{height}, {queries_count} point-to-point queries:')
+
+    contraction_hierarchies: ContractionHierarchies = ContractionHierarchies()
+    elapsed: float = _measure(lambda: contraction_hierarchies.build(roots=nodes))
+    print(f'\tcontraction hierarchies preprocessing: {elapsed:.3f} s, '
+          f'{contraction_hierarchies.shortcuts_count} shortcuts added')
+
+    bidirectional_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    bidirectional_algorithm.build_reverse_index(roots=nodes)
+    elapsed = _measure(
+        lambda: [bidirectional_algorithm.shortest_path(source_node=source, target_node=target) for source, target in pairs]
+    )
+    print(f'\tbidirectional Dijkstra: {1000 * elapsed / queries_count:.3f} ms per query')
+
+    elapsed = _measure(
+        lambda: [contraction_hierarchies.shortest_path(source_node=source, target_node=target) for source, target in pairs]
+    )
+    print(f'\tcontraction hierarchies: {1000 * elapsed / queries_count:.3f} ms per query')
+
+
+def benchmark_dijkstra_queues(width: int = 200, height: int = 200, max_costs: Tuple[int, ...] = (10, 1000)) -> None:
+    """
+    Сравнивает реализации очереди с приоритетами в алгоритме Дейкстры на решетках со случайными целыми весами
+    как на объектах узлов, так и на CSR-представлении графа.
+    """
+
+    for max_cost in max_costs:
+        nodes: List[GraphNode] = build_grid_graph(width=width, height=height, max_cost=max_cost)
+        graph: CSRGraph = CSRGraph.from_nodes(roots=nodes)
+        print(f'Grid graph {width}x{height} with costs from 1 to {max_cost}:')
+
+        for queue_mode in DijkstraQueueMode:
+            algorithm: DijkstraAlgorithm = DijkstraAlgorithm(queue_mode=queue_mode, max_cost=max_cost)
+            nodes_time: float = _measure(lambda: algorithm.process_graph(roots=nodes, source_node=nodes[0]))
+            csr_time: float = _measure(lambda: algorithm.process_csr_graph(graph=graph, source=0))
+            print(f'\t{queue_mode.value}: nodes {nodes_time:.3f} s, CSR {csr_time:.3f} s')
+
+
+def benchmark_dynamic_shortest_paths(width: int = 200, height: int = 200, updates_count: int = 200) -> None:
+    """
+    Сравнивает исправление кратчайших путей после изменения стоимости случайного ребра
+    с полным пересчетом алгоритмом Дейкстры.
+    """
+
+    nodes: List[GraphNode] = build_grid_graph(width=width, height=height)
+    edges: List[GraphEdge] = [edge for node in nodes for edge in node.edges]
+    generator: random.Random = random.Random(0)
+    updates: List[Tuple[GraphEdge, int]] = [
+        (generator.choice(edges), generator.randint(1, 10)) for _ in range(updates_count)
+    ]
+
+    dynamic_shortest_paths: DynamicShortestPaths = DynamicShortestPaths()
+    dynamic_shortest_paths.process_graph(roots=nodes, source_node=nodes[0])
+    changed_count: int = 0
+    start: float = time.perf_counter()
+    for edge, cost in updates:
+        changed_count += len(dynamic_shortest_paths.update_edge(edge=edge, new_cost=cost))
+
+    dynamic_time: float = time.perf_counter() - start
+
+    dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    recompute_time: float = _measure(lambda: dijkstra_algorithm.process_graph(roots=nodes, source_node=nodes[0]))
+
+    print(f'Grid graph {width}x{height}, {updates_count} edge cost updates:')
+    print(f'\tIncremental update: {1000 * dynamic_time / updates_count:.3f} ms per update, '
+          f'{changed_count / updates_count:.1f} vertices changed on average')
+    print(f'\tFull recomputation: {1000 * recompute_time:.3f} ms per update')
+
+
+def benchmark_delta_stepping(
+        width: int = 300,
+        height: int = 300,
+        deltas: Tuple[float, ...] = (1, 3, 10, 30, 100)
+) -> None:
+    """
+    Сравнивает delta-stepping при разной ширине корзин с алгоритмом Дейкстры на CSR-представлении решетки.
+    """
+
+    graph: CSRGraph = CSRGraph.from_nodes(roots=build_grid_graph(width=width, height=height))
+    print(f'Grid graph {width}x{height}:')
+    print(f'\tDijkstra: {_measure(lambda: DijkstraAlgorithm().process_csr_graph(graph=graph, source=0)):.3f} s')
+
+    for delta in deltas:
+        for vectorized in ((False, True) if numpy is not None else (False,)):
+            algorithm: DeltaSteppingAlgorithm = DeltaSteppingAlgorithm(delta=delta, vectorized=vectorized)
+            elapsed: float = _measure(lambda: algorithm.process_csr_graph(graph=graph, source=0))
+            print(f'\tDelta-stepping, delta={delta}, {"NumPy" if vectorized else "pure Python"}: {elapsed:.3f} s')
+
+
+def benchmark_vectorized_bellman_ford(vertices_count: int = 100_000, edges_count: int = 1_000_000) -> None:
+    """
+    Сравнивает алгоритм Беллмана-Форда с остановкой после прохода без ослаблений и его векторизованную
+    реализацию на случайном графе.
+    """
+
+    if numpy is None:
+        print('NumPy is not installed, vectorized Bellman-Ford benchmark is skipped.')
+        return
+
+    generator: random.Random = random.Random(0)
+    graph: CSRGraph = CSRGraph.from_edge_list(
+        vertices_count=vertices_count,
+        edges=(
+            (generator.randrange(vertices_count), generator.randrange(vertices_count), generator.randint(1, 100))
+            for _ in range(edges_count)
+        )
+    )
+
+    mode: BellmanFordMode = BellmanFordMode.EARLY_TERMINATION
+    python_time: float = _measure(lambda: BellmanFordAlgorithm(mode=mode).process_csr_graph(graph=graph, source=0))
+    numpy_time: float = _measure(
+        lambda: VectorizedBellmanFordAlgorithm(mode=mode).process_csr_graph(graph=graph, source=0)
+    )
+
+    print(f'Random graph with {vertices_count} vertices and {edges_count} edges:')
+    print(f'\tBellman-Ford: {python_time:.3f} s')
+    print(f'\tVectorized Bellman-Ford: {numpy_time:.3f} s, speedup {python_time / numpy_time:.1f}x')
+
+
+def benchmark_k_shortest_paths(width: int = 100, height: int = 100, paths_counts: Tuple[int, ...] = (1, 10, 50)) -> None:
+    """
+    Замеряет время получения первых k путей алгоритмом Йена между противоположными углами решетки.
+    """
+
+    nodes: List[GraphNode] = build_grid_graph(width=width, height=height)
+    yen_algorithm: YenAlgorithm = YenAlgorithm()
+    print(f'Grid graph {width}x{height}:')
+
+    for paths_count in paths_counts:
+        paths: List[Tuple[float, List[GraphEdge]]] = []
+        elapsed: float = _measure(
+            lambda: paths.extend(
+                itertools.islice(
+                    yen_algorithm.k_shortest_paths(roots=nodes, source_node=nodes[0], target_node=nodes[-1]),
+                    paths_count
+                )
+            )
+        )
+        print(f'\t{paths_count} shortest paths: {elapsed:.3f} s, costs from {paths[0][0]} to {paths[-1][0]}, '
+              f'{yen_algorithm.spur_searches_count} spur searches')
+
+
+def benchmark_edge_list_loader(lines_count: int = 1_000_000, vertices_count: int = 100_000) -> None:
+    """
+    Замеряет скорость загрузки случайного графа из текстового файла и из файла, сжатого gzip, в ребрах в секунду.
+    Для замера на файле из 100 миллионов строк достаточно передать lines_count=100_000_000
+    (файл займет на диске около 2 Гб).
+    """
+
+    generator: random.Random = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        for file_name, open_file in (('edges.txt', open), ('edges.txt.gz', gzip.open)):
+            path: str = os.path.join(directory, file_name)
+            with open_file(path, 'wt', encoding='utf-8') as file:
+                for _ in range(lines_count // 10_000):
+                    file.write(''.join(
+                        f'{generator.randrange(vertices_count)} {generator.randrange(vertices_count)} '
+                        f'{generator.randint(1, 100)}\n'
+                        for _ in range(10_000)
+                    ))
+
+            graph: List[CSRGraph] = []
+            elapsed: float = _measure(lambda: graph.append(EdgeListLoader().load_csr(path=path)))
+            print(f'{file_name} ({os.path.getsize(path) / 2 ** 20:.1f} Mb): {graph[0]} loaded in {elapsed:.3f} s, '
+                  f'{graph[0].edges_count / elapsed:,.0f} edges/s')
+
+
+def benchmark_constrained_shortest_paths(
+        width: int = 354,
+        height: int = 354,
+        hops_limits: Tuple[int, ...] = (706, 725, 1000),
+        query_offsets: Tuple[int, ...] = (50, 100),
+        budget_ratios: Tuple[float, ...] = (1.0, 0.9, 0.8, 0.7)
+) -> None:
+    """
+    Замеряет поиск кратчайших путей с ограничением на количество ребер и на расход ресурса на решетке
+    из 500 тысяч ребер. Кратчайший путь между противоположными углами решетки содержит не менее
+    width + height - 2 ребер, поэтому меньшие ограничения не оставляют ни одного пути.
+    Ресурс ребер - случайные целые числа от 1 до 10, не зависящие от стоимостей. Бюджет задается долей
+    расхода ресурса на кратчайшем пути без ограничения: чем меньше доля, тем больше Парето-оптимальных меток.
+    """
+
+    graph: CSRGraph = CSRGraph.from_nodes(roots=build_grid_graph(width=width, height=height))
+    print(f'Grid graph {width}x{height} with {graph.edges_count} edges:')
+    print(f'\tDijkstra: {_measure(lambda: DijkstraAlgorithm().process_csr_graph(graph=graph, source=0)):.3f} s')
+
+    for max_hops in hops_limits:
+        algorithm: BellmanFordAlgorithm = BellmanFordAlgorithm(mode=BellmanFordMode.HOP_LIMITED, max_hops=max_hops)
+        results: List[ShortestPathsResult] = []
+        elapsed: float = _measure(lambda: results.append(algorithm.process_csr_graph(graph=graph, source=0)))
+        print(f'\tBellman-Ford, at most {max_hops} edges: {elapsed:.3f} s, '
+              f'corner to corner costs {results[0].distances[graph.vertices_count - 1]}')
+
+    generator: random.Random = random.Random(1)
+    resources: array = array('d', (generator.randint(1, 10) for _ in range(graph.edges_count)))
+    for query_offset in query_offsets:
+        target: int = query_offset * width + query_offset
+        unconstrained: Optional[ResourceConstrainedPath] = ResourceConstrainedShortestPaths(
+            budget=math.inf
+        ).process_csr_graph(graph=graph, resources=resources, source=0, target=target)
+
+        for budget_ratio in budget_ratios:
+            solver: ResourceConstrainedShortestPaths = ResourceConstrainedShortestPaths(
+                budget=budget_ratio * unconstrained.resource
+            )
+            paths: List[Optional[ResourceConstrainedPath]] = []
+            elapsed = _measure(
+                lambda: paths.append(
+                    solver.process_csr_graph(graph=graph, resources=resources, source=0, target=target)
+                )
+            )
+            print(f'\tResource constrained path to ({query_offset}, {query_offset}), '
+                  f'budget {budget_ratio:.0%}: {elapsed:.3f} s, cost {paths[0].cost}, resource {paths[0].resource}, '
+                  f'{solver.labels_count} labels, {solver.dominated_count} dominated')
+
+
+def benchmark_customizable_route_planning(
+        width: int = 200,
+        height: int = 200,
+        cell_sizes: Sequence[int] = (64, 1024),
+        queries_count: int = 20,
+        updates_count: int = 10
+) -> None:
+    """
+    Сравнивает запросы CRP с алгоритмом Дейкстры на решетке, а также замеряет настройку всех ячеек
+    в одном и в нескольких процессах и перенастройку после изменения весов нескольких ребер.
+    """
+
+    graph: CSRGraph = CSRGraph.from_nodes(roots=build_grid_graph(width=width, height=height))
+    route_planning: CustomizableRoutePlanning = CustomizableRoutePlanning(cell_sizes=cell_sizes)
+    preprocess_time: float = _measure(lambda: route_planning.preprocess_csr(graph=graph))
+    print(f'Grid graph {width}x{height}, cell sizes {tuple(cell_sizes)}:')
+    for level in range(route_planning.levels_count):
+        print(f'\tLevel {level}: {route_planning.get_cells_count(level=level)} cells, '
+              f'{route_planning.get_boundary_vertices_count(level=level)} boundary vertices, '
+              f'{route_planning.get_overlay_edges_count(level=level)} overlay edges')
+    print(f'\tPreprocessing with customization: {preprocess_time:.3f} s')
+
+    for workers_count in sorted({1, os.cpu_count() or 1, 4}):
+        parallel_route_planning: CustomizableRoutePlanning = CustomizableRoutePlanning(
+            cell_sizes=cell_sizes,
+            max_workers=workers_count
+        )
+        parallel_route_planning.preprocess_csr(graph=graph)
+        print(f'\tCustomization, {workers_count} workers: {_measure(parallel_route_planning.customize):.3f} s')
+
+    generator: random.Random = random.Random(0)
+    queries: List[Tuple[int, int]] = [
+        (generator.randrange(graph.vertices_count), generator.randrange(graph.vertices_count))
+        for _ in range(queries_count)
+    ]
+
+    dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    dijkstra_time: float = _measure(
+        lambda: [dijkstra_algorithm.process_csr_graph(graph=graph, source=source) for source, _ in queries]
+    )
+
+    # A* с нулевой эвристикой - алгоритм Дейкстры, останавливающийся при извлечении конечной вершины:
+    point_to_point_algorithm: AStarAlgorithm = AStarAlgorithm()
+    point_to_point_settled_count: int = 0
+
+    def run_point_to_point_queries() -> None:
+        nonlocal point_to_point_settled_count
+        for source, target in queries:
+            point_to_point_algorithm.process_csr_graph(graph=graph, source=source, target=target)
+            point_to_point_settled_count += point_to_point_algorithm.settled_count
+
+    point_to_point_time: float = _measure(run_point_to_point_queries)
+    settled_counts: List[int] = []
+
+    def run_queries() -> None:
+        for source, target in queries:
+            route_planning.query(source=source, target=target)
+            settled_counts.append(route_planning.settled_count)
+
+    query_time: float = _measure(run_queries)
+    print(f'\tDijkstra to all vertices: {1000 * dijkstra_time / queries_count:.3f} ms per query')
+    print(f'\tPoint-to-point Dijkstra: {1000 * point_to_point_time / queries_count:.3f} ms per query, '
+          f'{point_to_point_settled_count / queries_count:.0f} vertices settled on average')
+    print(f'\tCRP: {1000 * query_time / queries_count:.3f} ms per query, '
+          f'{sum(settled_counts) / queries_count:.0f} vertices settled on average')
+
+    costs: Dict[int, float] = {
+        generator.randrange(graph.edges_count): generator.randint(1, 10) for _ in range(updates_count)
+    }
+    changed_cells: List[Set[int]] = []
+    update_time: float = _measure(lambda: changed_cells.append(route_planning.update_edge_costs(costs=costs)))
+    print(f'\tUpdate of {len(costs)} edges: {update_time:.3f} s, '
+          f'{sum(len(level_cells) for level_cells in changed_cells[0])} cells customized again')
+
+
+if __name__ == '__main__':
+    benchmark_parent_tracking()
+    benchmark_bidirectional_dijkstra()
+    benchmark_a_star_heuristics()
+    benchmark_contraction_hierarchies()
+    benchmark_dijkstra_queues()
+    benchmark_dynamic_shortest_paths()
+    benchmark_delta_stepping()
+    benchmark_vectorized_bellman_ford()
+    benchmark_k_shortest_paths()
+    benchmark_edge_list_loader()
+    benchmark_constrained_shortest_paths()
+    benchmark_customizable_route_planning()
@@ -0,0 +1,450 @@
+"""
+Иерархии сжатия (Contraction Hierarchies) - метод предварительной обработки статического взвешенного
+ориентированного графа с неотрицательными весами ребер, после которой кратчайший путь между любыми двумя вершинами
+находится за доли миллисекунды.
+
+Предварительная обработка:
+1) Вершины по очереди "сжимаются" (удаляются из графа) в порядке возрастания приоритета. Приоритетом служит
+   разность ребер (edge difference): количество ребер-сокращений, которые придется добавить при сжатии вершины,
+   минус количество удаляемых вместе с ней ребер, плюс количество уже сжатых соседей вершины
+   (чтобы сжатие равномерно распределялось по графу). После сжатия вершины приоритеты ее соседей пересчитываются,
+   а приоритеты остальных вершин - лениво: извлеченная из очереди вершина получает актуальный приоритет
+   и возвращается в очередь, если он больше приоритета следующей вершины.
+2) При сжатии вершины v для каждой пары ребер (u, v) и (v, x) проверяется, существует ли путь от u до x в обход v,
+   не дороже пути u -> v -> x (поиск свидетеля - ограниченный поиск Дейкстры из u). Если такого пути нет,
+   в граф добавляется ребро-сокращение (u, x) со стоимостью cost(u, v) + cost(v, x).
+3) Номер вершины в порядке сжатия называется ее рангом. Каждое ребро, исходное или сокращение, ведет либо вверх
+   (в вершину большего ранга), либо вниз. Ребра, ведущие вверх, образуют восходящий граф, а ребра, ведущие вниз,
+   после обращения - нисходящий граф. Оба графа хранятся в CSR-представлении.
+
+Запрос - двунаправленный поиск Дейкстры, в котором прямой поиск из исходной вершины идет только по восходящему
+графу, а обратный поиск из конечной вершины - только по нисходящему. Каждый из них обрабатывает лишь небольшую часть
+вершин с наибольшими рангами. Найденный путь состоит из ребер-сокращений, которые рекурсивно раскрываются в исходные
+ребра через запомненную для каждого сокращения промежуточную вершину.
+
+Иерархия сохраняется на диск в формате graph_file.py и открывается через mmap без копирования данных.
+
+Граф для теста - случайный ориентированный граф, кратчайшие пути в котором сверяются с алгоритмом Дейкстры.
+
+Асимптоматическая скорость предварительной обработки зависит от структуры графа и на дорожных графах близка
+к O(V log(V)), а скорость запроса - к O(log(V)), где V - количество вершин графа.
+"""
+
+
+from __future__ import annotations
+import math
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.graph_file import (
+    MappedGraphFile,
+    write_graph_file
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.indexed_min_heap import IndexedMinHeap
+
+
+UPWARD_GRAPH_SUFFIX: str = '.upward.csr'
+DOWNWARD_GRAPH_SUFFIX: str = '.downward.csr'
+SHORTCUTS_SUFFIX: str = '.shortcuts'
+
+
+class ContractionHierarchies:
+
+    def __init__(self, witness_search_limit: int = 100) -> None:
+        """
+        :param witness_search_limit: Максимальное количество вершин, обрабатываемых одним поиском свидетеля.
+        Если свидетель не найден за это количество шагов, добавляется сокращение, возможно, лишнее. Лишние сокращения
+        не влияют на корректность запросов, а лишь немного замедляют их.
+        """
+
+        self._witness_search_limit: int = witness_search_limit
+        self._graph: Optional[CSRGraph] = None
+        self._ranks: array = array('l')
+        self._upward_graph: Optional[CSRGraph] = None
+        self._downward_graph: Optional[CSRGraph] = None  # Нисходящие ребра, обращенные к вершинам большего ранга
+        self._shortcut_middles: Dict[Tuple[int, int], int] = {}
+        self._mapped_files: List[MappedGraphFile] = []
+        self._settled_count: int = 0
+
+    def build(self, roots: List[GraphNode]) -> None:
+        self.build_csr(graph=CSRGraph.from_nodes(roots=roots))
+
+    def build_csr(self, graph: CSRGraph) -> None:
+        self._graph = graph
+        vertices_count: int = graph.vertices_count
+
+        # Рабочий граф, из которого удаляются сжатые вершины. Из параллельных ребер остается самое дешевое:
+        out_edges: List[Dict[int, float]] = [{} for _ in range(vertices_count)]
+        in_edges: List[Dict[int, float]] = [{} for _ in range(vertices_count)]
+        for node_from in range(vertices_count):
+            for node_to, cost in graph.edges(node_from):
+                if cost < 0:
+                    raise ValueError('Contraction hierarchies require non-negative edge costs.')
+
+                if node_to != node_from and cost < out_edges[node_from].get(node_to, math.inf):
+                    out_edges[node_from][node_to] = cost
+                    in_edges[node_to][node_from] = cost
+
+        contracted_neighbors: List[int] = [0] * vertices_count
+        self._ranks = array('l', [-1]) * vertices_count
+        self._shortcut_middles = {}
+
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        for vertex in range(vertices_count):
+            priority, _ = self._simulate_contraction(
+                vertex=vertex,
+                out_edges=out_edges,
+                in_edges=in_edges,
+                contracted_neighbors=contracted_neighbors
+            )
+            priority_queue.push(key=vertex, priority=priority)
+
+        upward_edges: List[Tuple[int, int, float]] = []
+        downward_edges: List[Tuple[int, int, float]] = []
+        rank: int = 0
+        while not priority_queue.is_empty():
+            vertex, _ = priority_queue.pop_min()
+            priority, shortcuts = self._simulate_contraction(
+                vertex=vertex,
+                out_edges=out_edges,
+                in_edges=in_edges,
+                contracted_neighbors=contracted_neighbors
+            )
+
+            # Ленивое обновление: приоритет устарел и вершина больше не минимальная - возвращаем ее в очередь:
+            if not priority_queue.is_empty() and priority > priority_queue.peek_min()[1]:
+                priority_queue.push(key=vertex, priority=priority)
+                continue
+
+            self._ranks[vertex] = rank
+            rank += 1
+
+            # Все оставшиеся ребра вершины ведут к еще не сжатым вершинам, то есть к вершинам большего ранга:
+            neighbors: Set[int] = set()
+            for node_to, cost in out_edges[vertex].items():
+                upward_edges.append((vertex, node_to, cost))
+                del in_edges[node_to][vertex]
+                neighbors.add(node_to)
+
+            for node_from, cost in in_edges[vertex].items():
+                downward_edges.append((vertex, node_from, cost))
+                del out_edges[node_from][vertex]
+                neighbors.add(node_from)
+
+            for node_from, node_to, cost in shortcuts:
+                if cost < out_edges[node_from].get(node_to, math.inf):
+                    out_edges[node_from][node_to] = cost
+                    in_edges[node_to][node_from] = cost
+                    self._shortcut_middles[(node_from, node_to)] = vertex
+
+            out_edges[vertex] = {}
+            in_edges[vertex] = {}
+
+            # Сжатие меняет окрестность соседей, поэтому их приоритеты пересчитываются сразу:
+            for neighbor in neighbors:
+                contracted_neighbors[neighbor] += 1
+                neighbor_priority, _ = self._simulate_contraction(
+                    vertex=neighbor,
+                    out_edges=out_edges,
+                    in_edges=in_edges,
+                    contracted_neighbors=contracted_neighbors
+                )
+                priority_queue.change_priority(key=neighbor, priority=neighbor_priority)
+
+        self._upward_graph = CSRGraph.from_edge_list(vertices_count=vertices_count, edges=upward_edges)
+        self._downward_graph = CSRGraph.from_edge_list(vertices_count=vertices_count, edges=downward_edges)
+
+    def _simulate_contraction(
+            self,
+            vertex: int,
+            out_edges: List[Dict[int, float]],
+            in_edges: List[Dict[int, float]],
+            contracted_neighbors: List[int]
+    ) -> Tuple[int, List[Tuple[int, int, float]]]:
+        """
+        Возвращает приоритет вершины и сокращения, которые потребуются при ее сжатии.
+        """
+
+        shortcuts: List[Tuple[int, int, float]] = self._find_shortcuts(
+            vertex=vertex,
+            out_edges=out_edges,
+            in_edges=in_edges
+        )
+
+        removed_edges_count: int = len(out_edges[vertex]) + len(in_edges[vertex])
+        return len(shortcuts) - removed_edges_count + contracted_neighbors[vertex], shortcuts
+
+    def _find_shortcuts(
+            self,
+            vertex: int,
+            out_edges: List[Dict[int, float]],
+            in_edges: List[Dict[int, float]]
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Возвращает сокращения (u, x, стоимость), необходимые при сжатии вершины.
+        Для каждой входящей вершины u выполняется один поиск свидетелей сразу для всех исходящих вершин x.
+        """
+
+        shortcuts: List[Tuple[int, int, float]] = []
+        for node_from, cost_in in in_edges[vertex].items():
+            if not out_edges[vertex]:
+                break
+
+            limit: float = cost_in + max(out_edges[vertex].values())
+            distances: Dict[int, float] = self._witness_search(
+                source=node_from,
+                excluded=vertex,
+                limit=limit,
+                out_edges=out_edges
+            )
+
+            for node_to, cost_out in out_edges[vertex].items():
+                if node_to != node_from and distances.get(node_to, math.inf) > cost_in + cost_out:
+                    shortcuts.append((node_from, node_to, cost_in + cost_out))
+
+        return shortcuts
+
+    def _witness_search(
+            self,
+            source: int,
+            excluded: int,
+            limit: float,
+            out_edges: List[Dict[int, float]]
+    ) -> Dict[int, float]:
+        distances: Dict[int, float] = {source: 0}
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        priority_queue.push(key=source, priority=0)
+        settled_count: int = 0
+
+        while not priority_queue.is_empty() and settled_count < self._witness_search_limit:
+            node, distance = priority_queue.pop_min()
+            if distance > limit:
+                break
+
+            settled_count += 1
+            for node_to, cost in out_edges[node].items():
+                if node_to != excluded and distance + cost < distances.get(node_to, math.inf):
+                    distances[node_to] = distance + cost
+                    priority_queue.push_or_decrease_key(key=node_to, priority=distance + cost)
+
+        return distances
+
+    def query(self, source: int, target: int) -> Tuple[Union[int, float], List[int]]:
+        """
+        Ищет кратчайший путь между вершинами с указанными идентификаторами.
+
+        :return: Стоимость кратчайшего пути и вершины пути по порядку. Если пути нет - math.inf и пустой список.
+        """
+
+        if self._upward_graph is None:
+            raise ValueError('Hierarchy is not built. Call build, build_csr or load first.')
+
+        self._settled_count = 0
+        graphs: Tuple[CSRGraph, CSRGraph] = (self._upward_graph, self._downward_graph)
+        distances: Tuple[Dict[int, float], ...] = ({source: 0}, {target: 0})
+        parents: Tuple[Dict[int, int], ...] = ({source: -1}, {target: -1})
+        priority_queues: Tuple[IndexedMinHeap, ...] = (IndexedMinHeap(), IndexedMinHeap())
+        priority_queues[0].push(key=source, priority=0)
+        priority_queues[1].push(key=target, priority=0)
+
+        best_cost: float = 0 if source == target else math.inf
+        meeting_vertex: int = source if source == target else -1
+
+        while True:
+            # Поиск в направлении продолжается, пока минимальный приоритет его очереди меньше лучшей стоимости:
+            active_directions: List[int] = [
+                direction for direction in (0, 1)
+                if not priority_queues[direction].is_empty() and priority_queues[direction].peek_min()[1] < best_cost
+            ]
+
+            if not active_directions:
+                break
+
+            direction: int = min(active_directions, key=lambda active: priority_queues[active].peek_min()[1])
+            node, distance = priority_queues[direction].pop_min()
+            self._settled_count += 1
+
+            for node_to, cost in graphs[direction].edges(node):
+                if distance + cost < distances[direction].get(node_to, math.inf):
+                    distances[direction][node_to] = distance + cost
+                    parents[direction][node_to] = node
+                    priority_queues[direction].push_or_decrease_key(key=node_to, priority=distance + cost)
+
+                    if node_to in distances[1 - direction]:
+                        candidate_cost: float = distance + cost + distances[1 - direction][node_to]
+                        if candidate_cost < best_cost:
+                            best_cost = candidate_cost
+                            meeting_vertex = node_to
+
+        if meeting_vertex == -1:
+            return math.inf, []
+
+        return best_cost, self._unpack_path(meeting_vertex=meeting_vertex, parents=parents)
+
+    def _unpack_path(self, meeting_vertex: int, parents: Tuple[Dict[int, int], ...]) -> List[int]:
+        hierarchy_path: List[int] = []
+        vertex: int = meeting_vertex
+        while vertex != -1:
+            hierarchy_path.append(vertex)
+            vertex = parents[0][vertex]
+
+        hierarchy_path.reverse()
+        vertex = parents[1][meeting_vertex]
+        while vertex != -1:
+            hierarchy_path.append(vertex)
+            vertex = parents[1][vertex]
+
+        # Раскрываем сокращения явным стеком, чтобы не упереться в глубину рекурсии:
+        path: List[int] = [hierarchy_path[0]]
+        for node_from, node_to in zip(hierarchy_path, hierarchy_path[1:]):
+            stack: List[Tuple[int, int]] = [(node_from, node_to)]
+            while stack:
+                edge_from, edge_to = stack.pop()
+                middle: Optional[int] = self._shortcut_middles.get((edge_from, edge_to))
+                if middle is None:
+                    path.append(edge_to)
+                else:
+                    stack.append((middle, edge_to))
+                    stack.append((edge_from, middle))
+
+        return path
+
+    def shortest_path(self, source_node: GraphNode, target_node: GraphNode) -> Tuple[Union[int, float], List[GraphNode]]:
+        """
+        Аналог query для узлов графа, по которым была построена иерархия через build.
+        """
+
+        if self._graph is None or self._graph.labels is None:
+            raise ValueError('Hierarchy was not built from graph nodes.')
+
+        cost, path = self.query(source=self._graph.vertex_id(source_node), target=self._graph.vertex_id(target_node))
+        return cost, [self._graph.label(vertex) for vertex in path]
+
+    def save(self, path: str) -> None:
+        """
+        Сохраняет иерархию в три файла: восходящий и нисходящий графы в формате graph_file.py
+        и список сокращений в виде троек (u, x, промежуточная вершина) из целых чисел int64 little-endian.
+        """
+
+        if self._upward_graph is None:
+            raise ValueError('Hierarchy is not built. Call build, build_csr or load first.')
+
+        write_graph_file(path=path + UPWARD_GRAPH_SUFFIX, graph=self._upward_graph)
+        write_graph_file(path=path + DOWNWARD_GRAPH_SUFFIX, graph=self._downward_graph)
+
+        shortcuts: array = array('q')
+        for (node_from, node_to), middle in self._shortcut_middles.items():
+            shortcuts.extend((node_from, node_to, middle))
+
+        if sys.byteorder == 'big':
+            shortcuts.byteswap()
+
+        with open(path + SHORTCUTS_SUFFIX, 'wb') as file:
+            file.write(shortcuts.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> ContractionHierarchies:
+        """
+        Открывает сохраненную иерархию. Графы отображаются в память и не копируются, поэтому после работы
+        иерархию необходимо закрыть через close(). Запросы выполняются по идентификаторам вершин.
+        """
+
+        hierarchies: ContractionHierarchies = cls()
+        hierarchies._mapped_files = [
+            MappedGraphFile(path=path + UPWARD_GRAPH_SUFFIX),
+            MappedGraphFile(path=path + DOWNWARD_GRAPH_SUFFIX),
+        ]
+        hierarchies._upward_graph = hierarchies._mapped_files[0].graph
+        hierarchies._downward_graph = hierarchies._mapped_files[1].graph
+
+        with open(path + SHORTCUTS_SUFFIX, 'rb') as file:
+            shortcuts: array = array('q', file.read())
+
+        if sys.byteorder == 'big':
+            shortcuts.byteswap()
+
+        for index in range(0, len(shortcuts), 3):
+            hierarchies._shortcut_middles[(shortcuts[index], shortcuts[index + 1])] = shortcuts[index + 2]
+
+        return hierarchies
+
+    def close(self) -> None:
+        for mapped_file in self._mapped_files:
+            mapped_file.close()
+
+        self._mapped_files.clear()
+        self._upward_graph = None
+        self._downward_graph = None
+
+    @property
+    def ranks(self) -> Sequence[int]:
+        return self._ranks
+
+    @property
+    def shortcuts_count(self) -> int:
+        return len(self._shortcut_middles)
+
+    @property
+    def settled_count(self) -> int:
+        """
+        Количество вершин, извлеченных из очередей во время последнего запроса.
+        """
+
+        return self._settled_count
+
+
+if __name__ == '__main__':
+    import os
+    import random
+    import tempfile
+
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+        DijkstraAlgorithm
+    )
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphEdge
+
+    # Рандомизированная перекрестная проверка: результаты запросов должны в точности совпадать с алгоритмом Дейкстры.
+    generator: random.Random = random.Random(24)
+    dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    checked_pairs_count: int = 0
+    for _ in range(50):
+        nodes: List[GraphNode] = [GraphNode(value) for value in range(generator.randint(1, 40))]
+        for _ in range(generator.randint(0, 4 * len(nodes))):
+            graph_node_from: GraphNode = generator.choice(nodes)
+            graph_node_to: GraphNode = generator.choice(nodes)
+            graph_node_from.edges.append(
+                GraphEdge(node_from=graph_node_from, node_to=graph_node_to, cost=generator.randint(0, 20))
+            )
+
+        contraction_hierarchies: ContractionHierarchies = ContractionHierarchies()
+        contraction_hierarchies.build(roots=nodes)
+        for graph_source in nodes:
+            dijkstra_algorithm.process_graph(roots=nodes, source_node=graph_source)
+            for graph_target in nodes:
+                path_cost, path_nodes = contraction_hierarchies.shortest_path(
+                    source_node=graph_source,
+                    target_node=graph_target
+                )
+
+                assert path_cost == graph_target.shortest_path_estimate, (path_cost, graph_target.shortest_path_estimate)
+                if path_nodes:
+                    # Путь должен состоять из существующих ребер и стоить ровно path_cost:
+                    assert path_nodes[0] is graph_source and path_nodes[-1] is graph_target
+                    assert path_cost == sum(
+                        min(edge.cost for edge in path_from.edges if edge.node_to is path_to)
+                        for path_from, path_to in zip(path_nodes, path_nodes[1:])
+                    )
+
+                checked_pairs_count += 1
+
+    print(f'{checked_pairs_count} random queries match Dijkstra algorithm.')
+
+    hierarchy_path: str = os.path.join(tempfile.mkdtemp(), 'hierarchy')
+    contraction_hierarchies.save(path=hierarchy_path)
+    loaded_hierarchies: ContractionHierarchies = ContractionHierarchies.load(path=hierarchy_path)
+    print(f'Path from 0 to {len(nodes) - 1} in loaded hierarchy is {loaded_hierarchies.query(0, len(nodes) - 1)}, '
+          f'in built hierarchy is {contraction_hierarchies.query(0, len(nodes) - 1)}.')
+    loaded_hierarchies.close()
@@ -0,0 +1,523 @@
+"""
+Настраиваемое планирование маршрутов (Customizable Route Planning, CRP) - метод поиска кратчайших путей
+в огромных графах с неотрицательными весами ребер, веса которых могут часто меняться (пробки, перекрытия дорог).
+
+В отличие от иерархий сжатия (см. contraction_hierarchies.py), предварительная обработка разделена на две фазы:
+1) Независимая от весов фаза (preprocess): граф разбивается на ячейки нулевого уровня с небольшим количеством
+   граничных вершин (см. graph_partitioner.py). Ячейки каждого следующего уровня объединяют соседние ячейки
+   предыдущего уровня, поэтому ячейки вложены друг в друга. Граничной вершиной уровня называется вершина,
+   инцидентная ребру между разными ячейками этого уровня (разрезающему ребру). Граничные вершины уровня
+   являются и граничными вершинами всех предыдущих уровней.
+2) Настройка (customize): для каждой ячейки считаются стоимости кратчайших путей внутри ячейки между всеми
+   парами ее граничных вершин (клика ячейки) - по одному поиску Дейкстры из каждой граничной вершины по локальному
+   графу ячейки. Для ячейки нулевого уровня это ее исходные ребра, а для ячейки уровня l > 0 - граф из граничных
+   вершин уровня l - 1, лежащих в ячейке, с ребрами клик уровня l - 1 и разрезающими ребрами уровня l - 1.
+   Уровни настраиваются снизу вверх, а ячейки одного уровня независимы и настраиваются параллельно в процессах
+   ProcessPoolExecutor. При изменении весов перенастраиваются только ячейки, содержащие измененные ребра,
+   и объемлющие их ячейки более высоких уровней.
+
+Запрос - поиск Дейкстры по многоуровневому оверлею. Уровнем вершины v в запросе из s в t называется количество
+уровней, на которых ячейка v отличается от ячеек s и t. Из вершины уровня 0 поиск идет по исходным ребрам,
+а из вершины уровня l > 0 - по ребрам клики ее ячейки уровня l - 1 и по разрезающим ребрам, покидающим эту ячейку.
+Таким образом, вблизи исходной и конечной вершин поиск идет по исходному графу, а вдали от них - по крупным
+ячейкам верхних уровней, не заходя внутрь ячеек. Массивы расстояний заменены словарями, поэтому рабочее
+множество запроса пропорционально количеству обработанных вершин, а не размеру графа.
+Ребро клики в найденном пути раскрывается поиском Дейкстры по локальному графу соответствующей ячейки,
+ребра клик которого раскрываются тем же способом на уровень ниже. Поиск останавливается, как только извлекает
+конец ребра клики, а локальный граф ячейки строится один раз и переиспользуется запросами, пока ячейка
+не будет перенастроена.
+
+Граф для теста - случайный ориентированный граф, кратчайшие пути в котором сверяются с алгоритмом Дейкстры
+до и после изменения весов.
+
+Асимптоматическая скорость настройки ячейки составляет O(B (C + E_c) log(C)), где B - количество граничных вершин
+ячейки, C - количество вершин ее локального графа, а E_c - количество его ребер. Запрос обрабатывает вершины
+двух ячеек нулевого уровня и граничные вершины ячеек верхних уровней вместо O(V) вершин у алгоритма Дейкстры.
+"""
+
+
+from __future__ import annotations
+import math
+import os
+from array import array
+from bisect import bisect_right
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsResult
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.graph_partitioner import (
+    GraphPartitioner
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.indexed_min_heap import IndexedMinHeap
+
+
+ORIGINAL_EDGE: int = -1  # Уровень "ребра клики", которое на самом деле является исходным ребром графа
+
+
+def _customize_cell(cell_graph: CSRGraph, boundary: Sequence[int]) -> array:
+    """
+    Стоимости кратчайших путей по локальному графу ячейки между всеми парами граничных вершин
+    в виде плоского массива B x B. Вызывается как в текущем процессе, так и в рабочих процессах,
+    поэтому объявлена на уровне модуля.
+    """
+
+    dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    clique: array = array('d')
+    for vertex in boundary:
+        distances: array = dijkstra_algorithm.process_csr_graph(graph=cell_graph, source=vertex).distances
+        clique.extend(distances[boundary_vertex] for boundary_vertex in boundary)
+
+    return clique
+
+
+class CustomizableRoutePlanning:
+
+    def __init__(self, cell_sizes: Sequence[int] = (256, 4096), max_workers: Optional[int] = 1) -> None:
+        """
+        :param cell_sizes: Наибольшее количество вершин графа в ячейке каждого уровня, по возрастанию.
+        Ячейка уровня l > 0 объединяет не более cell_sizes[l] // cell_sizes[l - 1] ячеек уровня l - 1.
+        :param max_workers: Количество рабочих процессов настройки. None - количество ядер процессора.
+        Если равно 1, ячейки настраиваются в текущем процессе.
+        """
+
+        if not cell_sizes or any(size <= 0 for size in cell_sizes):
+            raise ValueError(f'Cell sizes={cell_sizes} must be a non-empty sequence of positive numbers.')
+
+        if any(larger_size < size for size, larger_size in zip(cell_sizes, cell_sizes[1:])):
+            raise ValueError(f'Cell sizes={cell_sizes} must not decrease.')
+
+        self._cell_sizes: Sequence[int] = cell_sizes
+        self._max_workers: int = max_workers or os.cpu_count() or 1
+
+        self._graph: Optional[CSRGraph] = None
+        self._weights: array = array('d')  # Текущие веса ребер графа, изменяемые через update_edge_costs
+        self._edge_ids: Dict[int, int] = {}  # id(GraphEdge) -> номер ребра, если граф построен по узлам
+
+        # Все списки индексируются уровнем, а затем номером ячейки уровня:
+        self._cells: List[array] = []  # Номер ячейки уровня для каждой вершины графа
+        self._members: List[List[array]] = []  # Вершины локальных графов ячеек
+        self._boundaries: List[List[array]] = []  # Граничные вершины ячеек
+        self._boundary_positions: List[array] = []  # Позиция граничной вершины в списке ее ячейки, иначе -1
+        self._cliques: List[List[array]] = []
+        # Локальные графы ячеек для раскрытия путей, построенные при первом обращении; (уровень, ячейка) -> граф:
+        self._cell_graphs: Dict[Tuple[int, int], Tuple[CSRGraph, array, Dict[int, int]]] = {}
+
+        self._settled_count: int = 0
+
+    def preprocess(self, roots: List[GraphNode]) -> None:
+        graph: CSRGraph = CSRGraph.from_nodes(roots=roots)
+        self._edge_ids = {
+            id(edge): index for index, edge in enumerate(edge for node in graph.labels for edge in node.edges)
+        }
+        self.preprocess_csr(graph=graph)
+
+    def preprocess_csr(self, graph: CSRGraph) -> None:
+        """
+        Независимая от весов фаза: построение вложенных ячеек всех уровней и их граничных вершин.
+        Ячейки сразу настраиваются по текущим весам графа.
+        """
+
+        if any(weight < 0 for weight in graph.weights):
+            raise ValueError('Customizable route planning requires non-negative edge costs.')
+
+        self._graph = graph
+        self._weights = array('d', graph.weights)
+        self._cells = [GraphPartitioner(cell_size=self._cell_sizes[0]).partition(graph=graph)]
+        for level in range(1, len(self._cell_sizes)):
+            self._cells.append(self._merge_cells(level=level))
+
+        self._members, self._boundaries, self._boundary_positions = [], [], []
+        for level, cells in enumerate(self._cells):
+            cells_count: int = max(cells, default=-1) + 1
+            members: List[array] = [array('l') for _ in range(cells_count)]
+            for vertex in (range(graph.vertices_count) if level == 0 else self._get_boundary_vertices(level - 1)):
+                members[cells[vertex]].append(vertex)
+
+            boundaries: List[array] = [array('l') for _ in range(cells_count)]
+            boundary_positions: array = array('l', [-1]) * graph.vertices_count
+            for vertex in GraphPartitioner.get_boundary_vertices(graph=graph, cells=cells):
+                boundary_positions[vertex] = len(boundaries[cells[vertex]])
+                boundaries[cells[vertex]].append(vertex)
+
+            self._members.append(members)
+            self._boundaries.append(boundaries)
+            self._boundary_positions.append(boundary_positions)
+
+        self._cliques = [[array('d') for _ in boundaries] for boundaries in self._boundaries]
+        self._cell_graphs.clear()
+        self.customize()
+
+    def _merge_cells(self, level: int) -> array:
+        """
+        Объединяет соседние ячейки уровня level - 1 в ячейки уровня level разбиением графа смежности ячеек.
+        """
+
+        child_cells: array = self._cells[level - 1]
+        offsets, targets = self._graph.offsets, self._graph.targets
+        cell_edges: Set[Tuple[int, int]] = {
+            (child_cells[node_from], child_cells[targets[index]])
+            for node_from in range(self._graph.vertices_count)
+            for index in range(offsets[node_from], offsets[node_from + 1])
+            if child_cells[node_from] != child_cells[targets[index]]
+        }
+        cells_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=max(child_cells, default=-1) + 1,
+            edges=[(cell_from, cell_to, 1) for cell_from, cell_to in cell_edges]
+        )
+
+        parents: array = GraphPartitioner(
+            cell_size=max(1, self._cell_sizes[level] // self._cell_sizes[level - 1])
+        ).partition(graph=cells_graph)
+
+        return array('l', (parents[cell] for cell in child_cells))
+
+    def _get_boundary_vertices(self, level: int) -> List[int]:
+        return [vertex for vertex, position in enumerate(self._boundary_positions[level]) if position != -1]
+
+    def _get_cell_graph(self, level: int, cell: int) -> Tuple[CSRGraph, array, Dict[int, int]]:
+        """
+        Локальный граф ячейки по текущим весам.
+
+        :return: Граф с локальными номерами вершин (индексами в списке members ячейки), массив уровней ребер
+        (уровень клики, из которой взято ребро, или ORIGINAL_EDGE) и словарь локальных номеров вершин.
+        """
+
+        members: array = self._members[level][cell]
+        local_ids: Dict[int, int] = {vertex: local_id for local_id, vertex in enumerate(members)}
+        offsets, targets, cells = self._graph.offsets, self._graph.targets, self._cells[level]
+
+        cell_offsets: array = array('l', [0])
+        cell_targets: array = array('l')
+        cell_weights: array = array('d')
+        edge_levels: array = array('l')
+        for vertex in members:
+            child_cell: int = self._cells[level - 1][vertex] if level > 0 else -1
+            if level > 0:
+                # Ребра клики дочерней ячейки, в которой лежит вершина:
+                boundary: array = self._boundaries[level - 1][child_cell]
+                clique: array = self._cliques[level - 1][child_cell]
+                row: int = self._boundary_positions[level - 1][vertex] * len(boundary)
+                for position, node_to in enumerate(boundary):
+                    if node_to != vertex and clique[row + position] < math.inf:
+                        cell_targets.append(local_ids[node_to])
+                        cell_weights.append(clique[row + position])
+                        edge_levels.append(level - 1)
+
+            for index in range(offsets[vertex], offsets[vertex + 1]):
+                node_to = targets[index]
+                if cells[node_to] == cell and (level == 0 or self._cells[level - 1][node_to] != child_cell):
+                    cell_targets.append(local_ids[node_to])
+                    cell_weights.append(self._weights[index])
+                    edge_levels.append(ORIGINAL_EDGE)
+
+            cell_offsets.append(len(cell_targets))
+
+        return CSRGraph(offsets=cell_offsets, targets=cell_targets, weights=cell_weights), edge_levels, local_ids
+
+    def customize(self) -> None:
+        """
+        Настраивает все ячейки всех уровней по текущим весам ребер.
+        """
+
+        if self._graph is None:
+            raise ValueError('Graph is not preprocessed. Call preprocess or preprocess_csr first.')
+
+        self._customize_cells(cells=[set(range(len(boundaries))) for boundaries in self._boundaries])
+
+    def _customize_cells(self, cells: List[Set[int]]) -> None:
+        """
+        Настраивает указанные ячейки каждого уровня снизу вверх: клики уровня нужны для графов ячеек следующего.
+        """
+
+        executor: Optional[Executor] = None
+        if self._max_workers > 1 and sum(len(level_cells) for level_cells in cells) > 1:
+            executor = ProcessPoolExecutor(max_workers=self._max_workers)
+
+        try:
+            for level, level_cells in enumerate(cells):
+                cells_to_customize: List[int] = sorted(level_cells)
+                cell_graphs: List[CSRGraph] = []
+                boundaries: List[List[int]] = []
+                for cell in cells_to_customize:
+                    cell_graph, _, local_ids = self._get_cell_graph(level=level, cell=cell)
+                    cell_graphs.append(cell_graph)
+                    boundaries.append([local_ids[vertex] for vertex in self._boundaries[level][cell]])
+
+                if executor is None or len(cells_to_customize) <= 1:
+                    cliques: Iterable[array] = map(_customize_cell, cell_graphs, boundaries)
+                else:
+                    # Несколько порций на процесс сглаживают разницу во времени настройки ячеек разного размера:
+                    chunk_size: int = max(1, len(cells_to_customize) // (4 * self._max_workers))
+                    cliques = executor.map(_customize_cell, cell_graphs, boundaries, chunksize=chunk_size)
+
+                for cell, clique in zip(cells_to_customize, cliques):
+                    self._cliques[level][cell] = clique
+                    # Веса ребер ячейки или клики ее дочерних ячеек изменились - сохраненный граф устарел:
+                    self._cell_graphs.pop((level, cell), None)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def update_edge_costs(self, costs: Dict[int, Union[int, float]]) -> List[Set[int]]:
+        """
+        Изменяет веса ребер с указанными номерами и перенастраивает только затронутые ячейки: наименьшую ячейку,
+        содержащую обе вершины ребра, и все объемлющие ее ячейки.
+
+        :return: Номера перенастроенных ячеек каждого уровня.
+        """
+
+        changed_cells: List[Set[int]] = [set() for _ in self._cells]
+        for index, cost in costs.items():
+            if cost < 0:
+                raise ValueError('Customizable route planning requires non-negative edge costs.')
+
+            self._weights[index] = cost
+            node_from: int = bisect_right(self._graph.offsets, index) - 1
+            node_to: int = self._graph.targets[index]
+            for level, cells in enumerate(self._cells):
+                if cells[node_from] == cells[node_to]:
+                    changed_cells[level].add(cells[node_from])
+
+        self._customize_cells(cells=changed_cells)
+        return changed_cells
+
+    def update_edge(self, edge: GraphEdge, new_cost: Union[int, float]) -> List[Set[int]]:
+        """
+        Аналог update_edge_costs для ребра графа, по узлам которого выполнена предварительная обработка.
+        """
+
+        edge.cost = new_cost
+        return self.update_edge_costs(costs={self._edge_ids[id(edge)]: new_cost})
+
+    def query(self, source: int, target: int) -> Tuple[Union[int, float], List[int]]:
+        """
+        Ищет кратчайший путь между вершинами с указанными идентификаторами.
+
+        :return: Стоимость кратчайшего пути и вершины пути по порядку. Если пути нет - math.inf и пустой список.
+        """
+
+        if self._graph is None:
+            raise ValueError('Graph is not preprocessed. Call preprocess or preprocess_csr first.')
+
+        offsets, targets, weights = self._graph.offsets, self._graph.targets, self._weights
+        query_cells: List[Tuple[int, int]] = [(cells[source], cells[target]) for cells in self._cells]
+
+        # Родитель хранится парой (предыдущая вершина, уровень клики ребра или ORIGINAL_EDGE):
+        distances: Dict[int, float] = {source: 0}
+        parents: Dict[int, Tuple[int, int]] = {source: (-1, ORIGINAL_EDGE)}
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        priority_queue.push(key=source, priority=0)
+        self._settled_count = 0
+
+        get_distance: Callable[[int, float], float] = distances.get
+        push_or_decrease_key: Callable[..., None] = priority_queue.push_or_decrease_key
+
+        def relax(node_to: int, new_distance: float, parent: Tuple[int, int]) -> None:
+            if new_distance < distances.get(node_to, math.inf):
+                distances[node_to] = new_distance
+                parents[node_to] = parent
+                priority_queue.push_or_decrease_key(key=node_to, priority=new_distance)
+
+        while not priority_queue.is_empty():
+            node_from, distance = priority_queue.pop_min()
+            self._settled_count += 1
+            if node_from == target:
+                return distance, self._unpack_path(target=target, parents=parents)
+
+            # Уровень вершины - количество уровней, на которых ее ячейка отличается от ячеек s и t:
+            query_level: int = 0
+            while query_level < len(self._cells) and self._cells[query_level][node_from] not in query_cells[query_level]:
+                query_level += 1
+
+            if query_level == 0:
+                for index in range(offsets[node_from], offsets[node_from + 1]):
+                    relax(
+                        node_to=targets[index],
+                        new_distance=distance + weights[index],
+                        parent=(node_from, ORIGINAL_EDGE)
+                    )
+
+                continue
+
+            level: int = query_level - 1
+            cells: array = self._cells[level]
+            cell: int = cells[node_from]
+            boundary: array = self._boundaries[level][cell]
+            clique: array = self._cliques[level][cell]
+            row: int = self._boundary_positions[level][node_from] * len(boundary)
+            # Самый горячий цикл запроса, поэтому релаксация встроена. Петля (стоимость 0) и недостижимые
+            # вершины (стоимость math.inf) не проходят проверку и отдельно не отсеиваются:
+            for node_to, cost in zip(boundary, clique[row:row + len(boundary)]):
+                new_distance: float = distance + cost
+                if new_distance < get_distance(node_to, math.inf):
+                    distances[node_to] = new_distance
+                    parents[node_to] = (node_from, level)
+                    push_or_decrease_key(key=node_to, priority=new_distance)
+
+            for index in range(offsets[node_from], offsets[node_from + 1]):
+                if cells[targets[index]] != cell:
+                    relax(
+                        node_to=targets[index],
+                        new_distance=distance + weights[index],
+                        parent=(node_from, ORIGINAL_EDGE)
+                    )
+
+        return math.inf, []
+
+    def _unpack_path(self, target: int, parents: Dict[int, Tuple[int, int]]) -> List[int]:
+        edges: List[Tuple[int, int, int]] = []
+        vertex: int = target
+        while parents[vertex][0] != -1:
+            node_from, level = parents[vertex]
+            edges.append((node_from, vertex, level))
+            vertex = node_from
+
+        # Ребра клик раскрываются явным стеком, начиная с первого ребра пути:
+        path: List[int] = [vertex]
+        stack: List[Tuple[int, int, int]] = edges
+        while stack:
+            node_from, node_to, level = stack.pop()
+            if level == ORIGINAL_EDGE:
+                path.append(node_to)
+            else:
+                stack.extend(reversed(self._get_cell_path_edges(level=level, node_from=node_from, node_to=node_to)))
+
+        return path
+
+    def _get_cell_path_edges(self, level: int, node_from: int, node_to: int) -> List[Tuple[int, int, int]]:
+        """
+        Ребра кратчайшего пути по локальному графу ячейки уровня level в виде троек (начало, конец, уровень ребра).
+        Поиск Дейкстры останавливается при извлечении конечной вершины, а родителем вершины запоминается номер
+        ребра, по которому в нее пришли, поэтому уровень ребра берется без поиска среди параллельных ребер.
+        """
+
+        cell: int = self._cells[level][node_from]
+        cell_graph_key: Tuple[int, int] = (level, cell)
+        if cell_graph_key not in self._cell_graphs:
+            self._cell_graphs[cell_graph_key] = self._get_cell_graph(level=level, cell=cell)
+
+        cell_graph, edge_levels, local_ids = self._cell_graphs[cell_graph_key]
+        offsets, targets, weights = cell_graph.offsets, cell_graph.targets, cell_graph.weights
+        source, target = local_ids[node_from], local_ids[node_to]
+
+        distances: Dict[int, float] = {source: 0}
+        parent_edges: Dict[int, Tuple[int, int]] = {}  # Вершина -> (предыдущая вершина, номер ребра)
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        priority_queue.push(key=source, priority=0)
+        while not priority_queue.is_empty():
+            vertex, distance = priority_queue.pop_min()
+            if vertex == target:
+                break
+
+            for index in range(offsets[vertex], offsets[vertex + 1]):
+                new_distance: float = distance + weights[index]
+                if new_distance < distances.get(targets[index], math.inf):
+                    distances[targets[index]] = new_distance
+                    parent_edges[targets[index]] = (vertex, index)
+                    priority_queue.push_or_decrease_key(key=targets[index], priority=new_distance)
+
+        members: array = self._members[level][cell]
+        path_edges: List[Tuple[int, int, int]] = []
+        vertex = target
+        while vertex != source:
+            local_from, index = parent_edges[vertex]
+            path_edges.append((members[local_from], members[vertex], edge_levels[index]))
+            vertex = local_from
+
+        path_edges.reverse()
+        return path_edges
+
+    def shortest_path(self, source_node: GraphNode, target_node: GraphNode) -> Tuple[Union[int, float], List[GraphNode]]:
+        """
+        Аналог query для узлов графа, по которым была выполнена предварительная обработка через preprocess.
+        """
+
+        if self._graph is None or self._graph.labels is None:
+            raise ValueError('Graph was not preprocessed from graph nodes.')
+
+        cost, path = self.query(source=self._graph.vertex_id(source_node), target=self._graph.vertex_id(target_node))
+        return cost, [self._graph.label(vertex) for vertex in path]
+
+    @property
+    def levels_count(self) -> int:
+        return len(self._cells)
+
+    def get_cells_count(self, level: int) -> int:
+        return len(self._boundaries[level])
+
+    def get_boundary_vertices_count(self, level: int) -> int:
+        return sum(len(boundary) for boundary in self._boundaries[level])
+
+    def get_overlay_edges_count(self, level: int) -> int:
+        """
+        Количество ребер клик уровня (без петель).
+        """
+
+        return sum(len(boundary) * (len(boundary) - 1) for boundary in self._boundaries[level])
+
+    @property
+    def settled_count(self) -> int:
+        """
+        Количество вершин, извлеченных из очереди во время последнего запроса.
+        """
+
+        return self._settled_count
+
+
+if __name__ == '__main__':
+    import random
+
+    # Рандомизированная перекрестная проверка: результаты запросов должны в точности совпадать с алгоритмом Дейкстры,
+    # в том числе после изменения весов ребер внутри ячеек и разрезающих ребер.
+    generator: random.Random = random.Random(20)
+    dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    checked_pairs_count: int = 0
+    for _ in range(40):
+        nodes: List[GraphNode] = [GraphNode(value) for value in range(generator.randint(1, 60))]
+        for _ in range(generator.randint(0, 4 * len(nodes))):
+            graph_node_from: GraphNode = generator.choice(nodes)
+            graph_node_to: GraphNode = generator.choice(nodes)
+            graph_node_from.edges.append(
+                GraphEdge(node_from=graph_node_from, node_to=graph_node_to, cost=generator.randint(0, 20))
+            )
+
+        first_cell_size: int = generator.randint(1, 15)
+        route_planning: CustomizableRoutePlanning = CustomizableRoutePlanning(
+            cell_sizes=[first_cell_size * multiplier for multiplier in (1, 3, 9)[:generator.randint(1, 3)]]
+        )
+        route_planning.preprocess(roots=nodes)
+
+        for update_index in range(3):
+            if update_index > 0:
+                all_edges: List[GraphEdge] = [edge for node in nodes for edge in node.edges]
+                for graph_edge in generator.sample(all_edges, min(len(all_edges), 5)):
+                    route_planning.update_edge(edge=graph_edge, new_cost=generator.randint(0, 20))
+
+            csr_graph: CSRGraph = CSRGraph.from_nodes(roots=nodes)
+            for graph_source in range(csr_graph.vertices_count):
+                expected: ShortestPathsResult = dijkstra_algorithm.process_csr_graph(graph=csr_graph, source=graph_source)
+                for graph_target in range(csr_graph.vertices_count):
+                    path_cost, path_nodes = route_planning.shortest_path(
+                        source_node=csr_graph.label(graph_source),
+                        target_node=csr_graph.label(graph_target)
+                    )
+
+                    assert path_cost == expected.distances[graph_target]
+                    if path_nodes:
+                        assert path_nodes[0] is csr_graph.label(graph_source)
+                        assert path_nodes[-1] is csr_graph.label(graph_target)
+                        assert sum(
+                            min(edge.cost for edge in node_from.edges if edge.node_to is node_to)
+                            for node_from, node_to in zip(path_nodes, path_nodes[1:])
+                        ) == path_cost
+
+                    checked_pairs_count += 1
+
+    print(f'Random graphs check passed: {checked_pairs_count} pairs.')
@@ -27,51 +27,178 @@ R * * 5 * * → S * * 2 * * → T * * 7 * * → X * * -1 * * → Y * * -2 * * 
      * * * * 3 * * * *       *                                     *
                                 * * * * * * * * 2 * * * * * * * *
 
+Топологический порядок строится итеративно алгоритмом Кана (см. TopologicalSort.kahn_sort_csr), а не рекурсивным
+поиском в глубину, поэтому глубина графа (например, графа зависимостей сборки из сотен тысяч уровней) не ограничена
+глубиной стека Python. Узлы графа не клонируются: граф переводится в CSR-представление, вершины которого - плотные
+целочисленные идентификаторы, ослабление выполняется по массивам, и лишь итоговые оценки и родительские ребра
+записываются обратно в узлы. Соседи узлов (атрибут neighbors) для сортировки больше не нужны - достаточно ребер.
+
+В режиме DAGPathMode.LONGEST ищутся длиннейшие (критические) пути. В ациклическом графе длиннейший путь -
+это кратчайший путь в графе с весами противоположного знака: циклов, в том числе отрицательных, в нем
+по-прежнему нет. Метод critical_path находит длиннейший путь среди путей из любых вершин, то есть длительность
+сборки (makespan), если стоимость ребра - длительность задачи, от которой зависит следующая.
+
+Граф с циклами (например, граф зависимостей со взаимно зависимыми модулями) обрабатывается методом
+process_cyclic_csr_graph: каждая компонента сильной связности стягивается в одну вершину
+(см. StronglyConnectedComponents), переход внутри компоненты считается бесплатным, и пути ищутся
+в ациклическом графе компонент. Параллельные ребра между компонентами сливаются в одно с минимальным весом
+в режиме SHORTEST и с максимальным - в режиме LONGEST.
+
 Асимптоматическая скорость алгоритма составляет O(V + E) за счет топологической сортировки,
 где V - количество вершин графа, а E - количество ребер.
 """
 
 
-from typing import List, Any, Optional
+import math
+from array import array
+from typing import List, Optional, Sequence, Tuple
 
-from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.colors import GraphNodeColors
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.strongly_connected_components import (
+    StronglyConnectedComponents
+)
 from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.topological_sort import (
-    TopologicalGraphNode,
     TopologicalSort
 )
 from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
-    ShortestPathsFromOneVertexBaseAlgorithm
+    ShortestPathsFromOneVertexBaseAlgorithm,
+    ShortestPathsResult
 )
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.modes import DAGPathMode
 from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
 
 
-class DAGShortestPathsNode(GraphNode, TopologicalGraphNode):
+class DAGShortestPathsNode(GraphNode):
+    """
+    Узел графа для поиска путей в ациклическом графе. Топологический порядок строится по ребрам узлов
+    в CSR-представлении, поэтому узлу не нужны атрибуты узла топологической сортировки.
+    """
 
-    def __init__(self, value: Any) -> None:
-        super().__init__(value=value)
 
-        # Topological node attrs:
-        self.neighbors: List[DAGShortestPathsNode] = []
-        self.distance_from_root: int = 0
-        self.parent: Optional[DAGShortestPathsNode] = None
-        self.color: GraphNodeColors = GraphNodeColors.WHITE
-        self.opening_time: int = 0
-        self.explored_time: int = 0
+class DAGShortestPaths(ShortestPathsFromOneVertexBaseAlgorithm):
 
+    def __init__(self, mode: DAGPathMode = DAGPathMode.SHORTEST, track_parents: bool = True) -> None:
+        super().__init__(track_parents=track_parents)
+        self._mode: DAGPathMode = mode
 
-class DAGShortestPaths(ShortestPathsFromOneVertexBaseAlgorithm):
+    def process_graph(self, roots: List[GraphNode], source_node: GraphNode) -> None:
+        """
+        Обрабатывает граф по CSR-представлению и записывает оценки путей и родительские ребра в узлы.
+        Если граф содержит цикл, выбрасывается ValueError.
+        """
 
-    def process_graph(self, roots: List[DAGShortestPathsNode], source_node: DAGShortestPathsNode) -> None:
-        topological_sorter = TopologicalSort()
-        topological_sorter.sort(roots=roots)
-        self._roots = topological_sorter.sorted_nodes
+        graph: CSRGraph = CSRGraph.from_nodes(roots=roots)
+        self._roots = graph.labels
         self._source_node = source_node
 
-        self._init_single_source()
-        self._get_all_edges()
+        source: int = graph.vertex_id(source_node)
+        distances, parents = self._init_csr_single_source(graph=graph, source=source)
+        parent_edges: array = array('l', [-1]) * graph.vertices_count
+        self._relax_in_topological_order(graph=graph, distances=distances, parents=parents, parent_edges=parent_edges)
+
+        offsets: Sequence[int] = graph.offsets
+        for vertex, node in enumerate(graph.labels):
+            estimate: float = distances[vertex]
+            node.shortest_path_estimate = int(estimate) if estimate.is_integer() else estimate
+            node.parent = None
+            node.parent_edge = None
+            if self._track_parents and parents[vertex] != -1:
+                # Ребра узла попадают в CSR-представление в исходном порядке, поэтому номер ребра в массиве
+                # targets однозначно определяет объект ребра:
+                node.parent = graph.label(parents[vertex])
+                node.parent_edge = node.parent.edges[parent_edges[vertex] - offsets[parents[vertex]]]
+
+    def process_csr_graph(self, graph: CSRGraph, source: int) -> ShortestPathsResult:
+        """
+        Поиск кратчайших (или длиннейших) путей в ациклическом графе в CSR-представлении.
+        Вершины обрабатываются в топологическом порядке, ребра каждой вершины ослабляются ровно один раз.
+        В режиме LONGEST недостижимые вершины получают оценку -math.inf.
+        """
+
+        distances, parents = self._init_csr_single_source(graph=graph, source=source)
+        self._relax_in_topological_order(graph=graph, distances=distances, parents=parents)
+        return ShortestPathsResult(source=source, distances=distances, parents=parents)
+
+    def process_cyclic_csr_graph(self, graph: CSRGraph, source: int) -> Tuple[array, ShortestPathsResult]:
+        """
+        Поиск путей в графе, который может содержать циклы, по его графу компонент сильной связности.
+        Вершины одной компоненты получают одинаковую оценку: оценка вершины v равна distances[component_ids[v]].
+
+        :return: Номера компонент вершин и результат поиска в графе компонент из компоненты вершины source.
+        """
+
+        components_count, component_ids = StronglyConnectedComponents.components_csr(graph=graph)
+        condensation: CSRGraph = StronglyConnectedComponents.condensation_csr(
+            graph=graph,
+            components_count=components_count,
+            component_ids=component_ids,
+            combine=max if self._mode == DAGPathMode.LONGEST else min
+        )
+        return component_ids, self.process_csr_graph(graph=condensation, source=component_ids[source])
+
+    def critical_path(self, graph: CSRGraph) -> Tuple[float, List[int]]:
+        """
+        Критический путь ациклического графа - длиннейший путь, начинающийся в любой вершине.
+        Все вершины получают начальную оценку 0, после чего выполняется один проход ослабления в режиме LONGEST
+        независимо от режима алгоритма.
+
+        :return: Длина критического пути и его вершины по порядку.
+        """
+
+        if graph.vertices_count == 0:
+            return 0, []
+
+        distances: array = array('d', bytes(8 * graph.vertices_count))
+        parents: array = array('l', [-1]) * graph.vertices_count
+        self._relax_in_topological_order(graph=graph, distances=distances, parents=parents, mode=DAGPathMode.LONGEST)
+
+        vertex: int = max(range(graph.vertices_count), key=distances.__getitem__)
+        length: float = distances[vertex]
+        path: List[int] = []
+        while vertex != -1:
+            path.append(vertex)
+            vertex = parents[vertex]
+
+        path.reverse()
+        return length, path
+
+    def _relax_in_topological_order(
+            self,
+            graph: CSRGraph,
+            distances: array,
+            parents: array,
+            parent_edges: Optional[array] = None,
+            mode: Optional[DAGPathMode] = None
+    ) -> None:
+        """
+        Ослабляет все ребра графа в топологическом порядке вершин-источников. Массивы изменяются на месте.
+        В режиме LONGEST ослабление выполняется по весам противоположного знака, а знак итоговых оценок
+        меняется на противоположный. Начальные оценки (0 для истоков, math.inf для остальных вершин)
+        в обоих режимах одинаковы.
+
+        :param parent_edges: Если передан, в него записываются номера родительских ребер в массиве targets.
+        """
+
+        longest: bool = (mode or self._mode) == DAGPathMode.LONGEST
+        offsets, targets = graph.offsets, graph.targets
+        weights: array = array('d', (-weight for weight in graph.weights)) if longest else graph.weights
+        for node_from in TopologicalSort.kahn_sort_csr(graph=graph):
+            distance_from: float = distances[node_from]
+            if distance_from == math.inf:
+                continue
 
-        for edge in self._edges:
-            self._relax(edge=edge)
+            for index in range(offsets[node_from], offsets[node_from + 1]):
+                new_distance: float = distance_from + weights[index]
+                if new_distance < distances[targets[index]]:
+                    distances[targets[index]] = new_distance
+                    parents[targets[index]] = node_from
+                    if parent_edges is not None:
+                        parent_edges[targets[index]] = index
+
+        if longest:
+            # Вычитание из 0.0 вместо унарного минуса, чтобы оценка истока 0.0 не превращалась в -0.0:
+            for vertex in range(len(distances)):
+                distances[vertex] = 0.0 - distances[vertex]
 
 
 if __name__ == '__main__':
@@ -83,13 +210,6 @@ if __name__ == '__main__':
     y: DAGShortestPathsNode = DAGShortestPathsNode('y')
     z: DAGShortestPathsNode = DAGShortestPathsNode('z')
 
-    # Adding neighbours for topological sort:
-    r.neighbors = [s, t]
-    s.neighbors = [t, x]
-    t.neighbors = [z, x, y]
-    x.neighbors = [y, z]
-    y.neighbors = [z]
-
     # Create edges:
     r.edges = [
         GraphEdge(node_from=r, node_to=t, cost=3),
@@ -127,3 +247,95 @@ if __name__ == '__main__':
     dag_shortest_paths_algorithm.print_shortest_path(node_to=r)
     dag_shortest_paths_algorithm.print_shortest_path(node_to=y)
     dag_shortest_paths_algorithm.print_shortest_path(node_to=z)
+
+    csr_graph: CSRGraph = CSRGraph.from_nodes(roots=[r, s, t, x, y, z])
+    csr_result: ShortestPathsResult = dag_shortest_paths_algorithm.process_csr_graph(
+        graph=csr_graph,
+        source=csr_graph.vertex_id(s)
+    )
+
+    print('\nCSR graph:')
+    for vertex in range(csr_graph.vertices_count):
+        print(f'Shortest path from {s} to {csr_graph.label(vertex)} costs {csr_result.distances[vertex]}.')
+
+    longest_paths_algorithm: DAGShortestPaths = DAGShortestPaths(mode=DAGPathMode.LONGEST)
+    longest_paths_algorithm.process_graph(roots=[r, s, t, x, y, z], source_node=s)
+    print('\nLongest paths:')
+    longest_paths_algorithm.print_shortest_path(node_to=z)
+
+    makespan, critical_vertices = longest_paths_algorithm.critical_path(graph=csr_graph)
+    print(f'\nCritical path {" -> ".join(str(csr_graph.label(vertex).value) for vertex in critical_vertices)} '
+          f'takes {makespan}.')
+
+    import random
+    import time
+
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Bellman_Ford_algorithm import (
+        BellmanFordAlgorithm
+    )
+
+    # Глубокая цепочка зависимостей, на которой рекурсивная топологическая сортировка переполнила бы стек:
+    levels_count: int = 200_000
+    chain: List[GraphNode] = [GraphNode(level) for level in range(levels_count)]
+    for level in range(levels_count - 1):
+        chain[level].edges = [GraphEdge(node_from=chain[level], node_to=chain[level + 1], cost=1)]
+
+    start_time: float = time.perf_counter()
+    chain_algorithm: DAGShortestPaths = DAGShortestPaths(mode=DAGPathMode.LONGEST)
+    chain_algorithm.process_graph(roots=chain, source_node=chain[0])
+    assert chain[-1].shortest_path_estimate == levels_count - 1
+    assert sum(1 for _ in chain_algorithm.path_to(node_to=chain[-1])) == levels_count - 1
+    print(f'\nChain of {levels_count} levels processed in {time.perf_counter() - start_time:.2f} s.')
+
+    # Сверяем кратчайшие пути с алгоритмом Беллмана-Форда, а длиннейшие - с ним же на весах противоположного знака:
+    generator: random.Random = random.Random(18)
+    for _ in range(300):
+        vertices_count: int = generator.randint(1, 20)
+        random_edges: List[Tuple[int, int, int]] = []
+        for _ in range(generator.randint(0, 3 * vertices_count)):
+            node_from, node_to = sorted(generator.sample(range(vertices_count), 2)) if vertices_count > 1 else (0, 0)
+            if node_from != node_to:
+                random_edges.append((node_from, node_to, generator.randint(-5, 10)))
+
+        random_graph: CSRGraph = CSRGraph.from_edge_list(vertices_count=vertices_count, edges=random_edges)
+        negated_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=vertices_count,
+            edges=[(node_from, node_to, -cost) for node_from, node_to, cost in random_edges]
+        )
+
+        source_vertex: int = generator.randrange(vertices_count)
+        shortest: ShortestPathsResult = DAGShortestPaths().process_csr_graph(graph=random_graph, source=source_vertex)
+        expected: ShortestPathsResult = BellmanFordAlgorithm().process_csr_graph(
+            graph=random_graph,
+            source=source_vertex
+        )
+        assert list(shortest.distances) == list(expected.distances)
+
+        longest: ShortestPathsResult = DAGShortestPaths(mode=DAGPathMode.LONGEST).process_csr_graph(
+            graph=random_graph,
+            source=source_vertex
+        )
+        expected = BellmanFordAlgorithm().process_csr_graph(graph=negated_graph, source=source_vertex)
+        assert list(longest.distances) == [-distance for distance in expected.distances]
+        for vertex in range(vertices_count):
+            if vertex != source_vertex and longest.distances[vertex] != -math.inf:
+                assert longest.path_to(vertex)[0] == source_vertex
+            elif vertex != source_vertex:
+                assert longest.path_to(vertex) == []
+
+    print('\nRandom graphs check passed.')
+
+    # Граф с циклами: стягиваем цикл 1 -> 2 -> 3 -> 1 в одну вершину и ищем длиннейшие пути по графу компонент.
+    cyclic_graph: CSRGraph = CSRGraph.from_edge_list(
+        vertices_count=5,
+        edges=[(0, 1, 5), (1, 2, 2), (2, 3, 7), (3, 1, 1), (3, 4, 3), (2, 4, 1)]
+    )
+    cyclic_component_ids, cyclic_result = DAGShortestPaths(mode=DAGPathMode.LONGEST).process_cyclic_csr_graph(
+        graph=cyclic_graph,
+        source=0
+    )
+    assert list(cyclic_component_ids) == [0, 1, 1, 1, 2]
+    assert list(cyclic_result.distances) == [0, 5, 8]
+    assert math.copysign(1, cyclic_result.distances[0]) == 1
+    print(f'\nCyclic graph: component ids {list(cyclic_component_ids)}, '
+          f'longest distances {[cyclic_result.distances[component] for component in cyclic_component_ids]}.')
@@ -0,0 +1,312 @@
+"""
+Алгоритм delta-stepping (Мейер и Сандерс) решает задачу поиска кратчайших путей из одной вершины во взвешенном
+ориентированном графе с неотрицательными весами ребер.
+
+Вместо очереди с приоритетами, из которой вершины извлекаются строго по одной, вершины раскладываются по корзинам
+ширины delta: вершина с оценкой кратчайшего пути d лежит в корзине с номером floor(d / delta).
+Ребра делятся на легкие (стоимость не больше delta) и тяжелые (стоимость больше delta).
+1) Берется непустая корзина с наименьшим номером i.
+2) Пока корзина i не пуста, из нее извлекаются сразу все вершины и ослабляются все их легкие ребра.
+   Легкое ребро может вернуть вершину в ту же корзину i, поэтому шаг повторяется.
+3) После того как корзина i опустела, один раз ослабляются тяжелые ребра всех извлеченных из нее вершин.
+   Тяжелое ребро всегда ведет в корзину с большим номером, поэтому повторять этот шаг не нужно.
+Все ослабления одного шага независимы друг от друга и выполняются пакетом: при наличии NumPy - векторными
+операциями над массивами CSR-представления графа, без NumPy - циклом по вершинам корзины.
+
+Параметр delta задает компромисс между алгоритмом Дейкстры (delta, меньшее наименьшего веса ребра,
+дает по одной "волне" на каждое различное значение оценки) и алгоритмом Беллмана-Форда (delta = бесконечность
+превращает алгоритм в пакетный Беллман-Форд с повторными ослаблениями). Чем больше delta, тем крупнее пакеты
+и тем больше лишних ослаблений.
+
+Граф для теста совпадает с графом алгоритма Дейкстры (см. Dijkstra_algorithm.py).
+
+Асимптоматическая скорость алгоритма для графов со случайными весами ребер от 0 до 1 и delta = Θ(1 / d),
+где d - максимальная степень вершины, составляет O(V + E + d * L), где L - вес наибольшего кратчайшего пути.
+Главное преимущество перед алгоритмом Дейкстры - количество последовательных шагов O(L / delta) вместо V:
+каждый шаг обрабатывает множество вершин одной векторной операцией.
+"""
+
+
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsFromOneVertexBaseAlgorithm,
+    ShortestPathsResult
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class DeltaSteppingAlgorithm(ShortestPathsFromOneVertexBaseAlgorithm):
+
+    def __init__(self, delta: Optional[float] = None, vectorized: Optional[bool] = None) -> None:
+        """
+        :param delta: Ширина корзины. По умолчанию - наибольший вес ребра, деленный на среднюю степень вершины.
+        :param vectorized: Ослаблять ли ребра векторными операциями NumPy. По умолчанию - если NumPy установлен.
+        """
+
+        super().__init__()
+        if delta is not None and delta <= 0:
+            raise ValueError(f'Delta={delta} must be positive.')
+
+        if vectorized and numpy is None:
+            raise ImportError('NumPy is required for vectorized relaxations.')
+
+        self._delta: Optional[float] = delta
+        self._vectorized: bool = numpy is not None if vectorized is None else vectorized
+
+    def process_csr_graph(self, graph: CSRGraph, source: int) -> ShortestPathsResult:
+        delta: float = self._delta if self._delta is not None else self._get_default_delta(graph=graph)
+        if self._vectorized:
+            return self._process_csr_graph_vectorized(graph=graph, source=source, delta=delta)
+
+        return self._process_csr_graph_via_buckets(graph=graph, source=source, delta=delta)
+
+    @staticmethod
+    def _get_default_delta(graph: CSRGraph) -> float:
+        if graph.edges_count == 0:
+            return 1.0
+
+        max_cost: float = max(graph.weights)
+        if max_cost <= 0:
+            return 1.0
+
+        return max_cost * graph.vertices_count / graph.edges_count
+
+    @staticmethod
+    def _split_edges(graph: CSRGraph, delta: float) -> Tuple[CSRGraph, CSRGraph]:
+        """
+        Разделяет ребра графа на легкие и тяжелые, сохраняя порядок ребер каждой вершины.
+        """
+
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        split_graphs: List[CSRGraph] = []
+        for is_light in (True, False):
+            split_offsets: array = array('l', [0])
+            split_targets: array = array('l')
+            split_weights: array = array('d')
+            for node_from in range(graph.vertices_count):
+                for index in range(offsets[node_from], offsets[node_from + 1]):
+                    if (weights[index] <= delta) == is_light:
+                        split_targets.append(targets[index])
+                        split_weights.append(weights[index])
+
+                split_offsets.append(len(split_targets))
+
+            split_graphs.append(CSRGraph(offsets=split_offsets, targets=split_targets, weights=split_weights))
+
+        return split_graphs[0], split_graphs[1]
+
+    def _process_csr_graph_via_buckets(self, graph: CSRGraph, source: int, delta: float) -> ShortestPathsResult:
+        distances, parents = self._init_csr_single_source(graph=graph, source=source)
+        light_graph, heavy_graph = self._split_edges(graph=graph, delta=delta)
+        buckets: Dict[int, Set[int]] = {0: {source}}
+
+        def relax_edges(split_graph: CSRGraph, nodes: Set[int]) -> None:
+            offsets, targets, weights = split_graph.offsets, split_graph.targets, split_graph.weights
+            for node_from in nodes:
+                for index in range(offsets[node_from], offsets[node_from + 1]):
+                    node_to: int = targets[index]
+                    new_distance: float = distances[node_from] + weights[index]
+                    if new_distance < distances[node_to]:
+                        # Вершины извлеченной корзины уже не лежат в ней, поэтому старой корзины может не быть:
+                        if distances[node_to] != math.inf and int(distances[node_to] // delta) in buckets:
+                            buckets[int(distances[node_to] // delta)].discard(node_to)
+
+                        distances[node_to] = new_distance
+                        parents[node_to] = node_from
+                        buckets.setdefault(int(new_distance // delta), set()).add(node_to)
+
+        while buckets:
+            bucket_index: int = min(buckets)
+            settled_nodes: Set[int] = set()
+            while buckets.get(bucket_index):
+                frontier: Set[int] = buckets.pop(bucket_index)
+                settled_nodes |= frontier
+                relax_edges(split_graph=light_graph, nodes=frontier)
+
+            # Корзина могла опустеть и раньше, после переноса всех ее вершин в корзины с меньшими номерами:
+            buckets.pop(bucket_index, None)
+            relax_edges(split_graph=heavy_graph, nodes=settled_nodes)
+
+        return ShortestPathsResult(source=source, distances=distances, parents=parents)
+
+    def _process_csr_graph_vectorized(self, graph: CSRGraph, source: int, delta: float) -> ShortestPathsResult:
+        """
+        Корзины хранят массивы вершин-кандидатов. Вершина, перенесенная в корзину с меньшим номером,
+        не удаляется из старой корзины: при извлечении корзины остаются только вершины,
+        чья текущая оценка действительно попадает в эту корзину.
+        """
+
+        offsets: Any = numpy.asarray(graph.offsets, dtype=numpy.int64)
+        targets: Any = numpy.asarray(graph.targets, dtype=numpy.int64)
+        weights: Any = numpy.asarray(graph.weights, dtype=numpy.float64)
+
+        distances: Any = numpy.full(graph.vertices_count, math.inf)
+        parents: Any = numpy.full(graph.vertices_count, -1, dtype=numpy.int64)
+        distances[source] = 0
+
+        # Легкие и тяжелые ребра: номера ребер в исходных массивах, сгруппированные по вершинам:
+        is_light: Any = weights <= delta
+        split_edges: List[Tuple[Any, Any]] = []
+        for mask in (is_light, ~is_light):
+            split_offsets: Any = numpy.zeros(graph.edges_count + 1, dtype=numpy.int64)
+            numpy.cumsum(mask, out=split_offsets[1:])
+            split_edges.append((split_offsets[offsets], numpy.flatnonzero(mask)))
+
+        def relax_edges(split_offsets: Any, edge_indexes: Any, nodes: Any) -> None:
+            starts: Any = split_offsets[nodes]
+            counts: Any = split_offsets[nodes + 1] - starts
+            total: int = int(counts.sum())
+            if total == 0:
+                return
+
+            # Номера всех ребер вершин пакета одним массивом: для каждой вершины - диапазон [start, start + count):
+            positions: Any = numpy.repeat(starts - numpy.cumsum(counts) + counts, counts) + numpy.arange(total)
+            batch_edges: Any = edge_indexes[positions]
+            batch_sources: Any = numpy.repeat(nodes, counts)
+            batch_targets: Any = targets[batch_edges]
+            new_distances: Any = distances[batch_sources] + weights[batch_edges]
+
+            improved: Any = new_distances < distances[batch_targets]
+            if not improved.any():
+                return
+
+            batch_sources, batch_targets, new_distances = (
+                batch_sources[improved], batch_targets[improved], new_distances[improved]
+            )
+
+            # Для каждой вершины оставляем наименьшую новую оценку: сортируем по вершине, затем по оценке:
+            order: Any = numpy.lexsort((new_distances, batch_targets))
+            batch_sources, batch_targets, new_distances = (
+                batch_sources[order], batch_targets[order], new_distances[order]
+            )
+            first: Any = numpy.ones(len(batch_targets), dtype=bool)
+            first[1:] = batch_targets[1:] != batch_targets[:-1]
+            batch_sources, batch_targets, new_distances = (
+                batch_sources[first], batch_targets[first], new_distances[first]
+            )
+
+            distances[batch_targets] = new_distances
+            parents[batch_targets] = batch_sources
+
+            bucket_indexes: Any = (new_distances // delta).astype(numpy.int64)
+            for bucket_index in numpy.unique(bucket_indexes).tolist():
+                buckets.setdefault(bucket_index, []).append(batch_targets[bucket_indexes == bucket_index])
+
+        light_offsets, light_edges = split_edges[0]
+        heavy_offsets, heavy_edges = split_edges[1]
+        buckets: Dict[int, List[Any]] = {0: [numpy.array([source], dtype=numpy.int64)]}
+        while buckets:
+            bucket_index: int = min(buckets)
+            settled_nodes: List[Any] = []
+            while bucket_index in buckets:
+                frontier: Any = numpy.unique(numpy.concatenate(buckets.pop(bucket_index)))
+                frontier = frontier[(distances[frontier] // delta).astype(numpy.int64) == bucket_index]
+                if len(frontier) == 0:
+                    continue
+
+                settled_nodes.append(frontier)
+                relax_edges(split_offsets=light_offsets, edge_indexes=light_edges, nodes=frontier)
+
+            if settled_nodes:
+                relax_edges(
+                    split_offsets=heavy_offsets,
+                    edge_indexes=heavy_edges,
+                    nodes=numpy.unique(numpy.concatenate(settled_nodes))
+                )
+
+        return ShortestPathsResult(
+            source=source,
+            distances=array('d', distances.tobytes()),
+            parents=array('l', parents.astype(numpy.int64).tobytes())
+        )
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    s: GraphNode = GraphNode('s')
+    t: GraphNode = GraphNode('t')
+    y: GraphNode = GraphNode('y')
+    x: GraphNode = GraphNode('x')
+    z: GraphNode = GraphNode('z')
+
+    # Create edges:
+    s.edges = [
+        GraphEdge(node_from=s, node_to=t, cost=10),
+        GraphEdge(node_from=s, node_to=y, cost=5),
+    ]
+
+    t.edges = [
+        GraphEdge(node_from=t, node_to=y, cost=2),
+        GraphEdge(node_from=t, node_to=x, cost=1),
+    ]
+
+    y.edges = [
+        GraphEdge(node_from=y, node_to=t, cost=3),
+        GraphEdge(node_from=y, node_to=z, cost=2),
+        GraphEdge(node_from=y, node_to=x, cost=9),
+    ]
+
+    x.edges = [
+        GraphEdge(node_from=x, node_to=z, cost=4),
+    ]
+
+    z.edges = [
+        GraphEdge(node_from=z, node_to=x, cost=6),
+        GraphEdge(node_from=z, node_to=s, cost=7),
+    ]
+
+    csr_graph: CSRGraph = CSRGraph.from_nodes(roots=[s, t, y, x, z])
+    delta_stepping_algorithm: DeltaSteppingAlgorithm = DeltaSteppingAlgorithm(delta=3)
+    csr_result: ShortestPathsResult = delta_stepping_algorithm.process_csr_graph(
+        graph=csr_graph,
+        source=csr_graph.vertex_id(s)
+    )
+
+    for vertex in range(csr_graph.vertices_count):
+        path: str = ' -> '.join(str(csr_graph.label(node).value) for node in csr_result.path_to(vertex))
+        print(f'Shortest path from {s} to {csr_graph.label(vertex)} costs {csr_result.distances[vertex]}: {path}.')
+
+    import random
+
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+        DijkstraAlgorithm
+    )
+
+    # Сверяем расстояния с алгоритмом Дейкстры на случайных графах при разных delta, с NumPy и без:
+    generator: random.Random = random.Random(13)
+    for _ in range(200):
+        vertices_count: int = generator.randint(1, 40)
+        random_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=vertices_count,
+            edges=[
+                (generator.randrange(vertices_count), generator.randrange(vertices_count), generator.uniform(0, 10))
+                for _ in range(generator.randint(0, 4 * vertices_count))
+            ]
+        )
+
+        expected: ShortestPathsResult = DijkstraAlgorithm().process_csr_graph(graph=random_graph, source=0)
+        for graph_delta in (0.5, 3, 100, None):
+            for is_vectorized in ((False, True) if numpy is not None else (False,)):
+                result: ShortestPathsResult = DeltaSteppingAlgorithm(
+                    delta=graph_delta,
+                    vectorized=is_vectorized
+                ).process_csr_graph(graph=random_graph, source=0)
+                assert list(result.distances) == list(expected.distances), (graph_delta, is_vectorized)
+                for vertex in range(vertices_count):
+                    if result.parents[vertex] != -1:
+                        parent: int = result.parents[vertex]
+                        assert any(
+                            node_to == vertex and result.distances[parent] + cost == result.distances[vertex]
+                            for node_to, cost in random_graph.edges(parent)
+                        )
+
+    print('\nRandom graphs check passed.')
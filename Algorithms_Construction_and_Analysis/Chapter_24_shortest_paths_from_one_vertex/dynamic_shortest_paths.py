@@ -0,0 +1,243 @@
+"""
+Динамическое поддержание кратчайших путей из одной вершины при изменении стоимостей ребер
+(в духе алгоритма Рамалингама-Репса) для графов с неотрицательными весами ребер.
+
+Вместо повторного запуска алгоритма Дейкстры по всему графу после каждого изменения хранится дерево кратчайших
+путей (родительские ребра узлов и обратный индекс детей), и исправляется только затронутая изменением часть графа:
+1) Уменьшение стоимости ребра (u, v). Если новый путь через ребро короче текущей оценки v, оценка v уменьшается,
+   и от v запускается алгоритм Дейкстры, который продолжается только по вершинам, чьи оценки уменьшились.
+2) Увеличение стоимости ребра (u, v). Если ребро не входит в дерево кратчайших путей, ни одна оценка
+   не изменяется. Иначе затронуто только поддерево v: для каждой его вершины оценка пересчитывается
+   по входящим ребрам из незатронутых вершин, после чего алгоритм Дейкстры распространяет оценки
+   внутри поддерева. Оценки вершин вне поддерева не могут измениться, так как их кратчайшие пути
+   не проходят через измененное ребро.
+
+Граф для теста совпадает с графом алгоритма Дейкстры (см. Dijkstra_algorithm.py).
+
+Асимптоматическая скорость обработки изменения составляет O((A + E_A) log(A)), где A - количество затронутых
+вершин, а E_A - количество входящих и исходящих ребер этих вершин. В худшем случае (затронут весь граф) это
+совпадает со скоростью алгоритма Дейкстры O((V + E) log(V)), но обычно A намного меньше V.
+"""
+
+
+import math
+from typing import Dict, List, Optional, Set, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+from Algorithms_Construction_and_Analysis.Chapter_6_heapsort.indexed_min_heap import IndexedMinHeap
+
+
+class DynamicShortestPaths(DijkstraAlgorithm):
+
+    def __init__(self) -> None:
+        # Дерево кратчайших путей необходимо для поиска затронутых вершин, поэтому родители запоминаются всегда:
+        super().__init__(track_parents=True)
+        self._children: Dict[GraphNode, Set[GraphNode]] = {}
+
+    def process_graph(self, roots: List[GraphNode], source_node: GraphNode) -> None:
+        """
+        Вычисляет кратчайшие пути алгоритмом Дейкстры и строит индексы входящих ребер и детей в дереве путей.
+        """
+
+        super().process_graph(roots=roots, source_node=source_node)
+        self.build_reverse_index(roots=roots)
+
+        self._children = {root: set() for root in roots}
+        for root in roots:
+            if root.parent is not None:
+                self._children[root.parent].add(root)
+
+    def update_edge(self, edge: GraphEdge, new_cost: Union[int, float]) -> Set[GraphNode]:
+        """
+        Изменяет стоимость ребра и исправляет кратчайшие пути.
+
+        :return: Множество вершин, оценка кратчайшего пути до которых изменилась.
+        """
+
+        if new_cost < 0:
+            raise ValueError(f'Edge cost={new_cost} must be non-negative.')
+
+        old_cost: Union[int, float] = edge.cost
+        edge.cost = new_cost
+        if new_cost < old_cost:
+            return self._process_decrease(edge=edge)
+
+        if new_cost > old_cost and edge.node_to.parent_edge is edge:
+            return self._process_increase(edge=edge)
+
+        return set()
+
+    def _process_decrease(self, edge: GraphEdge) -> Set[GraphNode]:
+        changed_nodes: Set[GraphNode] = set()
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        if self._relax_tree_edge(edge=edge):
+            changed_nodes.add(edge.node_to)
+            priority_queue.push(key=edge.node_to, priority=edge.node_to.shortest_path_estimate)
+
+        while not priority_queue.is_empty():
+            node: GraphNode
+            node, _ = priority_queue.pop_min()
+            for node_edge in node.edges:
+                if self._relax_tree_edge(edge=node_edge):
+                    changed_nodes.add(node_edge.node_to)
+                    priority_queue.push_or_decrease_key(
+                        key=node_edge.node_to,
+                        priority=node_edge.node_to.shortest_path_estimate
+                    )
+
+        return changed_nodes
+
+    def _process_increase(self, edge: GraphEdge) -> Set[GraphNode]:
+        """
+        1) Собирает поддерево вершины, в которую входит ребро, и запоминает старые оценки его вершин.
+        2) Каждая вершина поддерева получает оценку по лучшему входящему ребру из вершины вне поддерева
+           (или бесконечность, если таких ребер нет) и попадает в очередь с приоритетами.
+        3) Алгоритм Дейкстры ослабляет ребра только внутри поддерева.
+        """
+
+        affected_nodes: List[GraphNode] = [edge.node_to]
+        for node in affected_nodes:
+            affected_nodes.extend(self._children[node])
+
+        old_estimates: Dict[GraphNode, Union[int, float]] = {
+            node: node.shortest_path_estimate for node in affected_nodes
+        }
+        for node in affected_nodes:
+            self._detach_from_tree(node=node)
+            node.shortest_path_estimate = math.inf
+
+        priority_queue: IndexedMinHeap = IndexedMinHeap()
+        for node in affected_nodes:
+            for reverse_edge in self._reverse_edges.get(node, []):
+                if reverse_edge.node_from not in old_estimates:
+                    self._relax_tree_edge(edge=reverse_edge)
+
+            if node.shortest_path_estimate != math.inf:
+                priority_queue.push(key=node, priority=node.shortest_path_estimate)
+
+        while not priority_queue.is_empty():
+            node, _ = priority_queue.pop_min()
+            for node_edge in node.edges:
+                if node_edge.node_to in old_estimates and self._relax_tree_edge(edge=node_edge):
+                    priority_queue.push_or_decrease_key(
+                        key=node_edge.node_to,
+                        priority=node_edge.node_to.shortest_path_estimate
+                    )
+
+        return {node for node, old_estimate in old_estimates.items() if node.shortest_path_estimate != old_estimate}
+
+    def _relax_tree_edge(self, edge: GraphEdge) -> bool:
+        """
+        Ослабление ребра, которое вместе с родителем вершины обновляет и индекс детей в дереве кратчайших путей.
+        """
+
+        old_parent_edge: Optional[GraphEdge] = edge.node_to.parent_edge
+        if not self._relax(edge=edge):
+            return False
+
+        # _relax уже записал новое родительское ребро, поэтому индекс детей исправляется по старому:
+        if old_parent_edge is not None:
+            self._children[old_parent_edge.node_from].discard(edge.node_to)
+
+        self._children[edge.node_from].add(edge.node_to)
+        return True
+
+    def _detach_from_tree(self, node: GraphNode) -> None:
+        if node.parent_edge is not None:
+            self._children[node.parent_edge.node_from].discard(node)
+
+        node.parent = None
+        node.parent_edge = None
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    s: GraphNode = GraphNode('s')
+    t: GraphNode = GraphNode('t')
+    y: GraphNode = GraphNode('y')
+    x: GraphNode = GraphNode('x')
+    z: GraphNode = GraphNode('z')
+
+    # Create edges:
+    s.edges = [
+        GraphEdge(node_from=s, node_to=t, cost=10),
+        GraphEdge(node_from=s, node_to=y, cost=5),
+    ]
+
+    t.edges = [
+        GraphEdge(node_from=t, node_to=y, cost=2),
+        GraphEdge(node_from=t, node_to=x, cost=1),
+    ]
+
+    y.edges = [
+        GraphEdge(node_from=y, node_to=t, cost=3),
+        GraphEdge(node_from=y, node_to=z, cost=2),
+        GraphEdge(node_from=y, node_to=x, cost=9),
+    ]
+
+    x.edges = [
+        GraphEdge(node_from=x, node_to=z, cost=4),
+    ]
+
+    z.edges = [
+        GraphEdge(node_from=z, node_to=x, cost=6),
+        GraphEdge(node_from=z, node_to=s, cost=7),
+    ]
+
+    graph_roots: List[GraphNode] = [s, t, y, x, z]
+    dynamic_shortest_paths: DynamicShortestPaths = DynamicShortestPaths()
+    dynamic_shortest_paths.process_graph(roots=graph_roots, source_node=s)
+    dynamic_shortest_paths.print_shortest_path(node_to=x)
+
+    # Ребро s -> y входит в дерево кратчайших путей, поэтому его удорожание затрагивает y, t, x и z:
+    changed: Set[GraphNode] = dynamic_shortest_paths.update_edge(edge=s.edges[1], new_cost=20)
+    print(f'\nChanged after increase: {sorted(node.value for node in changed)}')
+    dynamic_shortest_paths.print_shortest_path(node_to=x)
+
+    # Удешевление ребра t -> y снова делает путь через y выгодным для y и z:
+    changed = dynamic_shortest_paths.update_edge(edge=t.edges[0], new_cost=0)
+    print(f'\nChanged after decrease: {sorted(node.value for node in changed)}')
+    dynamic_shortest_paths.print_shortest_path(node_to=z)
+
+    import random
+    from typing import Sequence
+
+    from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+
+    # Сверяем оценки после каждого изменения с полным пересчетом алгоритмом Дейкстры на случайных графах:
+    generator: random.Random = random.Random(12)
+    for _ in range(100):
+        nodes: List[GraphNode] = [GraphNode(value) for value in range(generator.randint(1, 25))]
+        edges: List[GraphEdge] = []
+        for node_from in nodes:
+            for _ in range(generator.randint(0, 4)):
+                edges.append(GraphEdge(node_from=node_from, node_to=generator.choice(nodes), cost=generator.randint(0, 9)))
+                node_from.edges.append(edges[-1])
+
+        if not edges:
+            continue
+
+        dynamic_shortest_paths.process_graph(roots=nodes, source_node=nodes[0])
+        for _ in range(30):
+            estimates: List[Union[int, float]] = [node.shortest_path_estimate for node in nodes]
+            changed = dynamic_shortest_paths.update_edge(edge=generator.choice(edges), new_cost=generator.randint(0, 9))
+
+            # Поиск по CSR-представлению не изменяет узлы, поэтому дерево путей продолжает обновляться:
+            csr_graph: CSRGraph = CSRGraph.from_nodes(roots=nodes)
+            distances: Sequence[float] = DijkstraAlgorithm().process_csr_graph(graph=csr_graph, source=0).distances
+            assert [node.shortest_path_estimate for node in nodes] == [
+                distances[csr_graph.vertex_id(node)] for node in nodes
+            ]
+            assert changed == {
+                node for node, estimate in zip(nodes, estimates) if node.shortest_path_estimate != estimate
+            }
+            for node in nodes:
+                if node.parent_edge is not None:
+                    assert node.parent_edge.node_from.shortest_path_estimate + node.parent_edge.cost == (
+                        node.shortest_path_estimate
+                    )
+
+    print('\nRandom graphs check passed.')
@@ -0,0 +1,189 @@
+"""
+Потоковая загрузка графа из текстового файла со списком ребер.
+
+Каждая строка файла описывает одно ребро: метка вершины-источника, метка вершины-приемника и необязательная
+стоимость ребра (по умолчанию - default_cost), разделенные пробельными символами или указанным разделителем
+(например, запятой для CSV). Пустые строки и строки, начинающиеся с comment_prefix, пропускаются.
+Файлы с расширением .gz (или начинающиеся с сигнатуры gzip) распаковываются на лету.
+
+Файл читается порциями примерно по chunk_size байт, поэтому в памяти никогда не находится файл целиком:
+метки вершин сразу заменяются плотными целочисленными идентификаторами (интернируются) в порядке первого
+появления, а ребра дописываются в плоские массивы array. По окончании чтения из массивов строится
+CSR-представление графа (см. CSRGraph) или, при необходимости, узлы GraphNode с ребрами GraphEdge.
+
+Пример файла (граф алгоритма Дейкстры, см. Dijkstra_algorithm.py):
+
+# source target cost
+s t 10
+s y 5
+t y 2
+...
+
+Асимптоматическая скорость загрузки составляет O(V + E), где V - количество вершин графа, а E - количество ребер.
+Память: O(V) на метки вершин и 24 байта на ребро.
+"""
+
+
+import gzip
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+
+
+GZIP_SIGNATURE: bytes = b'\x1f\x8b'
+
+
+class EdgeListLoader:
+
+    def __init__(
+            self,
+            delimiter: Optional[str] = None,
+            comment_prefix: str = '#',
+            default_cost: Union[int, float] = 1,
+            chunk_size: int = 1 << 20
+    ) -> None:
+        """
+        :param delimiter: Разделитель полей строки. None - любая последовательность пробельных символов.
+        :param comment_prefix: Префикс строк-комментариев (например, заголовка).
+        :param default_cost: Стоимость ребра, если она не указана в строке.
+        :param chunk_size: Примерный размер порции файла в байтах, читаемой за один раз.
+        """
+
+        self._delimiter: Optional[str] = delimiter
+        self._comment_prefix: str = comment_prefix
+        self._default_cost: Union[int, float] = default_cost
+        self._chunk_size: int = chunk_size
+
+    def load_csr(self, path: str) -> CSRGraph:
+        """
+        Загружает граф в CSR-представлении. Метками вершин являются строки из файла.
+        """
+
+        vertex_ids: Dict[str, int] = {}
+        sources: array = array('l')
+        targets: array = array('l')
+        weights: array = array('d')
+        for chunk_sources, chunk_targets, chunk_weights in self._read_chunks(path=path, vertex_ids=vertex_ids):
+            sources.extend(chunk_sources)
+            targets.extend(chunk_targets)
+            weights.extend(chunk_weights)
+
+        return CSRGraph.from_edge_arrays(
+            vertices_count=len(vertex_ids),
+            sources=sources,
+            targets=targets,
+            weights=weights,
+            labels=list(vertex_ids)
+        )
+
+    def load_nodes(self, path: str) -> List[GraphNode]:
+        """
+        Загружает граф в виде узлов GraphNode, значениями которых являются метки вершин.
+        Узлы возвращаются в порядке первого появления меток в файле.
+        """
+
+        graph: CSRGraph = self.load_csr(path=path)
+        nodes: List[GraphNode] = [GraphNode(label) for label in graph.labels]
+        for vertex, node in enumerate(nodes):
+            node.edges = [
+                GraphEdge(node_from=node, node_to=nodes[node_to], cost=int(cost) if cost.is_integer() else cost)
+                for node_to, cost in graph.edges(vertex)
+            ]
+
+        return nodes
+
+    def _read_chunks(self, path: str, vertex_ids: Dict[str, int]) -> Iterator[Tuple[array, array, array]]:
+        """
+        Читает файл порциями и возвращает ребра каждой порции в виде трех массивов.
+        Новые метки вершин добавляются в vertex_ids.
+        """
+
+        delimiter: Optional[str] = self._delimiter
+        comment_prefix: str = self._comment_prefix
+        default_cost: float = float(self._default_cost)
+        get_vertex_id: Callable[[str], Optional[int]] = vertex_ids.get
+
+        with self._open(path=path) as file:
+            for lines in iter(lambda: file.readlines(self._chunk_size), []):
+                chunk_sources: array = array('l')
+                chunk_targets: array = array('l')
+                chunk_weights: array = array('d')
+
+                # Методы массивов и словаря сохраняются в локальные переменные: это самый горячий цикл загрузки.
+                append_source: Callable[[int], None] = chunk_sources.append
+                append_target: Callable[[int], None] = chunk_targets.append
+                append_weight: Callable[[float], None] = chunk_weights.append
+                lines_fields: Iterator[List[str]] = (
+                    map(str.split, lines) if delimiter is None else (line.strip().split(delimiter) for line in lines)
+                )
+
+                for fields in lines_fields:
+                    if not fields or not fields[0] or (comment_prefix and fields[0].startswith(comment_prefix)):
+                        continue
+
+                    if len(fields) < 2:
+                        line: str = (delimiter or ' ').join(fields)
+                        raise ValueError(f'Line "{line}" of {path} must contain at least two vertices.')
+
+                    source: Optional[int] = get_vertex_id(fields[0])
+                    if source is None:
+                        source = vertex_ids[fields[0]] = len(vertex_ids)
+
+                    target: Optional[int] = get_vertex_id(fields[1])
+                    if target is None:
+                        target = vertex_ids[fields[1]] = len(vertex_ids)
+
+                    append_source(source)
+                    append_target(target)
+                    append_weight(float(fields[2]) if len(fields) > 2 else default_cost)
+
+                yield chunk_sources, chunk_targets, chunk_weights
+
+    @staticmethod
+    def _open(path: str) -> TextIO:
+        with open(path, 'rb') as file:
+            is_gzip: bool = file.read(len(GZIP_SIGNATURE)) == GZIP_SIGNATURE
+
+        if is_gzip or path.endswith('.gz'):
+            return gzip.open(path, 'rt', encoding='utf-8')
+
+        return open(path, 'r', encoding='utf-8')
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+        DijkstraAlgorithm
+    )
+
+    edge_lines: List[str] = [
+        '# source target cost',
+        's t 10', 's y 5',
+        't y 2', 't x 1',
+        'y t 3', 'y z 2', 'y x 9',
+        'x z 4',
+        'z x 6', 'z s 7',
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path: str = os.path.join(directory, 'graph.txt')
+        with open(text_path, 'w', encoding='utf-8') as text_file:
+            text_file.write('\n'.join(edge_lines))
+
+        csv_path: str = os.path.join(directory, 'graph.csv.gz')
+        with gzip.open(csv_path, 'wt', encoding='utf-8') as csv_file:
+            csv_file.write('\n'.join(line.replace(' ', ',') for line in edge_lines))
+
+        csr_graph: CSRGraph = EdgeListLoader().load_csr(path=text_path)
+        print(f'{csr_graph} loaded from {os.path.basename(text_path)}.')
+
+        graph_nodes: List[GraphNode] = EdgeListLoader(delimiter=',').load_nodes(path=csv_path)
+        print(f'{len(graph_nodes)} nodes loaded from {os.path.basename(csv_path)}.')
+
+    dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+    dijkstra_algorithm.process_graph(roots=graph_nodes, source_node=graph_nodes[0])
+    dijkstra_algorithm.print_shortest_path(node_to=graph_nodes[3])
@@ -0,0 +1,237 @@
+"""
+Бинарный формат хранения графа на диске с загрузкой без копирования данных.
+
+Файл содержит граф в CSR-представлении (см. CSRGraph) и состоит из следующих частей:
+1) заголовок размером 24 байта: сигнатура b'CSRG', версия формата (uint16), зарезервированное поле (uint16),
+   количество вершин V (int64) и количество ребер E (int64);
+2) массив offsets из V + 1 целых чисел int64;
+3) массив targets из E целых чисел int64;
+4) массив weights из E чисел с плавающей точкой float64.
+
+Все числа записаны в порядке байтов little-endian, а каждый массив выровнен по границе 8 байт.
+Благодаря этому файл открывается через mmap, а массивы графа представляются объектами memoryview прямо
+поверх отображенных в память страниц файла: при открытии не создается ни одного Python-объекта на ребро,
+а время открытия не зависит от размера графа. Страницы файла находятся в страничном кэше операционной системы,
+поэтому несколько процессов, открывших один и тот же файл, разделяют одну и ту же физическую память.
+
+Асимптоматическая скорость открытия файла составляет O(1), записи - O(V + E),
+где V - количество вершин графа, а E - количество ребер.
+"""
+
+
+from __future__ import annotations
+import mmap
+import struct
+import sys
+from array import array
+from types import TracebackType
+from typing import Any, BinaryIO, List, Optional, Sequence, Tuple, Type, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+
+
+GRAPH_FILE_SIGNATURE: bytes = b'CSRG'
+GRAPH_FILE_VERSION: int = 1
+GRAPH_FILE_HEADER: struct.Struct = struct.Struct('<4sHHqq')
+
+
+def write_graph_file(path: str, graph: CSRGraph) -> None:
+    """
+    Записывает граф в файл. Метки вершин не сохраняются: вершины в файле идентифицируются своими номерами.
+    """
+
+    with open(path, 'wb') as file:
+        file.write(_pack_header(graph=graph))
+        for values, typecode in _get_graph_arrays(graph=graph):
+            file.write(_to_little_endian(values=values, typecode=typecode))
+
+
+def get_graph_buffer_size(graph: CSRGraph) -> int:
+    return GRAPH_FILE_HEADER.size + 8 * (graph.vertices_count + 1 + 2 * graph.edges_count)
+
+
+def write_graph_buffer(buffer: memoryview, graph: CSRGraph) -> None:
+    """
+    Записывает граф в том же формате, что и write_graph_file, в произвольный буфер, например,
+    в блок разделяемой памяти. Размер буфера должен быть не меньше get_graph_buffer_size(graph).
+    """
+
+    header: bytes = _pack_header(graph=graph)
+    buffer[:len(header)] = header
+    offset: int = len(header)
+    for values, typecode in _get_graph_arrays(graph=graph):
+        raw: bytes = _to_little_endian(values=values, typecode=typecode)
+        buffer[offset:offset + len(raw)] = raw
+        offset += len(raw)
+
+
+def _pack_header(graph: CSRGraph) -> bytes:
+    return GRAPH_FILE_HEADER.pack(
+        GRAPH_FILE_SIGNATURE,
+        GRAPH_FILE_VERSION,
+        0,
+        graph.vertices_count,
+        graph.edges_count
+    )
+
+
+def _get_graph_arrays(graph: CSRGraph) -> Tuple[Tuple[Sequence[Union[int, float]], str], ...]:
+    return (graph.offsets, 'q'), (graph.targets, 'q'), (graph.weights, 'd')
+
+
+def _to_little_endian(values: Sequence[Union[int, float]], typecode: str) -> bytes:
+    # Тип 'l' имеет размер 4 байта на некоторых платформах, поэтому приводим массивы к типам фиксированной ширины:
+    if isinstance(values, array) and values.typecode == typecode:
+        fixed_width: array = values
+    else:
+        fixed_width = array(typecode, values)
+
+    if sys.byteorder == 'big':
+        fixed_width = array(typecode, fixed_width)
+        fixed_width.byteswap()
+
+    return fixed_width.tobytes()
+
+
+class GraphBufferView:
+    """
+    Граф поверх произвольного буфера в формате графового файла (отображенного в память файла, блока разделяемой
+    памяти и т.д.). Массивы графа являются представлениями memoryview буфера и не копируются. Пока существует
+    представление, буфер не может быть закрыт, поэтому после работы представление необходимо освободить через release().
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        self._views: List[memoryview] = []
+
+        signature, version, _, vertices_count, edges_count = GRAPH_FILE_HEADER.unpack_from(buffer, 0)
+        if signature != GRAPH_FILE_SIGNATURE or version != GRAPH_FILE_VERSION:
+            raise ValueError(f'Buffer does not contain a graph of version {GRAPH_FILE_VERSION}.')
+
+        expected_size: int = GRAPH_FILE_HEADER.size + 8 * (vertices_count + 1 + 2 * edges_count)
+        if len(buffer) < expected_size:
+            raise ValueError('Buffer is truncated or corrupted.')
+
+        offset: int = GRAPH_FILE_HEADER.size
+        offsets: Sequence[int] = self._map_array(buffer=buffer, offset=offset, length=vertices_count + 1, typecode='q')
+        offset += 8 * (vertices_count + 1)
+        targets: Sequence[int] = self._map_array(buffer=buffer, offset=offset, length=edges_count, typecode='q')
+        offset += 8 * edges_count
+        weights: Sequence[float] = self._map_array(buffer=buffer, offset=offset, length=edges_count, typecode='d')
+
+        self._graph: CSRGraph = CSRGraph(offsets=offsets, targets=targets, weights=weights)
+
+    def _map_array(self, buffer: Any, offset: int, length: int, typecode: str) -> Sequence[Union[int, float]]:
+        raw: memoryview = memoryview(buffer)[offset:offset + 8 * length]
+        if sys.byteorder == 'big':
+            # На платформах с обратным порядком байтов копирование неизбежно:
+            values: array = array(typecode, raw.tobytes())
+            values.byteswap()
+            raw.release()
+            return values
+
+        view: memoryview = raw.cast(typecode)
+        self._views += [view, raw]
+        return view
+
+    @property
+    def graph(self) -> CSRGraph:
+        return self._graph
+
+    def release(self) -> None:
+        for view in self._views:
+            view.release()
+
+        self._views.clear()
+
+
+class MappedGraphFile:
+    """
+    Граф, открытый из файла через mmap. Должен использоваться как контекстный менеджер,
+    либо закрываться явно через close(), поскольку граф ссылается на отображенную в память область файла.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file: BinaryIO = open(path, 'rb')
+        self._mmap: Optional[mmap.mmap] = None
+        self._buffer_view: Optional[GraphBufferView] = None
+
+        # Файл закрывается при любой ошибке, в том числе если mmap не удалось создать
+        # (ValueError для пустого файла или OSError):
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer_view = GraphBufferView(buffer=self._mmap)
+            if len(self._mmap) != get_graph_buffer_size(graph=self._buffer_view.graph):
+                raise ValueError(f'File {path} is truncated or corrupted.')
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def graph(self) -> CSRGraph:
+        return self._buffer_view.graph
+
+    def close(self) -> None:
+        # Все представления должны быть освобождены до закрытия mmap, иначе будет выброшено BufferError:
+        if self._buffer_view is not None:
+            self._buffer_view.release()
+            self._buffer_view = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        self._file.close()
+
+    def __enter__(self) -> MappedGraphFile:
+        return self
+
+    def __exit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_val: Optional[BaseException],
+            exc_tb: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+        ShortestPathsResult
+    )
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+        DijkstraAlgorithm
+    )
+
+    source_graph: CSRGraph = CSRGraph.from_edge_list(
+        vertices_count=5,
+        edges=[
+            (0, 1, 10), (0, 2, 5),
+            (1, 2, 2), (1, 3, 1),
+            (2, 1, 3), (2, 4, 2), (2, 3, 9),
+            (3, 4, 4),
+            (4, 3, 6), (4, 0, 7),
+        ]
+    )
+
+    graph_path: str = os.path.join(tempfile.mkdtemp(), 'graph.csr')
+    write_graph_file(path=graph_path, graph=source_graph)
+
+    with MappedGraphFile(path=graph_path) as mapped_graph_file:
+        print(mapped_graph_file.graph)
+        result: ShortestPathsResult = DijkstraAlgorithm().process_csr_graph(graph=mapped_graph_file.graph, source=0)
+        for vertex in range(mapped_graph_file.graph.vertices_count):
+            print(f'Shortest path from 0 to {vertex} costs {result.distances[vertex]} via {result.path_to(vertex)}.')
+
+    # Пустой файл нельзя отобразить в память, при этом открытый файл не должен остаться незакрытым:
+    open(graph_path, 'wb').close()
+    try:
+        MappedGraphFile(path=graph_path)
+    except ValueError as error:
+        print(f'Empty file rejected: {error}')
+    else:
+        raise AssertionError('Empty file must be rejected.')
+
+    os.remove(graph_path)
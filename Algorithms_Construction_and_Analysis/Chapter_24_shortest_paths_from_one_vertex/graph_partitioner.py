@@ -0,0 +1,122 @@
+"""
+Разбиение графа на ячейки с небольшим количеством граничных вершин.
+
+Граничной называется вершина, у которой есть входящее или исходящее ребро, соединяющее ее с вершиной другой ячейки
+(такие ребра называются разрезающими). Чем компактнее ячейки, тем меньше граничных вершин и разрезающих ребер,
+поэтому ячейки выращиваются поиском в ширину (greedy graph growing) по неориентированной версии графа:
+1) Очередная ячейка начинается с вершины-затравки и растет поиском в ширину по еще не распределенным вершинам,
+   пока не наберет cell_size вершин или пока поиску не станет некуда расти.
+2) Затравкой следующей ячейки выбирается нераспределенная вершина, соседняя с уже построенными ячейками
+   (в порядке их обнаружения), поэтому ячейки прилегают друг к другу, а не разбрасываются по графу.
+   Если таких вершин нет (компонента связности исчерпана), берется любая нераспределенная вершина.
+На дорожных графах и решетках такие ячейки близки к ромбам, и количество граничных вершин ячейки
+пропорционально квадратному корню из ее размера.
+
+Граф для теста - решетка, для которой выводится количество ячеек и граничных вершин.
+
+Асимптоматическая скорость разбиения составляет O(V + E), где V - количество вершин графа, а E - количество ребер.
+"""
+
+
+from array import array
+from collections import deque
+from typing import Deque, List, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+
+
+class GraphPartitioner:
+
+    def __init__(self, cell_size: int = 1000) -> None:
+        """
+        :param cell_size: Наибольшее количество вершин в одной ячейке.
+        """
+
+        if cell_size < 1:
+            raise ValueError(f'Cell size={cell_size} must be positive.')
+
+        self._cell_size: int = cell_size
+
+    def partition(self, graph: CSRGraph) -> array:
+        """
+        :return: Массив номеров ячеек, индексируемый идентификатором вершины. Ячейки нумеруются с нуля.
+        """
+
+        reversed_graph: CSRGraph = graph.reversed()
+        cells: array = array('l', [-1]) * graph.vertices_count
+        cells_count: int = 0
+
+        # Нераспределенные вершины, соседние с уже построенными ячейками, - кандидаты в затравки:
+        seeds: Deque[int] = deque()
+        next_vertex: int = 0
+
+        while True:
+            while seeds and cells[seeds[0]] != -1:
+                seeds.popleft()
+
+            if seeds:
+                seed: int = seeds.popleft()
+            else:
+                while next_vertex < graph.vertices_count and cells[next_vertex] != -1:
+                    next_vertex += 1
+
+                if next_vertex == graph.vertices_count:
+                    break
+
+                seed = next_vertex
+
+            cells[seed] = cells_count
+            cell_size: int = 1
+            queue: Deque[int] = deque([seed])
+            while queue:
+                vertex: int = queue.popleft()
+                for adjacent_graph in (graph, reversed_graph):
+                    for neighbor in adjacent_graph.neighbors(vertex):
+                        if cells[neighbor] != -1:
+                            continue
+
+                        if cell_size < self._cell_size:
+                            cells[neighbor] = cells_count
+                            cell_size += 1
+                            queue.append(neighbor)
+                        else:
+                            seeds.append(neighbor)
+
+            cells_count += 1
+
+        return cells
+
+    @staticmethod
+    def get_boundary_vertices(graph: CSRGraph, cells: array) -> List[int]:
+        """
+        Граничные вершины разбиения в порядке возрастания идентификаторов.
+        """
+
+        is_boundary: bytearray = bytearray(graph.vertices_count)
+        for node_from in range(graph.vertices_count):
+            for node_to in graph.neighbors(node_from):
+                if cells[node_from] != cells[node_to]:
+                    is_boundary[node_from] = is_boundary[node_to] = 1
+
+        return [vertex for vertex in range(graph.vertices_count) if is_boundary[vertex]]
+
+
+if __name__ == '__main__':
+    width: int = 100
+    grid_edges: List[Tuple[int, int, int]] = []
+    for row in range(width):
+        for column in range(width):
+            if column + 1 < width:
+                grid_edges += [(row * width + column, row * width + column + 1, 1),
+                               (row * width + column + 1, row * width + column, 1)]
+            if row + 1 < width:
+                grid_edges += [(row * width + column, (row + 1) * width + column, 1),
+                               ((row + 1) * width + column, row * width + column, 1)]
+
+    grid_graph: CSRGraph = CSRGraph.from_edge_list(vertices_count=width * width, edges=grid_edges)
+    for graph_cell_size in (100, 500, 2000):
+        grid_cells: array = GraphPartitioner(cell_size=graph_cell_size).partition(graph=grid_graph)
+        boundary_vertices: List[int] = GraphPartitioner.get_boundary_vertices(graph=grid_graph, cells=grid_cells)
+        assert all(cell != -1 for cell in grid_cells)
+        print(f'Cell size {graph_cell_size}: {max(grid_cells) + 1} cells, {len(boundary_vertices)} boundary vertices '
+              f'of {grid_graph.vertices_count}.')
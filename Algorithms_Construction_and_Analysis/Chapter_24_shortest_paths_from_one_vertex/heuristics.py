@@ -0,0 +1,128 @@
+"""
+Эвристики для алгоритма A*.
+
+Эвристика - это функция h(v, t), которая оценивает стоимость кратчайшего пути от вершины v до целевой вершины t.
+Эвристика допустима, если она никогда не переоценивает реальную стоимость пути, и согласована, если для любого
+ребра (u, v) выполняется h(u, t) <= cost(u, v) + h(v, t). Согласованная эвристика гарантирует, что A* обработает
+каждую вершину не более одного раза, а найденный путь будет кратчайшим.
+
+1) Евклидово и манхэттенское расстояния между координатами вершин - согласованные эвристики, если стоимость
+   каждого ребра не меньше соответствующего расстояния между его концами.
+2) Эвристика ALT (A*, Landmarks, Triangle inequality) не требует координат. Заранее выбирается несколько
+   вершин-ориентиров L и вычисляются кратчайшие расстояния от каждого ориентира до всех вершин и от всех вершин
+   до каждого ориентира. По неравенству треугольника:
+   d(v, t) >= d(L, t) - d(L, v) и d(v, t) >= d(v, L) - d(t, L),
+   поэтому максимум этих разностей по всем ориентирам - согласованная оценка снизу.
+   Предварительные вычисления занимают O(k (V + E) log(V)) времени и O(kV) памяти, где k - количество ориентиров,
+   а вычисление эвристики - O(k).
+"""
+
+
+from __future__ import annotations
+import math
+from typing import Any, Callable, List, Sequence, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode
+
+
+Heuristic = Callable[[Any, Any], Union[int, float]]
+
+
+def zero_heuristic(node: Any, target_node: Any) -> int:
+    """
+    Нулевая эвристика, с которой A* превращается в алгоритм Дейкстры с остановкой в целевой вершине.
+    """
+
+    return 0
+
+
+def euclidean_heuristic(node: Any, target_node: Any) -> float:
+    """
+    Евклидово расстояние между координатами (x, y) вершин.
+    """
+
+    return math.hypot(node.x - target_node.x, node.y - target_node.y)
+
+
+def manhattan_heuristic(node: Any, target_node: Any) -> float:
+    """
+    Манхэттенское расстояние между координатами (x, y) вершин. Подходит для графов-решеток,
+    где перемещаться можно только по горизонтали и вертикали.
+    """
+
+    return abs(node.x - target_node.x) + abs(node.y - target_node.y)
+
+
+class LandmarksHeuristic:
+    """
+    Эвристика ALT. Таблицы расстояний хранятся в массивах, индексируемых идентификатором вершины в CSR-графе.
+    """
+
+    def __init__(self, roots: List[GraphNode], landmarks: Sequence[GraphNode]) -> None:
+        self._graph: CSRGraph = CSRGraph.from_nodes(roots=roots)
+        reversed_graph: CSRGraph = self._graph.reversed()
+        dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+
+        # Расстояния от ориентира до вершин и от вершин до ориентира (по обращенному графу):
+        self._distances_from_landmarks: List[Sequence[float]] = []
+        self._distances_to_landmarks: List[Sequence[float]] = []
+        for landmark in landmarks:
+            landmark_id: int = self._graph.vertex_id(landmark)
+            self._distances_from_landmarks.append(
+                dijkstra_algorithm.process_csr_graph(graph=self._graph, source=landmark_id).distances
+            )
+            self._distances_to_landmarks.append(
+                dijkstra_algorithm.process_csr_graph(graph=reversed_graph, source=landmark_id).distances
+            )
+
+    @classmethod
+    def with_farthest_landmarks(cls, roots: List[GraphNode], landmarks_count: int) -> LandmarksHeuristic:
+        """
+        Выбирает ориентиры жадно: каждый следующий ориентир - вершина, наиболее удаленная от уже выбранных.
+        Ориентиры на "окраинах" графа дают наиболее точные оценки.
+        """
+
+        graph: CSRGraph = CSRGraph.from_nodes(roots=roots)
+        dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+        nearest_landmark_distances: List[float] = [math.inf] * graph.vertices_count
+        landmark_ids: List[int] = [0]
+
+        while len(landmark_ids) < min(landmarks_count, graph.vertices_count):
+            distances: Sequence[float] = dijkstra_algorithm.process_csr_graph(
+                graph=graph,
+                source=landmark_ids[-1]
+            ).distances
+
+            farthest: int = landmark_ids[-1]
+            for vertex in range(graph.vertices_count):
+                nearest_landmark_distances[vertex] = min(nearest_landmark_distances[vertex], distances[vertex])
+                farthest_distance: float = nearest_landmark_distances[farthest]
+                if (nearest_landmark_distances[vertex] != math.inf and
+                        (farthest_distance == math.inf or nearest_landmark_distances[vertex] > farthest_distance)):
+                    farthest = vertex
+
+            if farthest in landmark_ids:
+                break
+
+            landmark_ids.append(farthest)
+
+        return cls(roots=roots, landmarks=[graph.label(landmark_id) for landmark_id in landmark_ids])
+
+    def __call__(self, node: GraphNode, target_node: GraphNode) -> float:
+        vertex: int = self._graph.vertex_id(node)
+        target: int = self._graph.vertex_id(target_node)
+
+        estimate: float = 0
+        for distances_from, distances_to in zip(self._distances_from_landmarks, self._distances_to_landmarks):
+            # Бесконечные расстояния не дают полезной оценки снизу и пропускаются:
+            if distances_from[target] != math.inf and distances_from[vertex] != math.inf:
+                estimate = max(estimate, distances_from[target] - distances_from[vertex])
+
+            if distances_to[vertex] != math.inf and distances_to[target] != math.inf:
+                estimate = max(estimate, distances_to[vertex] - distances_to[target])
+
+        return estimate
@@ -0,0 +1,31 @@
+from enum import Enum
+
+
+class BellmanFordMode(str, Enum):
+    """
+    Режимы работы алгоритма Беллмана-Форда.
+    """
+
+    CLASSIC = 'classic'  # Ровно V проходов по всем ребрам графа
+    EARLY_TERMINATION = 'early_termination'  # Остановка после первого прохода без единого ослабления
+    QUEUE = 'queue'  # Очередь вершин, чьи оценки изменились (SPFA)
+    HOP_LIMITED = 'hop_limited'  # Кратчайшие пути не более чем из k ребер: не более k проходов по двум массивам оценок
+
+
+class DijkstraQueueMode(str, Enum):
+    """
+    Реализации неубывающей очереди с приоритетами для алгоритма Дейкстры.
+    """
+
+    BINARY_HEAP = 'binary_heap'  # Адресуемая бинарная пирамида, любые неотрицательные веса
+    DIAL = 'dial'  # Циклическая очередь на корзинах, целые веса от 0 до небольшого C
+    RADIX_HEAP = 'radix_heap'  # Поразрядная пирамида, целые неотрицательные веса любого диапазона
+
+
+class DAGPathMode(str, Enum):
+    """
+    Режимы поиска путей в ациклическом графе.
+    """
+
+    SHORTEST = 'shortest'  # Кратчайшие пути
+    LONGEST = 'longest'  # Длиннейшие (критические) пути, например, длительность сборки по графу зависимостей
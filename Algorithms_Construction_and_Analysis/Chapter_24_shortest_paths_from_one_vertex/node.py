@@ -25,7 +25,10 @@ class GraphNode:
         self.shortest_path_estimate: Union[int, float] = math.inf  # Нет пути к узлу из исходного узла
         self.value: Any = value
         self.edges: List[GraphEdge] = []
-        self.path_from_source: List[GraphEdge] = []
+
+        # Ребро, по которому был найден кратчайший путь до узла. Путь от исходного узла восстанавливается
+        # по цепочке таких ребер только по запросу, вместо хранения копии пути в каждом узле:
+        self.parent_edge: Optional[GraphEdge] = None
 
     def __str__(self) -> str:
         return f'Node with value={self.value}'
@@ -0,0 +1,361 @@
+"""
+Поиск кратчайшего пути с ограничением на ресурс (Resource Constrained Shortest Path, RCSP).
+
+Каждое ребро графа помимо стоимости (например, времени в пути) расходует ресурс (например, деньги или топливо).
+Требуется найти путь наименьшей стоимости между двумя вершинами, суммарный расход ресурса на котором не превосходит
+бюджета. Задача NP-трудна, поэтому оптимальный путь ищется перебором меток с отсечениями (label-setting).
+
+Метка - это частичный путь от исходной вершины: вершина, в которой он заканчивается, его стоимость, расход ресурса
+и ссылка на метку-предшественника. В отличие от алгоритма Дейкстры, в каждой вершине может оказаться несколько меток,
+поскольку более дорогой путь может расходовать меньше ресурса.
+1) Метки извлекаются из очереди с приоритетами в порядке неубывания стоимости, как вершины в алгоритме A*:
+   приоритетом служит стоимость метки плюс стоимость кратчайшего пути от ее вершины до целевой без учета бюджета
+   (допустимая и монотонная эвристика, вычисляемая алгоритмом Дейкстры по обращенному графу).
+2) Отсечение по доминированию: метка доминирует другую метку той же вершины, если ее стоимость и расход ресурса
+   не больше. Поскольку метки одной вершины извлекаются в порядке неубывания стоимости, новая метка доминируется
+   тогда и только тогда, когда ее расход ресурса не меньше наименьшего расхода уже извлеченных меток этой вершины,
+   поэтому проверка выполняется за O(1) по одному числу на вершину.
+3) Отсечение по бюджету: метка отбрасывается, если ее расход ресурса вместе с наименьшим расходом ресурса
+   от ее вершины до целевой (также вычисляемым алгоритмом Дейкстры по обращенному графу) превышает бюджет.
+Первая извлеченная метка целевой вершины задает оптимальный путь.
+
+Стоимости и расходы ресурса ребер должны быть неотрицательными.
+
+Граф для теста будет следующим (ориентированный взвешенный), где символ "*" является частью ребра
+от вершины к вершине, "←" - направление графа, а пары чисел - стоимость ребра и расход ресурса:
+
+     * * 1/10 * → T * * 1/10 * *
+   *                              ↘
+S * * * 2/3 * * → Y * * 2/3 * * → Z
+   *                              ↗
+     * * 3/1 * → X * * 3/1 * * *
+
+Без ограничения кратчайшим является путь S -> T -> Z стоимостью 2 с расходом ресурса 20, при бюджете 10 -
+путь S -> Y -> Z стоимостью 4, а при бюджете 5 - путь S -> X -> Z стоимостью 6.
+
+Асимптоматическая скорость алгоритма в худшем случае экспоненциальна, однако благодаря отсечениям на практике
+количество меток обычно сравнимо с количеством вершин, умноженным на небольшое число Парето-оптимальных меток
+в каждой вершине. Каждая метка обрабатывается за O(log(L)) с учетом очереди с приоритетами, где L - количество меток.
+"""
+
+
+import heapq
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+
+
+class ResourceGraphEdge(GraphEdge):
+
+    def __init__(
+            self,
+            node_to: GraphNode,
+            node_from: GraphNode,
+            cost: int,
+            resource: Union[int, float] = 0
+    ) -> None:
+        super().__init__(node_to=node_to, node_from=node_from, cost=cost)
+        self.resource: Union[int, float] = resource  # Расход ресурса при перемещении по ребру
+
+    def __str__(self) -> str:
+        return f'{super().__str__()} and resource {self.resource}'
+
+
+@dataclass
+class ResourceConstrainedPath:
+    """
+    Найденный путь: вершины по порядку и номера ребер в массиве targets CSR-представления графа.
+    """
+
+    cost: float
+    resource: float
+    vertices: List[int]
+    edges: List[int]
+
+
+class ResourceConstrainedShortestPaths:
+
+    def __init__(self, budget: float, use_bounds: bool = True) -> None:
+        """
+        :param budget: Наибольший допустимый суммарный расход ресурса на пути.
+        :param use_bounds: Использовать ли оценки оставшихся стоимости и расхода ресурса до целевой вершины.
+        Без них метки извлекаются в порядке стоимости, как вершины в алгоритме Дейкстры, и отсекаются
+        только по доминированию и по уже израсходованному ресурсу.
+        """
+
+        if budget < 0:
+            raise ValueError(f'Budget={budget} must be non-negative.')
+
+        self._budget: float = budget
+        self._use_bounds: bool = use_bounds
+        self._labels_count: int = 0
+        self._dominated_count: int = 0
+
+    def process_graph(
+            self,
+            roots: List[GraphNode],
+            source_node: GraphNode,
+            target_node: GraphNode
+    ) -> Optional[List[ResourceGraphEdge]]:
+        """
+        Поиск по узлам, ребра которых являются ResourceGraphEdge. Узлы графа не изменяются.
+        Возвращает ребра оптимального пути по порядку или None, если пути в пределах бюджета нет.
+        """
+
+        graph: CSRGraph = CSRGraph.from_nodes(roots=roots)
+        resources: array = array('d', (edge.resource for node in graph.labels for edge in node.edges))
+        path: Optional[ResourceConstrainedPath] = self.process_csr_graph(
+            graph=graph,
+            resources=resources,
+            source=graph.vertex_id(source_node),
+            target=graph.vertex_id(target_node)
+        )
+
+        if path is None:
+            return None
+
+        # Ребра узла попадают в CSR-представление в исходном порядке, поэтому номер ребра в массиве targets
+        # однозначно определяет объект ребра:
+        return [
+            graph.label(node_from).edges[edge_index - graph.offsets[node_from]]
+            for node_from, edge_index in zip(path.vertices, path.edges)
+        ]
+
+    def process_csr_graph(
+            self,
+            graph: CSRGraph,
+            resources: Sequence[float],
+            source: int,
+            target: int
+    ) -> Optional[ResourceConstrainedPath]:
+        """
+        :param resources: Расходы ресурса ребер в том же порядке, что и массив targets графа.
+        :return: Оптимальный путь или None, если пути в пределах бюджета нет.
+        """
+
+        if len(resources) != graph.edges_count:
+            raise ValueError('There must be exactly one resource per edge.')
+
+        if any(weight < 0 for weight in graph.weights) or any(resource < 0 for resource in resources):
+            raise ValueError('Costs and resources of edges must be non-negative.')
+
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        potentials, min_resources = self._get_bounds(graph=graph, resources=resources, target=target)
+        if min_resources[source] > self._budget:
+            self._labels_count = self._dominated_count = 0
+            return None
+
+        # Метки хранятся в плоских массивах, индексируемых номером метки:
+        label_vertices: array = array('l', [source])
+        label_costs: array = array('d', [0])
+        label_resources: array = array('d', [0])
+        label_parents: array = array('l', [-1])
+        label_edges: array = array('l', [-1])
+
+        # Наименьший расход ресурса среди извлеченных меток каждой вершины:
+        best_resources: array = array('d', [math.inf]) * graph.vertices_count
+        labels_queue: List[Tuple[float, int]] = [(potentials[source], 0)]
+        self._dominated_count = 0
+
+        while labels_queue:
+            _, label = heapq.heappop(labels_queue)
+            node_from: int = label_vertices[label]
+            resource: float = label_resources[label]
+            if resource >= best_resources[node_from]:
+                self._dominated_count += 1
+                continue
+
+            best_resources[node_from] = resource
+            if node_from == target:
+                self._labels_count = len(label_vertices)
+                return self._build_path(
+                    label=label,
+                    label_vertices=label_vertices,
+                    label_costs=label_costs,
+                    label_resources=label_resources,
+                    label_parents=label_parents,
+                    label_edges=label_edges
+                )
+
+            cost: float = label_costs[label]
+            for index in range(offsets[node_from], offsets[node_from + 1]):
+                node_to: int = targets[index]
+                new_resource: float = resource + resources[index]
+                if new_resource + min_resources[node_to] > self._budget or new_resource >= best_resources[node_to]:
+                    continue
+
+                new_cost: float = cost + weights[index]
+                heapq.heappush(labels_queue, (new_cost + potentials[node_to], len(label_vertices)))
+                label_vertices.append(node_to)
+                label_costs.append(new_cost)
+                label_resources.append(new_resource)
+                label_parents.append(label)
+                label_edges.append(index)
+
+        self._labels_count = len(label_vertices)
+        return None
+
+    def _get_bounds(self, graph: CSRGraph, resources: Sequence[float], target: int) -> Tuple[Any, Any]:
+        """
+        Стоимости и наименьшие расходы ресурса кратчайших путей от каждой вершины до целевой.
+        Вершины, из которых целевая недостижима, получают math.inf и отсекаются по бюджету.
+        """
+
+        if not self._use_bounds:
+            zeros: array = array('d', bytes(8 * graph.vertices_count))
+            return zeros, zeros
+
+        dijkstra_algorithm: DijkstraAlgorithm = DijkstraAlgorithm()
+        potentials: array = dijkstra_algorithm.process_csr_graph(graph=graph.reversed(), source=target).distances
+        resources_graph: CSRGraph = CSRGraph(offsets=graph.offsets, targets=graph.targets, weights=resources)
+        min_resources: array = dijkstra_algorithm.process_csr_graph(
+            graph=resources_graph.reversed(),
+            source=target
+        ).distances
+
+        return potentials, min_resources
+
+    @staticmethod
+    def _build_path(
+            label: int,
+            label_vertices: array,
+            label_costs: array,
+            label_resources: array,
+            label_parents: array,
+            label_edges: array
+    ) -> ResourceConstrainedPath:
+        path: ResourceConstrainedPath = ResourceConstrainedPath(
+            cost=label_costs[label],
+            resource=label_resources[label],
+            vertices=[],
+            edges=[]
+        )
+
+        while label != -1:
+            path.vertices.append(label_vertices[label])
+            if label_edges[label] != -1:
+                path.edges.append(label_edges[label])
+
+            label = label_parents[label]
+
+        path.vertices.reverse()
+        path.edges.reverse()
+        return path
+
+    @property
+    def labels_count(self) -> int:
+        """
+        Количество меток, созданных последним поиском.
+        """
+
+        return self._labels_count
+
+    @property
+    def dominated_count(self) -> int:
+        """
+        Количество меток последнего поиска, отброшенных как доминируемые при извлечении из очереди.
+        """
+
+        return self._dominated_count
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    s: GraphNode = GraphNode('s')
+    t: GraphNode = GraphNode('t')
+    y: GraphNode = GraphNode('y')
+    x: GraphNode = GraphNode('x')
+    z: GraphNode = GraphNode('z')
+
+    # Create edges:
+    s.edges = [
+        ResourceGraphEdge(node_from=s, node_to=t, cost=1, resource=10),
+        ResourceGraphEdge(node_from=s, node_to=y, cost=2, resource=3),
+        ResourceGraphEdge(node_from=s, node_to=x, cost=3, resource=1),
+    ]
+
+    t.edges = [
+        ResourceGraphEdge(node_from=t, node_to=z, cost=1, resource=10),
+    ]
+
+    y.edges = [
+        ResourceGraphEdge(node_from=y, node_to=z, cost=2, resource=3),
+    ]
+
+    x.edges = [
+        ResourceGraphEdge(node_from=x, node_to=z, cost=3, resource=1),
+    ]
+
+    for graph_budget in (20, 10, 5, 1):
+        resource_constrained_paths: ResourceConstrainedShortestPaths = ResourceConstrainedShortestPaths(
+            budget=graph_budget
+        )
+        path_edges: Optional[List[ResourceGraphEdge]] = resource_constrained_paths.process_graph(
+            roots=[s, t, y, x, z],
+            source_node=s,
+            target_node=z
+        )
+
+        print(f'\nWay from {s} to {z} with budget {graph_budget}:')
+        if path_edges is None:
+            print(f'There is no path from {s} to {z} within budget.')
+        else:
+            for path_edge in path_edges:
+                print(f'\t{path_edge}')
+
+            print(f'Shortest path costs {sum(path_edge.cost for path_edge in path_edges)}.')
+
+    import itertools
+    import random
+
+    # Сверяем результаты с полным перебором простых путей на случайных графах, с оценками и без:
+    generator: random.Random = random.Random(19)
+    for _ in range(300):
+        vertices_count: int = generator.randint(2, 5)
+        # Ребра CSR-представления упорядочены по вершине-источнику, поэтому так же упорядочиваются и ресурсы:
+        random_edges: List[Tuple[int, int, int, int]] = sorted(
+            [
+                (generator.randrange(vertices_count), generator.randrange(vertices_count),
+                 generator.randint(0, 10), generator.randint(0, 10))
+                for _ in range(generator.randint(0, 2 * vertices_count))
+            ],
+            key=lambda edge: edge[0]
+        )
+        random_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=vertices_count,
+            edges=[(node_from, node_to, cost) for node_from, node_to, cost, _ in random_edges]
+        )
+        random_resources: array = array('d', (resource for _, _, _, resource in random_edges))
+        random_budget: int = generator.randint(0, 25)
+
+        expected_cost: float = math.inf
+        for path_length in range(1, vertices_count):
+            for candidate in itertools.product(random_edges, repeat=path_length):
+                visited: List[int] = [0] + [edge[1] for edge in candidate]
+                if (candidate[0][0] == 0 and candidate[-1][1] == vertices_count - 1 and len(set(visited)) == len(visited)
+                        and all(candidate[position][1] == candidate[position + 1][0]
+                                for position in range(path_length - 1))
+                        and sum(edge[3] for edge in candidate) <= random_budget):
+                    expected_cost = min(expected_cost, sum(edge[2] for edge in candidate))
+
+        for bounds in (True, False):
+            found: Optional[ResourceConstrainedPath] = ResourceConstrainedShortestPaths(
+                budget=random_budget,
+                use_bounds=bounds
+            ).process_csr_graph(graph=random_graph, resources=random_resources, source=0, target=vertices_count - 1)
+
+            if found is None:
+                assert expected_cost == math.inf
+            else:
+                assert found.cost == expected_cost and found.resource <= random_budget
+                assert found.vertices[0] == 0 and found.vertices[-1] == vertices_count - 1
+                assert sum(random_graph.weights[edge_index] for edge_index in found.edges) == found.cost
+
+    print('\nRandom graphs check passed.')
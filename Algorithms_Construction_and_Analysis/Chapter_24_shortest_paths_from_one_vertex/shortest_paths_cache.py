@@ -0,0 +1,233 @@
+"""
+Кэш результатов поиска кратчайших путей из одной вершины.
+
+Результат поиска из каждой исходной вершины (массивы расстояний и родителей, см. ShortestPathsResult) сохраняется
+по ключу (версия графа, исходная вершина), поэтому повторные запросы из популярных вершин не требуют повторного
+поиска и не перезаписывают состояние узлов графа: поиск выполняется по CSR-представлению графа.
+
+1) Версия графа - монотонно возрастающий счетчик. Каждое изменение ребер через методы кэша (update_edge, add_edge,
+   remove_edge) или явный вызов bump_version увеличивает версию, после чего результаты старой версии
+   удаляются из кэша, а CSR-представление графа строится заново при следующем запросе.
+2) Размер кэша ограничен суммарным размером массивов в байтах. При превышении ограничения вытесняются результаты,
+   которые дольше всех не запрашивались (LRU): записи хранятся в OrderedDict в порядке последнего обращения.
+
+Граф для теста совпадает с графом алгоритма Дейкстры (см. Dijkstra_algorithm.py).
+
+Асимптоматическая скорость запроса составляет O(1) при попадании в кэш и совпадает со скоростью алгоритма поиска
+при промахе. Кэш занимает O(S * V) памяти, где S - количество сохраненных исходных вершин,
+а V - количество вершин графа.
+"""
+
+
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsFromOneVertexBaseAlgorithm,
+    ShortestPathsResult
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Dijkstra_algorithm import (
+    DijkstraAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+
+
+class ShortestPathsCache:
+
+    def __init__(
+            self,
+            roots: List[GraphNode],
+            algorithm: Optional[ShortestPathsFromOneVertexBaseAlgorithm] = None,
+            max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        """
+        :param algorithm: Алгоритм, реализующий process_csr_graph. По умолчанию - алгоритм Дейкстры.
+        :param max_bytes: Наибольший суммарный размер массивов расстояний и родителей в кэше.
+        """
+
+        if max_bytes < 0:
+            raise ValueError(f'Max bytes={max_bytes} must be non-negative.')
+
+        self._roots: List[GraphNode] = roots
+        self._algorithm: ShortestPathsFromOneVertexBaseAlgorithm = algorithm or DijkstraAlgorithm()
+        self._max_bytes: int = max_bytes
+
+        self._version: int = 0
+        self._graph: Optional[CSRGraph] = None  # Строится лениво для текущей версии графа
+        self._results: OrderedDict[Tuple[int, int], ShortestPathsResult] = OrderedDict()
+        self._size_bytes: int = 0
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get(self, source_node: GraphNode) -> ShortestPathsResult:
+        """
+        Возвращает результат поиска из исходной вершины. Массивы результата индексируются идентификаторами вершин
+        CSR-представления графа текущей версии (см. graph) и не должны изменяться вызывающим кодом.
+        """
+
+        source: int = self.graph.vertex_id(source_node)
+        key: Tuple[int, int] = (self._version, source)
+        result: Optional[ShortestPathsResult] = self._results.get(key)
+        if result is not None:
+            self._hits += 1
+            self._results.move_to_end(key)
+            return result
+
+        self._misses += 1
+        result = self._algorithm.process_csr_graph(graph=self.graph, source=source)
+        self._put(key=key, result=result)
+        return result
+
+    def distance(self, source_node: GraphNode, target_node: GraphNode) -> float:
+        return self.get(source_node=source_node).distances[self.graph.vertex_id(target_node)]
+
+    def path(self, source_node: GraphNode, target_node: GraphNode) -> List[GraphNode]:
+        """
+        Узлы кратчайшего пути от исходной вершины до конечной. Если пути нет, список пуст.
+        """
+
+        result: ShortestPathsResult = self.get(source_node=source_node)
+        return [self.graph.label(vertex) for vertex in result.path_to(vertex=self.graph.vertex_id(target_node))]
+
+    def _put(self, key: Tuple[int, int], result: ShortestPathsResult) -> None:
+        result_bytes: int = self._get_result_bytes(result=result)
+        if result_bytes > self._max_bytes:
+            # Результат, не помещающийся в кэш целиком, не вытесняет остальные результаты:
+            return
+
+        while self._size_bytes + result_bytes > self._max_bytes:
+            _, evicted_result = self._results.popitem(last=False)
+            self._size_bytes -= self._get_result_bytes(result=evicted_result)
+            self._evictions += 1
+
+        self._results[key] = result
+        self._size_bytes += result_bytes
+
+    @staticmethod
+    def _get_result_bytes(result: ShortestPathsResult) -> int:
+        return (
+                len(result.distances) * result.distances.itemsize +
+                len(result.parents) * result.parents.itemsize
+        )
+
+    def bump_version(self) -> None:
+        """
+        Увеличивает версию графа. Вызывается после любого изменения ребер, выполненного в обход методов кэша.
+        """
+
+        self._version += 1
+        self._graph = None
+        self._results.clear()
+        self._size_bytes = 0
+
+    def update_edge(self, edge: GraphEdge, new_cost: int) -> None:
+        edge.cost = new_cost
+        self.bump_version()
+
+    def add_edge(self, edge: GraphEdge) -> None:
+        edge.node_from.edges.append(edge)
+        self.bump_version()
+
+    def remove_edge(self, edge: GraphEdge) -> None:
+        edge.node_from.edges.remove(edge)
+        self.bump_version()
+
+    @property
+    def graph(self) -> CSRGraph:
+        """
+        CSR-представление графа текущей версии.
+        """
+
+        if self._graph is None:
+            self._graph = CSRGraph.from_nodes(roots=self._roots)
+
+        return self._graph
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    s: GraphNode = GraphNode('s')
+    t: GraphNode = GraphNode('t')
+    y: GraphNode = GraphNode('y')
+    x: GraphNode = GraphNode('x')
+    z: GraphNode = GraphNode('z')
+
+    # Create edges:
+    s.edges = [
+        GraphEdge(node_from=s, node_to=t, cost=10),
+        GraphEdge(node_from=s, node_to=y, cost=5),
+    ]
+
+    t.edges = [
+        GraphEdge(node_from=t, node_to=y, cost=2),
+        GraphEdge(node_from=t, node_to=x, cost=1),
+    ]
+
+    y.edges = [
+        GraphEdge(node_from=y, node_to=t, cost=3),
+        GraphEdge(node_from=y, node_to=z, cost=2),
+        GraphEdge(node_from=y, node_to=x, cost=9),
+    ]
+
+    x.edges = [
+        GraphEdge(node_from=x, node_to=z, cost=4),
+    ]
+
+    z.edges = [
+        GraphEdge(node_from=z, node_to=x, cost=6),
+        GraphEdge(node_from=z, node_to=s, cost=7),
+    ]
+
+    # Результат из одной вершины графа из 5 вершин занимает 80 байт, поэтому в кэш помещаются два результата:
+    shortest_paths_cache: ShortestPathsCache = ShortestPathsCache(roots=[s, t, y, x, z], max_bytes=160)
+    for query_source, query_target in ((s, x), (s, z), (t, z), (s, t), (y, x), (t, s)):
+        print(
+            f'Shortest path from {query_source.value} to {query_target.value} costs '
+            f'{shortest_paths_cache.distance(source_node=query_source, target_node=query_target)}: '
+            f'{" -> ".join(str(node.value) for node in shortest_paths_cache.path(query_source, query_target))}.'
+        )
+
+    shortest_paths_cache.update_edge(edge=s.edges[0], new_cost=1)
+    print(f'\nGraph version {shortest_paths_cache.version}: shortest path from s to x costs '
+          f'{shortest_paths_cache.distance(source_node=s, target_node=x)}.')
+    print(f'{shortest_paths_cache.hits} hits, {shortest_paths_cache.misses} misses, '
+          f'{shortest_paths_cache.evictions} evictions, {shortest_paths_cache.size_bytes} bytes cached.')
+
+    from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.A_star_algorithm import (
+        AStarAlgorithm
+    )
+
+    # Любой алгоритм поиска из одной вершины реализует process_csr_graph, в том числе A* без целевой вершины:
+    a_star_cache: ShortestPathsCache = ShortestPathsCache(roots=[s, t, y, x, z], algorithm=AStarAlgorithm())
+    assert all(
+        a_star_cache.distance(source_node=query_source, target_node=query_target)
+        == shortest_paths_cache.distance(source_node=query_source, target_node=query_target)
+        for query_source in (s, t, y, x, z) for query_target in (s, t, y, x, z)
+    )
+    print('A* cache matches Dijkstra cache.')
@@ -0,0 +1,273 @@
+"""
+Векторизованный алгоритм Беллмана-Форда на массивах NumPy.
+
+Алгоритм повторяет BellmanFordAlgorithm, но ребра графа хранятся не в виде Python-объектов, а в трех массивах:
+вершины-источники src, вершины-приемники dst и стоимости w. Каждый проход по ребрам выполняется
+одной векторной операцией вместо E вызовов процедуры ослабления:
+
+1) candidates = dist[src] + w - оценки путей через каждое ребро;
+2) np.minimum.at(dist, dst, candidates) - каждая вершина получает наименьшую оценку по всем входящим ребрам;
+3) ребра, для которых candidates совпадает с новой оценкой вершины-приемника, а сама оценка уменьшилась,
+   становятся родительскими ребрами этих вершин.
+
+В режиме EARLY_TERMINATION на каждом проходе ослабляются только ребра, исходящие из вершин, чьи оценки
+уменьшились на предыдущем проходе: оценки остальных вершин-приемников через другие ребра измениться не могут.
+Это векторный аналог режима QUEUE, который на графах с положительными весами обрабатывает лишь малую часть ребер.
+
+В отличие от классической реализации, все ребра прохода используют оценки, полученные на предыдущем проходе
+(а не на текущем), поэтому после k проходов найдены все кратчайшие пути не более чем из k ребер. Этого достаточно
+для корректности: если за V - 1 проходов оценки не стабилизировались, то следующий проход найдет ребро,
+которое еще можно ослабить, что означает наличие цикла с отрицательным весом. Проверка выполняется той же
+векторной операцией: np.any(dist[src] + w < dist[dst]).
+
+Граф для теста совпадает с графом алгоритма Беллмана-Форда (см. Bellman_Ford_algorithm.py).
+
+Асимптоматическая скорость алгоритма, как и у классической реализации, составляет O(VE), где V - количество вершин
+графа, а E - количество ребер, однако каждый проход выполняется в скомпилированном коде NumPy, что на порядки
+быстрее интерпретации E вызовов процедуры ослабления.
+"""
+
+
+from array import array
+from typing import Any, Dict, List, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsResult
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Bellman_Ford_algorithm import (
+    BellmanFordAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.modes import BellmanFordMode
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class VectorizedBellmanFordAlgorithm(BellmanFordAlgorithm):
+
+    def __init__(self, mode: BellmanFordMode = BellmanFordMode.CLASSIC, track_parents: bool = True) -> None:
+        """
+        :param mode: CLASSIC или EARLY_TERMINATION. Режим QUEUE обрабатывает вершины по одной и не векторизуется,
+        а режим HOP_LIMITED хранит историю улучшений каждой вершины.
+        """
+
+        if numpy is None:
+            raise ImportError('NumPy is required for vectorized Bellman-Ford algorithm.')
+
+        if mode in (BellmanFordMode.QUEUE, BellmanFordMode.HOP_LIMITED):
+            raise ValueError(f'Mode={mode.value} can not be vectorized.')
+
+        super().__init__(mode=mode, track_parents=track_parents)
+
+    def process_graph(self, roots: List[GraphNode], source_node: GraphNode) -> bool:
+        """
+        Обрабатывает граф аналогично BellmanFordAlgorithm.process_graph: оценки кратчайших путей и родители
+        записываются в узлы. Возвращает True, если найден цикл с отрицательным весом, достижимый из истока.
+        """
+
+        self._roots = roots
+        self._source_node = source_node
+        self._init_single_source()
+        self._get_all_edges()
+
+        node_ids: Dict[GraphNode, int] = {root: node_id for node_id, root in enumerate(roots)}
+        for edge in self._edges:
+            node_ids.setdefault(edge.node_from, len(node_ids))
+            node_ids.setdefault(edge.node_to, len(node_ids))
+
+        sources: Any = numpy.fromiter((node_ids[edge.node_from] for edge in self._edges), dtype=numpy.int64)
+        targets: Any = numpy.fromiter((node_ids[edge.node_to] for edge in self._edges), dtype=numpy.int64)
+        weights: Any = numpy.fromiter((edge.cost for edge in self._edges), dtype=numpy.float64)
+
+        distances, parent_edges, negative_cycle = self._process_edge_arrays(
+            vertices_count=len(node_ids),
+            source=node_ids[source_node],
+            sources=sources,
+            targets=targets,
+            weights=weights
+        )
+
+        for node, node_id in node_ids.items():
+            estimate: float = distances[node_id].item()
+            node.shortest_path_estimate = int(estimate) if estimate.is_integer() else estimate
+            if self._track_parents and parent_edges[node_id] != -1:
+                node.parent_edge = self._edges[parent_edges[node_id]]
+                node.parent = node.parent_edge.node_from
+
+        return negative_cycle
+
+    def process_csr_graph(self, graph: CSRGraph, source: int) -> ShortestPathsResult:
+        offsets: Any = numpy.asarray(graph.offsets, dtype=numpy.int64)
+        sources: Any = numpy.repeat(numpy.arange(graph.vertices_count, dtype=numpy.int64), numpy.diff(offsets))
+        targets: Any = numpy.asarray(graph.targets, dtype=numpy.int64)
+
+        distances, parent_edges, negative_cycle = self._process_edge_arrays(
+            vertices_count=graph.vertices_count,
+            source=source,
+            sources=sources,
+            targets=targets,
+            weights=numpy.asarray(graph.weights, dtype=numpy.float64)
+        )
+
+        parents: Any = numpy.full(graph.vertices_count, -1, dtype=numpy.int64)
+        has_parent: Any = parent_edges != -1
+        parents[has_parent] = sources[parent_edges[has_parent]]
+        return ShortestPathsResult(
+            source=source,
+            distances=array('d', distances.tobytes()),
+            parents=array('l', parents.tobytes()),
+            negative_cycle=negative_cycle
+        )
+
+    def _process_edge_arrays(
+            self,
+            vertices_count: int,
+            source: int,
+            sources: Any,
+            targets: Any,
+            weights: Any
+    ) -> Tuple[Any, Any, bool]:
+        """
+        :return: Массив оценок кратчайших путей, массив номеров родительских ребер (-1, если родителя нет)
+        и признак наличия цикла с отрицательным весом, достижимого из истока.
+        """
+
+        # Ребра упорядочиваются по вершине-источнику, как в CSR-представлении графа:
+        # ребра вершины v занимают позиции [offsets[v], offsets[v + 1]), а edge_order хранит их исходные номера.
+        edge_order: Any = numpy.argsort(sources, kind='stable')
+        sources, targets, weights = sources[edge_order], targets[edge_order], weights[edge_order]
+        offsets: Any = numpy.zeros(vertices_count + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.bincount(sources, minlength=vertices_count), out=offsets[1:])
+
+        distances: Any = numpy.full(vertices_count, numpy.inf)
+        distances[source] = 0
+        parent_edges: Any = numpy.full(vertices_count, -1, dtype=numpy.int64)
+        active_nodes: Any = numpy.array([source], dtype=numpy.int64)
+
+        # Последний, V-й проход проверяет наличие цикла с отрицательным весом:
+        for pass_index in range(vertices_count):
+            if self._mode == BellmanFordMode.EARLY_TERMINATION:
+                positions, edge_sources = self._get_outgoing_edges(offsets=offsets, nodes=active_nodes)
+            else:
+                positions, edge_sources = slice(None), sources
+
+            edge_targets: Any = targets[positions]
+            candidates: Any = distances[edge_sources] + weights[positions]
+            if pass_index == vertices_count - 1:
+                return distances, parent_edges, bool(numpy.any(candidates < distances[edge_targets]))
+
+            new_distances: Any = distances.copy()
+            numpy.minimum.at(new_distances, edge_targets, candidates)
+
+            improved: Any = new_distances < distances
+            active_nodes = numpy.flatnonzero(improved)
+            if len(active_nodes) == 0 and self._mode == BellmanFordMode.EARLY_TERMINATION:
+                break
+
+            if self._track_parents and len(active_nodes) > 0:
+                # Родительским становится ребро, на котором достигается новая оценка улучшенной вершины.
+                # Если таких ребер несколько, выбирается любое из них:
+                parent_mask: Any = improved[edge_targets] & (candidates == new_distances[edge_targets])
+                parent_edges[edge_targets[parent_mask]] = edge_order[positions][parent_mask]
+
+            distances = new_distances
+
+        return distances, parent_edges, False
+
+    @staticmethod
+    def _get_outgoing_edges(offsets: Any, nodes: Any) -> Tuple[Any, Any]:
+        """
+        Позиции всех ребер, исходящих из указанных вершин, одним массивом и вершины-источники этих ребер.
+        """
+
+        starts: Any = offsets[nodes]
+        counts: Any = offsets[nodes + 1] - starts
+        positions: Any = numpy.repeat(starts - numpy.cumsum(counts) + counts, counts) + numpy.arange(counts.sum())
+        return positions, numpy.repeat(nodes, counts)
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    s: GraphNode = GraphNode('s')
+    t: GraphNode = GraphNode('t')
+    y: GraphNode = GraphNode('y')
+    x: GraphNode = GraphNode('x')
+    z: GraphNode = GraphNode('z')
+
+    # Create edges:
+    s.edges = [
+        GraphEdge(node_from=s, node_to=t, cost=6),
+        GraphEdge(node_from=s, node_to=y, cost=7),
+    ]
+
+    t.edges = [
+        GraphEdge(node_from=t, node_to=z, cost=-4),
+        GraphEdge(node_from=t, node_to=x, cost=5),
+        GraphEdge(node_from=t, node_to=y, cost=8),
+    ]
+
+    y.edges = [
+        GraphEdge(node_from=y, node_to=z, cost=9),
+        GraphEdge(node_from=y, node_to=x, cost=-3),
+    ]
+
+    x.edges = [
+        GraphEdge(node_from=x, node_to=t, cost=-2),
+    ]
+
+    z.edges = [
+        GraphEdge(node_from=z, node_to=x, cost=7),
+        GraphEdge(node_from=z, node_to=s, cost=2),
+    ]
+
+    bellman_ford_algorithm: VectorizedBellmanFordAlgorithm = VectorizedBellmanFordAlgorithm(
+        mode=BellmanFordMode.EARLY_TERMINATION
+    )
+    circle: bool = bellman_ford_algorithm.process_graph(
+        source_node=s,
+        roots=[s, t, y, x, z]
+    )
+
+    if not circle:
+        bellman_ford_algorithm.print_shortest_path(node_to=x)
+        bellman_ford_algorithm.print_shortest_path(node_to=t)
+        bellman_ford_algorithm.print_shortest_path(node_to=z)
+    else:
+        print(f'There is no shortest path source node to any other node due to negative weighted cycle')
+
+    import random
+
+    # Сверяем результаты с классической реализацией на случайных графах, в том числе с отрицательными циклами:
+    generator: random.Random = random.Random(14)
+    for _ in range(300):
+        vertices_count: int = generator.randint(1, 20)
+        random_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=vertices_count,
+            edges=[
+                (generator.randrange(vertices_count), generator.randrange(vertices_count), generator.randint(-3, 10))
+                for _ in range(generator.randint(0, 3 * vertices_count))
+            ]
+        )
+
+        for graph_mode in (BellmanFordMode.CLASSIC, BellmanFordMode.EARLY_TERMINATION):
+            expected: ShortestPathsResult = BellmanFordAlgorithm(mode=graph_mode).process_csr_graph(
+                graph=random_graph,
+                source=0
+            )
+            result: ShortestPathsResult = VectorizedBellmanFordAlgorithm(mode=graph_mode).process_csr_graph(
+                graph=random_graph,
+                source=0
+            )
+
+            assert result.negative_cycle == expected.negative_cycle
+            if not result.negative_cycle:
+                assert list(result.distances) == list(expected.distances)
+                for vertex in range(vertices_count):
+                    if vertex != 0 and result.distances[vertex] != numpy.inf:
+                        assert result.path_to(vertex)[0] == 0
+
+    print('\nRandom graphs check passed.')
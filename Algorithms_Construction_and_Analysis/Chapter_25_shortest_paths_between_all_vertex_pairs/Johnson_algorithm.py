@@ -0,0 +1,245 @@
+"""
+Алгоритм Джонсона решает задачу поиска кратчайших путей между всеми парами вершин разреженного
+взвешенного ориентированного графа, веса ребер которого могут быть отрицательными.
+
+1) К графу добавляется фиктивная вершина q, из которой в каждую вершину графа ведет ребро нулевой стоимости.
+2) Алгоритм Беллмана-Форда из вершины q вычисляет потенциалы h(v) = d(q, v). Если при этом найден цикл
+   с отрицательным весом, кратчайших путей не существует.
+3) Каждое ребро (u, v) перевзвешивается: w'(u, v) = w(u, v) + h(u) - h(v). По неравенству треугольника
+   новые веса неотрицательны, а кратчайшие пути остаются кратчайшими, так как стоимость любого пути от u до v
+   изменяется на одну и ту же величину h(u) - h(v).
+4) Алгоритм Дейкстры запускается из каждой вершины графа по перевзвешенным ребрам (при необходимости - в пуле
+   процессов, см. batch_shortest_paths.py), а найденные расстояния возвращаются к исходным весам:
+   d(u, v) = d'(u, v) - h(u) + h(v).
+
+Все вычисления выполняются по графу в CSR-представлении. Результат - плоская матрица расстояний V x V
+в массиве array('d') (8 байт на пару вершин), которую можно без копирования представить в виде массива NumPy.
+Пути до вершин не сохраняются.
+
+Граф для теста будет следующим (ориентированный взвешенный, с отрицательными ребрами),
+где символ "*" является частью ребра от вершины к вершине, "←" - направление графа,
+а цифры - стоимость перемещения по ребру между узлами:
+
+  * * * * * * * * * 8 * * * * * * * *
+  *                                   ↓
+  A * * * 3 * * * → B ← * * 4 * * * * C
+  * ↖             ↙ *                ↗
+  *    2       7    *             *
+ -4      ↖   ↙      1          -5
+  *        ↙        *        *
+  ↓      ↙   ↖      ↓     *
+  E * * * 6 * * * → D *
+
+Асимптоматическая скорость алгоритма составляет O(VE + V (V + E) log(V)), где V - количество вершин графа,
+а E - количество ребер. Для разреженных графов это быстрее, чем O(V^3) алгоритма Флойда-Уоршелла.
+"""
+
+
+from __future__ import annotations
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from Algorithms_Construction_and_Analysis.Chapter_22_elementary_algorithms_with_graphs.csr_graph import CSRGraph
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.base_algorithm import (
+    ShortestPathsResult
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.batch_shortest_paths import (
+    BatchShortestPaths
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.Bellman_Ford_algorithm import (
+    BellmanFordAlgorithm
+)
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.modes import BellmanFordMode
+from Algorithms_Construction_and_Analysis.Chapter_24_shortest_paths_from_one_vertex.node import GraphNode, GraphEdge
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@dataclass
+class AllPairsShortestPathsResult:
+    """
+    Матрица кратчайших расстояний, хранящаяся построчно в плоском массиве:
+    расстояние от вершины u до вершины v находится по индексу u * V + v.
+    """
+
+    vertices_count: int
+    distances: array  # math.inf, если пути между вершинами нет
+    negative_cycle: bool = False
+
+    def distance(self, node_from: int, node_to: int) -> float:
+        return self.distances[node_from * self.vertices_count + node_to]
+
+    def row(self, node_from: int) -> memoryview:
+        """
+        Расстояния от указанной вершины до всех вершин графа без копирования.
+        """
+
+        return memoryview(self.distances)[node_from * self.vertices_count:(node_from + 1) * self.vertices_count]
+
+    def to_numpy(self) -> Any:
+        """
+        Представляет матрицу в виде массива NumPy формы (V, V), разделяющего память с массивом distances.
+        """
+
+        if numpy is None:
+            raise ImportError('NumPy is required to convert distances matrix to NumPy array.')
+
+        return numpy.frombuffer(self.distances, dtype=numpy.float64).reshape(self.vertices_count, self.vertices_count)
+
+
+class JohnsonAlgorithm:
+
+    def __init__(self, max_workers: Optional[int] = 1) -> None:
+        """
+        :param max_workers: Количество процессов, между которыми распределяются запуски алгоритма Дейкстры.
+        None - количество ядер процессора (см. BatchShortestPaths).
+        """
+
+        self._batch_shortest_paths: BatchShortestPaths = BatchShortestPaths(max_workers=max_workers)
+
+    def process_csr_graph(self, graph: CSRGraph) -> AllPairsShortestPathsResult:
+        vertices_count: int = graph.vertices_count
+        potentials: Optional[array] = self._get_potentials(graph=graph)
+        if potentials is None:
+            return AllPairsShortestPathsResult(vertices_count=vertices_count, distances=array('d'), negative_cycle=True)
+
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        reweighted_weights: array = array('d', bytes(8 * graph.edges_count))
+        for node_from in range(vertices_count):
+            for index in range(offsets[node_from], offsets[node_from + 1]):
+                # Погрешность вычислений с плавающей точкой не должна давать отрицательных весов:
+                reweighted_weights[index] = max(
+                    0.0,
+                    weights[index] + potentials[node_from] - potentials[targets[index]]
+                )
+
+        reweighted_graph: CSRGraph = CSRGraph(offsets=offsets, targets=targets, weights=reweighted_weights)
+        reweighted_distances: Dict[int, array] = self._batch_shortest_paths.process_csr_graph(
+            graph=reweighted_graph,
+            sources=range(vertices_count)
+        )
+
+        distances: array = array('d', bytes(8 * vertices_count * vertices_count))
+        for node_from in range(vertices_count):
+            # Строки освобождаются по мере переноса в матрицу, чтобы не хранить две копии расстояний:
+            row: array = reweighted_distances.pop(node_from)
+            row_offset: int = node_from * vertices_count
+            for node_to in range(vertices_count):
+                distance: float = row[node_to]
+                if distance != math.inf:
+                    distance += potentials[node_to] - potentials[node_from]
+
+                distances[row_offset + node_to] = distance
+
+        return AllPairsShortestPathsResult(vertices_count=vertices_count, distances=distances)
+
+    @staticmethod
+    def _get_potentials(graph: CSRGraph) -> Optional[array]:
+        """
+        Запускает алгоритм Беллмана-Форда из фиктивной вершины с идентификатором V.
+        Ребра фиктивной вершины дописываются в конец копий массивов графа, поэтому ребра не нужно сортировать заново.
+        Возвращает None, если в графе есть цикл с отрицательным весом.
+        """
+
+        vertices_count: int = graph.vertices_count
+        offsets: array = array('l', graph.offsets)
+        offsets.append(graph.edges_count + vertices_count)
+        targets: array = array('l', graph.targets)
+        targets.extend(range(vertices_count))
+        weights: array = array('d', graph.weights)
+        weights.extend(array('d', bytes(8 * vertices_count)))
+
+        augmented_graph: CSRGraph = CSRGraph(offsets=offsets, targets=targets, weights=weights)
+        result: ShortestPathsResult = BellmanFordAlgorithm(mode=BellmanFordMode.QUEUE).process_csr_graph(
+            graph=augmented_graph,
+            source=vertices_count
+        )
+
+        if result.negative_cycle:
+            return None
+
+        return result.distances[:vertices_count]
+
+    def process_graph(self, roots: List[GraphNode]) -> Tuple[CSRGraph, AllPairsShortestPathsResult]:
+        """
+        Аналог process_csr_graph для узлов графа. Узлы не изменяются.
+
+        :return: CSR-представление графа, по которому матрица индексируется идентификаторами вершин
+        (см. CSRGraph.vertex_id), и матрица кратчайших расстояний.
+        """
+
+        graph: CSRGraph = CSRGraph.from_nodes(roots=roots)
+        return graph, self.process_csr_graph(graph=graph)
+
+
+if __name__ == '__main__':
+    # Create nodes:
+    a: GraphNode = GraphNode('a')
+    b: GraphNode = GraphNode('b')
+    c: GraphNode = GraphNode('c')
+    d: GraphNode = GraphNode('d')
+    e: GraphNode = GraphNode('e')
+
+    # Create edges:
+    a.edges = [
+        GraphEdge(node_from=a, node_to=b, cost=3),
+        GraphEdge(node_from=a, node_to=c, cost=8),
+        GraphEdge(node_from=a, node_to=e, cost=-4),
+    ]
+
+    b.edges = [
+        GraphEdge(node_from=b, node_to=d, cost=1),
+        GraphEdge(node_from=b, node_to=e, cost=7),
+    ]
+
+    c.edges = [
+        GraphEdge(node_from=c, node_to=b, cost=4),
+    ]
+
+    d.edges = [
+        GraphEdge(node_from=d, node_to=a, cost=2),
+        GraphEdge(node_from=d, node_to=c, cost=-5),
+    ]
+
+    e.edges = [
+        GraphEdge(node_from=e, node_to=d, cost=6),
+    ]
+
+    johnson_algorithm: JohnsonAlgorithm = JohnsonAlgorithm()
+    csr_graph, result = johnson_algorithm.process_graph(roots=[a, b, c, d, e])
+    for vertex_from in range(csr_graph.vertices_count):
+        print(
+            f'Shortest paths from {csr_graph.label(vertex_from).value}:',
+            ', '.join(
+                f'{csr_graph.label(vertex_to).value}={result.distance(node_from=vertex_from, node_to=vertex_to)}'
+                for vertex_to in range(csr_graph.vertices_count)
+            )
+        )
+
+    import random
+
+    # Сверяем матрицу с запусками алгоритма Беллмана-Форда из каждой вершины на случайных графах:
+    generator: random.Random = random.Random(11)
+    for _ in range(50):
+        vertices: int = generator.randint(1, 30)
+        potential: List[int] = [generator.randint(0, 20) for _ in range(vertices)]
+        random_graph: CSRGraph = CSRGraph.from_edge_list(
+            vertices_count=vertices,
+            edges=[
+                # Отрицательные ребра без отрицательных циклов получаются сдвигом неотрицательных весов на потенциалы:
+                (u, v, generator.randint(0, 10) + potential[v] - potential[u])
+                for u, v in ((generator.randrange(vertices), generator.randrange(vertices)) for _ in range(3 * vertices))
+            ]
+        )
+
+        matrix: AllPairsShortestPathsResult = JohnsonAlgorithm(max_workers=2).process_csr_graph(graph=random_graph)
+        for vertex_from in range(vertices):
+            expected: array = BellmanFordAlgorithm().process_csr_graph(graph=random_graph, source=vertex_from).distances
+            assert list(matrix.row(vertex_from)) == list(expected), (vertex_from, list(matrix.row(vertex_from)))
+
+    print('Random graphs check passed.')
@@ -0,0 +1,105 @@
+"""
+Циклическая очередь с приоритетами на корзинах (очередь Дайала, Dial's algorithm).
+
+Подходит для монотонных очередей с целочисленными приоритетами, например, для алгоритма Дейкстры на графе
+с целыми весами ребер от 0 до C. В такой очереди все находящиеся в ней приоритеты лежат в диапазоне
+[d, d + C], где d - приоритет последнего извлеченного ключа. Поэтому достаточно C + 1 корзины: ключ с приоритетом p
+хранится в корзине с индексом p mod (C + 1), а минимальный ключ находится последовательным просмотром корзин,
+начиная с корзины последнего извлеченного ключа. Курсор просмотра за все время работы обходит каждую корзину
+не более (D / (C + 1) + 1) раз, где D - наибольший извлеченный приоритет.
+
+Асимптоматическая скорость операций:
+1) push и decrease_key - O(1);
+2) pop_min - амортизированно O(1) плюс суммарно O(D) на движение курсора за все время работы.
+Для алгоритма Дейкстры это дает время O(E + V * C) вместо O((V + E) log(V)) у бинарной пирамиды.
+"""
+
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+
+class BucketQueue:
+
+    def __init__(self, max_cost: int) -> None:
+        """
+        :param max_cost: Наибольший вес ребра C, то есть наибольшая разность между приоритетами ключей в очереди.
+        """
+
+        if max_cost < 0:
+            raise ValueError('Max cost can not be less than zero.')
+
+        self._buckets: List[Set[Hashable]] = [set() for _ in range(max_cost + 1)]
+        self._priorities: Dict[Hashable, int] = {}
+        self._cursor: int = 0  # Приоритет, с которого начинается поиск минимального ключа
+
+    def push(self, key: Hashable, priority: int) -> None:
+        if key in self._priorities:
+            raise KeyError(f'Key={key} is already in queue.')
+
+        self._check_priority(priority=priority)
+        self._priorities[key] = priority
+        self._buckets[self._get_bucket_index(priority=priority)].add(key)
+
+    def pop_min(self) -> Tuple[Hashable, int]:
+        if not self._priorities:
+            raise IndexError('Queue is empty.')
+
+        bucket: Set[Hashable] = self._buckets[self._cursor % len(self._buckets)]
+        while not bucket:
+            self._cursor += 1
+            bucket = self._buckets[self._cursor % len(self._buckets)]
+
+        key: Hashable = bucket.pop()
+        return key, self._priorities.pop(key)
+
+    def decrease_key(self, key: Hashable, priority: int) -> None:
+        old_priority: int = self._priorities[key]
+        if priority > old_priority:
+            raise ValueError(f'New priority={priority} is greater than current priority={old_priority}.')
+
+        self._check_priority(priority=priority)
+        self._buckets[self._get_bucket_index(priority=old_priority)].discard(key)
+        self._buckets[self._get_bucket_index(priority=priority)].add(key)
+        self._priorities[key] = priority
+
+    def push_or_decrease_key(self, key: Hashable, priority: int) -> None:
+        if key in self._priorities:
+            self.decrease_key(key=key, priority=priority)
+        else:
+            self.push(key=key, priority=priority)
+
+    def _get_bucket_index(self, priority: int) -> int:
+        # Целые приоритеты могут быть переданы как float (например, из массива весов CSR-графа):
+        return int(priority) % len(self._buckets)
+
+    def _check_priority(self, priority: int) -> None:
+        if priority % 1:
+            raise ValueError(f'Priority={priority} is not an integer.')
+
+        if not self._cursor <= priority < self._cursor + len(self._buckets):
+            raise ValueError(
+                f'Priority={priority} is out of range [{self._cursor}, {self._cursor + len(self._buckets) - 1}].'
+            )
+
+    def is_empty(self) -> bool:
+        return not self._priorities
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._priorities
+
+    def __len__(self) -> int:
+        return len(self._priorities)
+
+
+if __name__ == '__main__':
+    queue: BucketQueue = BucketQueue(max_cost=10)
+    queue.push(key='third', priority=7)
+    queue.push(key='first', priority=0)
+    queue.push(key='second', priority=3)
+    print(queue.pop_min())
+
+    queue.push(key='fourth', priority=10)
+    queue.decrease_key(key='third', priority=2)
+    queue.push_or_decrease_key(key='fifth', priority=9)
+
+    while not queue.is_empty():
+        print(queue.pop_min())
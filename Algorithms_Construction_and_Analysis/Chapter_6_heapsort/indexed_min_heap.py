@@ -0,0 +1,177 @@
+"""
+Адресуемая (индексированная) неубывающая пирамида.
+
+В отличие от HeapPriorityQueue, где для изменения приоритета задачи необходимо знать ее индекс в массиве пирамиды,
+данная пирамида хранит отображение ключа задачи на ее текущую позицию в массиве. Благодаря этому операция
+DECREASE-KEY не требует поиска задачи в пирамиде и выполняется за время O(log(n)).
+
+Ключом может быть любой хешируемый объект, например, вершина графа или ее целочисленный идентификатор.
+Каждый ключ может находиться в пирамиде не более одного раза.
+
+Асимптоматическая скорость операций:
+1) push - O(log(n));
+2) pop_min - O(log(n));
+3) decrease_key - O(log(n));
+4) проверка наличия ключа и получение его приоритета - O(1).
+"""
+
+from typing import Any, Dict, Hashable, List, Tuple, Union
+
+
+class IndexedMinHeap:
+
+    def __init__(self) -> None:
+        self._keys: List[Hashable] = []
+        self._priorities: List[Union[int, float]] = []
+        self._positions: Dict[Hashable, int] = {}
+
+    def push(self, key: Hashable, priority: Union[int, float]) -> None:
+        if key in self._positions:
+            raise KeyError(f'Key={key} is already in heap.')
+
+        self._keys.append(key)
+        self._priorities.append(priority)
+        self._positions[key] = len(self._keys) - 1
+        self._sift_up(index=len(self._keys) - 1)
+
+    def pop_min(self) -> Tuple[Hashable, Union[int, float]]:
+        """
+        1) Запоминаем первую задачу (с наименьшим приоритетом согласно пирамиде).
+        2) Переносим последнюю задачу на место первой и удаляем последнюю.
+        3) Просеиваем новую первую задачу вниз, чтобы восстановить свойство неубывающей пирамиды.
+        """
+
+        if not self._keys:
+            raise IndexError('Heap is empty.')
+
+        key: Hashable = self._keys[0]
+        priority: Union[int, float] = self._priorities[0]
+
+        last_key: Hashable = self._keys.pop()
+        last_priority: Union[int, float] = self._priorities.pop()
+        del self._positions[key]
+
+        if self._keys:
+            self._keys[0] = last_key
+            self._priorities[0] = last_priority
+            self._positions[last_key] = 0
+            self._sift_down(index=0)
+
+        return key, priority
+
+    def decrease_key(self, key: Hashable, priority: Union[int, float]) -> None:
+        index: int = self._positions[key]
+        if priority > self._priorities[index]:
+            raise ValueError(f'New priority={priority} is greater than current priority={self._priorities[index]}.')
+
+        self._priorities[index] = priority
+        self._sift_up(index=index)
+
+    def change_priority(self, key: Hashable, priority: Union[int, float]) -> None:
+        """
+        Изменяет приоритет ключа в любую сторону, просеивая задачу вверх или вниз по пирамиде.
+        """
+
+        index: int = self._positions[key]
+        old_priority: Union[int, float] = self._priorities[index]
+        self._priorities[index] = priority
+        if priority < old_priority:
+            self._sift_up(index=index)
+        else:
+            self._sift_down(index=index)
+
+    def push_or_decrease_key(self, key: Hashable, priority: Union[int, float]) -> None:
+        """
+        Добавляет ключ в пирамиду или уменьшает его приоритет, если ключ уже находится в пирамиде.
+        Именно эта операция выполняется при каждом успешном ослаблении ребра в алгоритме Дейкстры.
+        """
+
+        if key in self._positions:
+            self.decrease_key(key=key, priority=priority)
+        else:
+            self.push(key=key, priority=priority)
+
+    def peek_min(self) -> Tuple[Hashable, Union[int, float]]:
+        if not self._keys:
+            raise IndexError('Heap is empty.')
+
+        return self._keys[0], self._priorities[0]
+
+    def priority(self, key: Hashable) -> Union[int, float]:
+        return self._priorities[self._positions[key]]
+
+    def _sift_up(self, index: int) -> None:
+        """
+        Поднимает задачу вверх по пирамиде, пока ее родитель имеет больший приоритет.
+        Вместо попарных обменов задача запоминается и сдвигаются только родители, что вдвое сокращает
+        количество записей в массивы.
+        """
+
+        key: Hashable = self._keys[index]
+        priority: Union[int, float] = self._priorities[index]
+
+        while index > 0:
+            parent: int = (index - 1) >> 1
+            if self._priorities[parent] <= priority:
+                break
+
+            self._move(index_from=parent, index_to=index)
+            index = parent
+
+        self._place(index=index, key=key, priority=priority)
+
+    def _sift_down(self, index: int) -> None:
+        key: Hashable = self._keys[index]
+        priority: Union[int, float] = self._priorities[index]
+        size: int = len(self._keys)
+
+        while True:
+            child: int = 2 * index + 1
+            if child >= size:
+                break
+
+            # Выбираем меньшего из двух потомков:
+            if child + 1 < size and self._priorities[child + 1] < self._priorities[child]:
+                child += 1
+
+            if self._priorities[child] >= priority:
+                break
+
+            self._move(index_from=child, index_to=index)
+            index = child
+
+        self._place(index=index, key=key, priority=priority)
+
+    def _move(self, index_from: int, index_to: int) -> None:
+        self._place(index=index_to, key=self._keys[index_from], priority=self._priorities[index_from])
+
+    def _place(self, index: int, key: Hashable, priority: Union[int, float]) -> None:
+        self._keys[index] = key
+        self._priorities[index] = priority
+        self._positions[key] = index
+
+    def is_empty(self) -> bool:
+        return not self._keys
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._positions
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+if __name__ == '__main__':
+    heap: IndexedMinHeap = IndexedMinHeap()
+    heap.push(key='fourth', priority=10)
+    heap.push(key='first', priority=40)
+    heap.push(key='third', priority=20)
+    heap.push(key='second', priority=30)
+    heap.push(key='sixth', priority=1)
+    heap.push(key='fifth', priority=5)
+
+    heap.decrease_key(key='first', priority=0)
+    heap.push_or_decrease_key(key='second', priority=3)
+    heap.push_or_decrease_key(key='seventh', priority=50)
+
+    while not heap.is_empty():
+        print(heap.pop_min())
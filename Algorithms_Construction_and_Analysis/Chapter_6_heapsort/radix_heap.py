@@ -0,0 +1,107 @@
+"""
+Поразрядная пирамида (radix heap).
+
+Как и очередь Дайала (см. bucket_queue.py), предназначена для монотонных очередей с неотрицательными целочисленными
+приоритетами: приоритет любого добавляемого ключа не меньше приоритета last последнего извлеченного ключа.
+В отличие от очереди Дайала, количество корзин не зависит от наибольшего веса ребра C, поэтому пирамида подходит
+для графов с большим диапазоном весов.
+
+Ключ с приоритетом p хранится в корзине с номером, равным количеству значащих бит в (p XOR last):
+в корзине 0 лежат ключи с приоритетом last, в корзине i - ключи, приоритет которых совпадает с last во всех битах,
+старше (i - 1)-го, и отличается в (i - 1)-м бите. Если корзина 0 пуста, то находится первая непустая корзина,
+в ней выбирается минимальный приоритет, который становится новым last, и все ключи корзины перераспределяются
+по корзинам с меньшими номерами. Поскольку номер корзины ключа только уменьшается, каждый ключ перераспределяется
+не более B раз, где B - разрядность приоритетов.
+
+Асимптоматическая скорость операций:
+1) push и decrease_key - O(1);
+2) pop_min - амортизированно O(B).
+Для алгоритма Дейкстры это дает время O(E + V * log(C)).
+"""
+
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class RadixHeap:
+
+    def __init__(self, bits: int = 64) -> None:
+        self._buckets: List[Dict[Hashable, int]] = [{} for _ in range(bits + 1)]
+        self._bucket_indexes: Dict[Hashable, int] = {}
+        self._last: int = 0  # Приоритет последнего извлеченного ключа
+
+    def push(self, key: Hashable, priority: int) -> None:
+        if key in self._bucket_indexes:
+            raise KeyError(f'Key={key} is already in heap.')
+
+        self._place(key=key, priority=priority)
+
+    def pop_min(self) -> Tuple[Hashable, int]:
+        if not self._bucket_indexes:
+            raise IndexError('Heap is empty.')
+
+        if not self._buckets[0]:
+            bucket_index: int = 1
+            while not self._buckets[bucket_index]:
+                bucket_index += 1
+
+            bucket: Dict[Hashable, int] = self._buckets[bucket_index]
+            self._buckets[bucket_index] = {}
+            self._last = min(bucket.values())
+            for key, priority in bucket.items():
+                self._place(key=key, priority=priority)
+
+        key, priority = self._buckets[0].popitem()
+        del self._bucket_indexes[key]
+        return key, priority
+
+    def decrease_key(self, key: Hashable, priority: int) -> None:
+        bucket_index: int = self._bucket_indexes[key]
+        old_priority: int = self._buckets[bucket_index][key]
+        if priority > old_priority:
+            raise ValueError(f'New priority={priority} is greater than current priority={old_priority}.')
+
+        del self._buckets[bucket_index][key]
+        self._place(key=key, priority=priority)
+
+    def push_or_decrease_key(self, key: Hashable, priority: int) -> None:
+        if key in self._bucket_indexes:
+            self.decrease_key(key=key, priority=priority)
+        else:
+            self.push(key=key, priority=priority)
+
+    def _place(self, key: Hashable, priority: int) -> None:
+        if priority % 1:
+            raise ValueError(f'Priority={priority} is not an integer.')
+
+        if priority < self._last:
+            raise ValueError(f'Priority={priority} is less than last extracted priority={self._last}.')
+
+        # Целые приоритеты могут быть переданы как float (например, из массива весов CSR-графа) и хранятся как есть,
+        # а в целое число переводятся только для вычисления номера корзины:
+        bucket_index: int = (int(priority) ^ int(self._last)).bit_length()
+        self._buckets[bucket_index][key] = priority
+        self._bucket_indexes[key] = bucket_index
+
+    def is_empty(self) -> bool:
+        return not self._bucket_indexes
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._bucket_indexes
+
+    def __len__(self) -> int:
+        return len(self._bucket_indexes)
+
+
+if __name__ == '__main__':
+    heap: RadixHeap = RadixHeap()
+    heap.push(key='third', priority=700)
+    heap.push(key='first', priority=0)
+    heap.push(key='second', priority=300)
+    print(heap.pop_min())
+
+    heap.push(key='fourth', priority=100_000)
+    heap.decrease_key(key='third', priority=200)
+    heap.push_or_decrease_key(key='fifth', priority=5_000)
+
+    while not heap.is_empty():
+        print(heap.pop_min())